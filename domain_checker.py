@@ -9,17 +9,72 @@ ENHANCED VERSION: Added advanced vacation rental business classification
 import requests
 import csv
 import json
+import copy
 import time
 import os
 from datetime import datetime
 from urllib.parse import urlparse
 from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import re
 import logging
+import sys
 import urllib3
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
 import threading
+import multiprocessing
 from pathlib import Path
+from collections import OrderedDict, Counter, deque, namedtuple
+from functools import lru_cache
+from operator import itemgetter
+from io import BytesIO
+from itertools import compress, islice, repeat
+from types import MappingProxyType
+from array import array
+from enum import IntEnum
+import asyncio
+import socket
+import ssl
+import mmap
+import struct
+import hashlib
+import math
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from lxml import etree as lxml_etree, html as lxml_html
+except ImportError:
+    lxml_html = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import tldextract
+except ImportError:
+    tldextract = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Suppress SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -28,12 +83,2143 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+
+class FetchedPage:
+    """Fetched page (aiohttp, or a capped requests body), exposing the requests.Response attributes the analyzers use"""
+    def __init__(self, url, status_code, headers=None, content=b'', history=()):
+        self.url = url
+        self.status_code = status_code
+        # Plain case-insensitive copy - aiohttp's header proxy can't be pickled to worker processes
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.content = content
+        self.history = list(history)
+
+
+CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+# BeautifulSoup tree builder - lxml's C parser when installed, the pure-Python one otherwise
+SOUP_PARSER = 'lxml' if lxml_html is not None else 'html.parser'
+
+
+def compile_keywords(keywords):
+    """Compile keywords into a single alternation regex (longest first) for one-pass presence checks"""
+    keywords = sorted(set(keywords), key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, keywords))) if keywords else None
+
+
+def matched_keywords(keywords, keyword_counts):
+    """Keywords of a list present in a KeywordMatcher.counts() result, filtered in C"""
+    return list(compress(keywords, map(keyword_counts.__contains__, keywords)))
+
+
+def keyword_weight_table(tables, scoring):
+    """keyword -> ((score, weight), ...) for each (score, table, field, weight tiers, default weight) entry of scoring.
+
+    A keyword takes the weight of the first tier set containing it, else the default; repeats within a list add up.
+    """
+    weights = {}
+    for score, table, field, tiers, default in scoring:
+        for keyword in tables[table][field]:
+            weight = next((tier_weight for tier, tier_weight in tiers if keyword in tier), default)
+            keyword_weights = weights.setdefault(keyword, {})
+            keyword_weights[score] = keyword_weights.get(score, 0) + weight
+    return MappingProxyType({keyword: tuple(keyword_weights.items()) for keyword, keyword_weights in weights.items()})
+
+
+def count_words(text, limit):
+    """Word count of text capped at limit, so threshold checks split at most limit words"""
+    return min(len(text.split(maxsplit=limit)), limit)
+
+
+def at_least(count, flags):
+    """True once count of the flags are truthy, without evaluating the rest"""
+    return len(list(islice(filter(None, flags), count))) == count
+
+
+def literal_expression(keyword):
+    """Hyperscan expression matching keyword literally - every UTF-8 byte as a \\xHH escape"""
+    return ''.join(f'\\x{byte:02x}' for byte in keyword.encode('utf-8')).encode('ascii')
+
+
+def compile_patterns(patterns, flags=re.IGNORECASE):
+    """Compile a table's regex strings once at import instead of on every call"""
+    return tuple(re.compile(pattern, flags) for pattern in patterns)
+
+
+def parse_html(content, content_type=''):
+    """lxml tree of an HTML document, or None when lxml is missing or cannot parse it"""
+    if lxml_html is None:
+        return None
+    charset = CHARSET_RE.search(content_type)
+    try:
+        markup = content.decode(charset.group(1) if charset else 'utf-8')
+    except (UnicodeDecodeError, LookupError):
+        markup = content  # let lxml sniff the <meta> charset
+    try:
+        return lxml_html.document_fromstring(markup)
+    except (lxml_etree.ParserError, ValueError):
+        return None  # empty or badly broken markup
+
+
+def extract_text(content, content_type=''):
+    """Visible text of an HTML document, like BeautifulSoup's get_text() but via lxml when available"""
+    root = parse_html(content, content_type)
+    if root is not None:
+        return ''.join(root.xpath('//text()[not(ancestor::script or ancestor::style or ancestor::template)]'))
+    return BeautifulSoup(content, 'html.parser').get_text()
+
+
+def read_capped(response):
+    """FetchedPage of a streamed requests response, keeping at most MAX_PAGE_BYTES of its body"""
+    body = bytearray()
+    for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+        body += chunk
+        if len(body) >= MAX_PAGE_BYTES:
+            response.close()  # drop the rest rather than draining it
+            break
+    history = [FetchedPage(r.url, r.status_code, r.headers) for r in response.history]
+    return FetchedPage(response.url, response.status_code, response.headers, bytes(body[:MAX_PAGE_BYTES]), history)
+
+
+def dump_json(obj):
+    """Serialize progress/stats to indented JSON bytes - orjson when available, stdlib json otherwise"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def load_json(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def write_file_atomic(path, data):
+    """Write bytes to a temp file and rename it over path so readers never see a partial file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        # Data must be on disk before the rename, or a crash can leave an empty file behind
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class KeywordMatcher:
+    """Finds every keyword of many keyword lists in a single pass over the text.
+
+    Keywords are registered under tags such as ('large', 'fortune_keywords').
+    Uses a pyahocorasick automaton when installed, else a Hyperscan database, otherwise
+    one count per keyword whose first character occurs in the text (on UTF-8 bytes for non-ASCII text).
+    """
+    def __init__(self, groups):
+        # keyword -> tags it is listed under (repeated if listed twice, so totals match the list loops)
+        self.tags = {}
+        for tag, keywords in groups.items():
+            for keyword in keywords:
+                self.tags.setdefault(keyword, []).append(tag)
+        
+        self.automaton = None
+        if ahocorasick is not None and self.tags:
+            self.automaton = ahocorasick.Automaton()
+            for keyword in self.tags:
+                self.automaton.add_word(keyword, keyword)
+            self.automaton.make_automaton()
+        
+        # Hyperscan reports every occurrence like the automaton, but through a Python callback
+        # per match, so it only stands in when pyahocorasick is missing
+        self.keywords = list(self.tags)
+        self.database = None
+        if self.automaton is None and hyperscan is not None and self.keywords:
+            try:
+                self.database = hyperscan.Database()
+                self.database.compile(expressions=[literal_expression(keyword) for keyword in self.keywords],
+                                      ids=list(range(len(self.keywords))),
+                                      flags=[0] * len(self.keywords))
+            except Exception as e:
+                logger.warning(f"Hyperscan could not compile keywords, using str.count: {e}")
+                self.database = None
+        
+        # Fallback index: first character -> (keyword, UTF-8 keyword), so absent characters skip their keywords
+        self.by_first_char = {}
+        for keyword in self.tags:
+            self.by_first_char.setdefault(keyword[:1], []).append((keyword, keyword.encode('utf-8', 'surrogatepass')))
+
+    def counts(self, text):
+        """Number of occurrences of each keyword found in text"""
+        if self.automaton is not None:
+            # Counter consumes the match iterator in C, no per-match Python bytecode
+            return Counter(map(itemgetter(1), self.automaton.iter(text)))
+        if self.database is not None:
+            hits = []
+            self.database.scan(text.encode('utf-8', 'ignore'), match_event_handler=lambda keyword_id, *_: hits.append(keyword_id))
+            return Counter(map(self.keywords.__getitem__, hits))
+        
+        # Text with wider characters is stored 2-4 bytes per character; its UTF-8 encoding is
+        # searched byte by byte instead, and UTF-8 byte matches line up with the character matches
+        wide = not text.isascii()
+        haystack = text.encode('utf-8', 'surrogatepass') if wide else text
+        found = {}
+        for char in self.by_first_char.keys() & set(text):
+            for keyword, keyword_bytes in self.by_first_char[char]:
+                count = haystack.count(keyword_bytes if wide else keyword)
+                if count:
+                    found[keyword] = count
+        return found
+
+    def tag_totals(self, counts):
+        """Total keyword hits per tag for the result of counts()"""
+        totals = {}
+        for keyword, count in counts.items():
+            for tag in self.tags[keyword]:
+                totals[tag] = totals.get(tag, 0) + count
+        return totals
+
+
+class PatternSetMatcher:
+    """Finds which of a list of regexes match a text - one Hyperscan scan when available"""
+    def __init__(self, patterns, flags=re.IGNORECASE):
+        self.patterns = [re.compile(pattern, flags) for pattern in patterns]
+        self.database = None
+        if hyperscan is not None and patterns:
+            hs_flags = hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+            if flags & re.IGNORECASE:
+                hs_flags |= hyperscan.HS_FLAG_CASELESS
+            try:
+                self.database = hyperscan.Database()
+                self.database.compile(expressions=[pattern.encode('utf-8') for pattern in patterns],
+                                      ids=list(range(len(patterns))),
+                                      flags=[hs_flags] * len(patterns))
+            except Exception as e:
+                logger.warning(f"Hyperscan could not compile patterns, using re: {e}")
+                self.database = None
+
+    def matching(self, text):
+        """Compiled patterns (in table order) that match text"""
+        if not self.patterns or not text:
+            return []
+        if self.database is None:
+            return [pattern for pattern in self.patterns if pattern.search(text)]
+        
+        matched = set()
+        self.database.scan(text.encode('utf-8', 'ignore'), match_event_handler=lambda pattern_id, *_: matched.add(pattern_id))
+        return [self.patterns[pattern_id] for pattern_id in sorted(matched)]
+
+    def count(self, text):
+        """Number of distinct patterns that match text"""
+        return len(self.matching(text))
+
+
+# Public suffix lookups use tldextract's bundled snapshot - no network fetch of the list
+TLD_EXTRACTOR = tldextract.TLDExtract(suffix_list_urls=(), include_psl_private_domains=True) if tldextract else None
+
+
+def registered_domain(domain):
+    """eTLD+1 of a cleaned domain (e.g. shop.example.co.uk -> example.co.uk), or the domain itself"""
+    if TLD_EXTRACTOR is None:
+        return domain
+    return TLD_EXTRACTOR(domain).registered_domain or domain
+
+
+# DNS upstreams raced by StaggeredResolver (None = the system-configured nameservers)
+DNS_NAMESERVERS = (None, '1.1.1.1')
+DNS_STAGGER_DELAY = 0.2
+DNS_CACHE_TTL = 300
+DNS_CACHE_SIZE = 10000
+
+def build_ssl_context(legacy=False):
+    """Relaxed TLS context (no verification) shared by the requests pools and the aiohttp connector.
+
+    legacy=True also allows old protocol versions and weak ciphers, for retrying failed handshakes.
+    """
+    try:
+        from urllib3.util.ssl_ import create_urllib3_context
+        
+        ctx = create_urllib3_context()
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+        # urllib3 disables session tickets; allow them so repeat hosts resume instead of full handshakes
+        ctx.options &= ~ssl.OP_NO_TICKET
+        try:
+            ctx.set_ciphers('ALL:@SECLEVEL=0' if legacy else 'DEFAULT')
+            if legacy:
+                ctx.minimum_version = ssl.TLSVersion.MINIMUM_SUPPORTED
+        except (ssl.SSLError, ValueError):
+            pass
+        return ctx
+    except Exception as e:
+        logger.warning(f"SSL context setup failed: {e}")
+        return None
+
+
+SHARED_SSL_CONTEXT = build_ssl_context()
+LEGACY_SSL_CONTEXT = build_ssl_context(legacy=True)
+
+# Pooled keep-alive connections are replaced once they are older than this (seconds)
+CONNECTION_MAX_AGE = 120
+# Longest Retry-After we are willing to sleep for (seconds)
+RETRY_AFTER_CAP = 5
+
+
+class MaxAgePoolMixin:
+    """urllib3 pool mixin that swaps out pooled connections older than CONNECTION_MAX_AGE"""
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn.created_at = time.monotonic()
+        return conn
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout)
+        if time.monotonic() - getattr(conn, 'created_at', 0) > CONNECTION_MAX_AGE:
+            conn.close()
+            conn = self._new_conn()
+        return conn
+
+
+class MaxAgeHTTPConnectionPool(MaxAgePoolMixin, HTTPConnectionPool):
+    pass
+
+
+class MaxAgeHTTPSConnectionPool(MaxAgePoolMixin, HTTPSConnectionPool):
+    pass
+
+
+MAX_AGE_POOL_CLASSES = {'http': MaxAgeHTTPConnectionPool, 'https': MaxAgeHTTPSConnectionPool}
+
+
+class CappedRetry(Retry):
+    """Retry that honours Retry-After but never sleeps longer than RETRY_AFTER_CAP"""
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_CAP)
+
+
+# Retry delays (seconds) per error class from DomainChecker.classify_error(). Permanent DNS
+# failures are not retried, connect timeouts get one short static retry, read timeouts and
+# server errors back off exponentially, TLS failures retry once with LEGACY_SSL_CONTEXT.
+RETRY_POLICY = MappingProxyType({
+    'dns_perm': (),
+    'dns_temp': (1.0,),
+    'conn_timeout': (1.0,),
+    'read_timeout': (0.2, 0.4),
+    'tls': (0,),
+    'http_5xx': (0.2, 0.4),
+    'other': (),
+})
+DNS_PERMANENT_ERRNOS = frozenset([socket.EAI_NONAME, getattr(socket, 'EAI_NODATA', socket.EAI_NONAME)])
+
+# Async probe: HEAD first, then GET only this many bytes unless the prefix is inconclusive
+PROBE_RANGE_BYTES = 65536
+# HEAD statuses trusted without a follow-up GET
+PROBE_FINAL_STATUSES = frozenset([404, 410])
+# Page bodies are cut off at this size - bounds parse time and memory on huge pages
+MAX_PAGE_BYTES = 512 * 1024
+
+# Deep crawl: extra pages per site, fetched concurrently
+CRAWL_PAGE_LIMIT = 5
+CRAWL_CONCURRENCY = 8
+CRAWL_TIMEOUT = 5
+
+# Request hedging (async path): a duplicate request is raced once the first one is slower than
+# the running median, with hedges capped at HEDGE_BUDGET_RATIO of all requests
+HEDGE_INITIAL_DELAY = 0.8
+HEDGE_MIN_SAMPLES = 20
+HEDGE_BUDGET_RATIO = 0.1
+HEDGE_BUDGET_BURST = 10
+LATENCY_WINDOW = 256
+# The http probe starts alongside a still-pending https probe after this many median request
+# latencies (a probe is a HEAD plus a GET), spending a hedge token
+PROTOCOL_RACE_DELAY_FACTOR = 2
+
+
+class LatencyTracker:
+    """Running median of recent request latencies"""
+    def __init__(self, window=LATENCY_WINDOW, default=HEDGE_INITIAL_DELAY):
+        self.samples = deque(maxlen=window)
+        self.default = default
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+
+    def p50(self):
+        if len(self.samples) < HEDGE_MIN_SAMPLES:
+            return self.default
+        ordered = sorted(self.samples)
+        return ordered[len(ordered) // 2]
+
+
+class HedgeBudget:
+    """Token bucket: every request earns HEDGE_BUDGET_RATIO of a token, a hedge spends one"""
+    def __init__(self, ratio=HEDGE_BUDGET_RATIO, burst=HEDGE_BUDGET_BURST):
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = 0.0
+
+    def earn(self):
+        self.tokens = min(self.burst, self.tokens + self.ratio)
+
+    def take(self):
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class StatSlot(IntEnum):
+    """Slots of the per-batch scalar counters; names match the self.stats keys"""
+    TOTAL_PROCESSED = 0
+    WORKING = 1
+    BUSINESS = 2
+    PARKED = 3
+    FAILED = 4
+    TARGET_CUSTOMERS = 5
+    HIGH_PRIORITY_TARGETS = 6
+    MEDIUM_PRIORITY_TARGETS = 7
+    DECISION_MAKER_ACCESSIBLE = 8
+    WEBSITE_NEEDS_UPGRADE = 9
+
+
+# Pages whose analysis is reused by content hash (vacation rental pages are never cached,
+# their classification crawls more of the site)
+CONTENT_CACHE_SIZE = 20000
+
+# Text-only VR helpers memoized by text digest (crawl retries, boilerplate-identical sibling pages)
+TEXT_MEMO_SIZE = 1024
+
+
+class TextMemo:
+    """LRU memo for a helper whose result depends only on its text arguments.
+
+    Keyed by a blake2b digest of the first (page text) argument so cached pages are not kept alive.
+    Keyword arguments must be derived from the text (such as text_lower) and are not part of the key.
+    Hits return a copy, callers may modify the result.
+    """
+    def __init__(self, func, maxsize=TEXT_MEMO_SIZE):
+        self.func = func
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __call__(self, text, *args, **derived):
+        key = (hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest(), args)
+        with self.lock:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache.move_to_end(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        value = self.func(text, *args, **derived)
+        with self.lock:
+            self.cache[key] = copy.deepcopy(value)
+            while len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+        return value
+
+# Write buffer for the results CSV files; rows are flushed once per batch
+CSV_BUFFER_SIZE = 1 << 20
+
+
+class StaggeredResolver:
+    """aiohttp resolver that races A lookups across several upstreams (aiodns).
+
+    The second upstream is only queried if the first hasn't answered within
+    DNS_STAGGER_DELAY. Answers go into a shared TTL cache and concurrent lookups
+    for the same host wait on a single query.
+    """
+    def __init__(self, cache, nameservers=DNS_NAMESERVERS):
+        self.cache = cache
+        self.resolvers = [aiodns.DNSResolver(nameservers=[ns] if ns else None) for ns in nameservers]
+        self.inflight = {}
+
+    async def resolve(self, host, port=0, family=socket.AF_INET):
+        addresses = await self.lookup(host)
+        return [{'hostname': host, 'host': address, 'port': port, 'family': socket.AF_INET,
+                 'proto': 0, 'flags': socket.AI_NUMERICHOST} for address in addresses]
+
+    async def lookup(self, host):
+        """Cached, coalesced lookup of a host's IPv4 addresses"""
+        cached = self.cache.get(host)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        future = self.inflight.get(host)
+        if future is None:
+            future = asyncio.ensure_future(self.query(host))
+            self.inflight[host] = future
+            future.add_done_callback(lambda f: self.inflight.pop(host, None))
+        # Shield so one cancelled caller doesn't cancel the lookup for everyone else
+        return await asyncio.shield(future)
+
+    async def query(self, host):
+        """Query the upstreams staggered by DNS_STAGGER_DELAY, first answer wins"""
+        upstreams = iter(self.resolvers)
+        pending = set()
+        error = None
+        try:
+            while True:
+                resolver = next(upstreams, None)
+                if resolver is not None:
+                    pending.add(asyncio.ensure_future(
+                        resolver.getaddrinfo(host, family=socket.AF_INET, type=socket.SOCK_STREAM)))
+                elif not pending:
+                    raise socket.gaierror(socket.EAI_AGAIN, f"DNS lookup failed: {error.args[1] if len(error.args) > 1 else error}") from error
+                
+                done, pending = await asyncio.wait(pending, timeout=DNS_STAGGER_DELAY if resolver else None,
+                                                   return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        addresses = [node.addr[0].decode('ascii') for node in task.result().nodes]
+                        self.cache[host] = (time.monotonic() + DNS_CACHE_TTL, addresses)
+                        self.cache.move_to_end(host)
+                        while len(self.cache) > DNS_CACHE_SIZE:
+                            self.cache.popitem(last=False)
+                        return addresses
+                    error = task.exception()
+                    # NXDOMAIN is an authoritative answer, asking another upstream won't help
+                    if isinstance(error, aiodns.error.DNSError) and error.args and error.args[0] == aiodns.error.ARES_ENOTFOUND:
+                        raise socket.gaierror(socket.EAI_NONAME, f"DNS lookup failed: {error.args[1]}") from error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def close(self):
+        for resolver in self.resolvers:
+            resolver.cancel()
+
+
+# Processed-domain Bloom filter sizing (false-positive rate is re-checked against the log on resume)
+BLOOM_CAPACITY = 1000000
+BLOOM_ERROR_RATE = 1e-4
+BLOOM_HEADER = struct.Struct('<8sQQQQQ')
+BLOOM_MAGIC = b'DCBLOOM1'
+
+
+class ProcessedDomainFilter:
+    """Set-like record of processed domains: a memory-mapped Bloom filter plus an append-only log.
+
+    The bit array lives in `<path>.bloom` and every domain is appended to
+    `<path>.log` on flush(), so resuming maps the filter instead of reloading
+    a JSON list. Bloom hits are confirmed against the log by unprocessed(),
+    which keeps resume exact. Without a path the filter is kept in memory.
+    """
+    def __init__(self, path=None, capacity=BLOOM_CAPACITY, reset=False):
+        self.bloom_path = f"{path}.bloom" if path else None
+        self.log_path = f"{path}.log" if path else None
+        self.pending = []
+        self.mm = None
+        self.file = None
+        if path and reset:
+            for filename in (self.bloom_path, self.log_path):
+                if os.path.exists(filename):
+                    os.remove(filename)
+        if path and not self.open_existing():
+            self.create(max(capacity, self.log_lines() * 2))
+            self.replay_log()
+        elif not path:
+            self.create(capacity)
+
+    def open_existing(self):
+        """Map an existing filter file if it is still in sync with the log"""
+        if not os.path.exists(self.bloom_path):
+            return False
+        with open(self.bloom_path, 'rb') as f:
+            header = f.read(BLOOM_HEADER.size)
+        if len(header) != BLOOM_HEADER.size:
+            return False
+        magic, capacity, bits, hashes, count, log_size = BLOOM_HEADER.unpack(header)
+        if magic != BLOOM_MAGIC or log_size != self.log_size():
+            return False
+        self.map(capacity, bits, hashes)
+        self.count = count
+        return True
+
+    def create(self, capacity):
+        """Start an empty filter sized for capacity domains at BLOOM_ERROR_RATE"""
+        bits = math.ceil(-capacity * math.log(BLOOM_ERROR_RATE) / math.log(2) ** 2)
+        bits = (bits + 7) // 8 * 8
+        hashes = max(1, round(bits / capacity * math.log(2)))
+        self.close()
+        if self.bloom_path:
+            with open(self.bloom_path, 'wb') as f:
+                f.truncate(BLOOM_HEADER.size + bits // 8)
+        self.map(capacity, bits, hashes)
+        self.count = 0
+        self.write_header()
+
+    def map(self, capacity, bits, hashes):
+        self.close()
+        self.capacity, self.bits, self.hashes = capacity, bits, hashes
+        if self.bloom_path:
+            self.file = open(self.bloom_path, 'r+b')
+            self.mm = mmap.mmap(self.file.fileno(), BLOOM_HEADER.size + bits // 8)
+        else:
+            self.mm = bytearray(BLOOM_HEADER.size + bits // 8)
+
+    def write_header(self):
+        self.mm[:BLOOM_HEADER.size] = BLOOM_HEADER.pack(BLOOM_MAGIC, self.capacity, self.bits, self.hashes,
+                                                        self.count, self.log_size())
+
+    def log_size(self):
+        if self.log_path and os.path.exists(self.log_path):
+            return os.path.getsize(self.log_path)
+        return 0
+
+    def log_lines(self):
+        if not self.log_size():
+            return 0
+        with open(self.log_path, 'rb') as f:
+            return sum(1 for _ in f)
+
+    def iter_log(self):
+        if self.log_size():
+            with open(self.log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    yield line.rstrip('\n')
+
+    def replay_log(self):
+        """Rebuild the bit array from the log"""
+        for domain in self.iter_log():
+            self.set_bits(domain)
+            self.count += 1
+        self.write_header()
+
+    def positions(self, domain):
+        digest = hashlib.blake2b(domain.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        # Lazy, so a membership test stops at the first clear bit - most domains on a resume are new
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def set_bits(self, domain):
+        for position in self.positions(domain):
+            self.mm[BLOOM_HEADER.size + (position >> 3)] |= 1 << (position & 7)
+
+    def add(self, domain):
+        self.set_bits(domain)
+        self.count += 1
+        self.pending.append(domain)
+
+    def __contains__(self, domain):
+        return all(self.mm[BLOOM_HEADER.size + (position >> 3)] & (1 << (position & 7))
+                   for position in self.positions(domain))
+
+    def __len__(self):
+        return self.count
+
+    def unprocessed(self, domains):
+        """Domains not yet processed, with Bloom hits confirmed against the log"""
+        candidates = {domain for domain in domains if domain in self}
+        confirmed = set()
+        if candidates:
+            confirmed.update(domain for domain in self.iter_log() if domain in candidates)
+            confirmed.update(domain for domain in self.pending if domain in candidates)
+        return [domain for domain in domains if domain not in confirmed]
+
+    def flush(self):
+        """Append pending domains to the log and sync the filter file"""
+        if not self.log_path:
+            return
+        if self.pending:
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(self.pending) + '\n')
+            self.pending.clear()
+        if self.count > self.capacity:
+            self.create(max(self.capacity, self.count) * 2)
+            self.replay_log()
+        else:
+            self.write_header()
+        self.mm.flush()
+
+    def close(self):
+        if self.file:
+            self.mm.close()
+            self.file.close()
+            self.file = None
+        self.mm = None
+
+
+def freeze_keywords(value):
+    """Make a keyword table read-only: lists become tuples, dicts MappingProxyType, strings are interned"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze_keywords(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_keywords(item) for item in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def label_keywords(label, keywords):
+    """Prebuilt "label: keyword" indicator strings, so matches append a shared string instead of formatting one"""
+    return MappingProxyType({keyword: sys.intern(f"{label}: {keyword}") for keyword in keywords})
+
+
+# Keyword tables - built once at import and shared by every DomainChecker instance
+# Enhanced parked domain indicators
+PARKED_INDICATORS = freeze_keywords([
+    'domain for sale', 'buy this domain', 'parked domain', 'coming soon',
+    'under construction', 'this domain is for sale', 'expired domain',
+    'register this domain', 'domain parking', 'premium domain',
+    'inquire about this domain', 'make an offer', 'domain auction',
+    'brandable domain', 'great domain', 'perfect domain', 'domain available',
+    'inquire now', 'buy now', 'purchase this domain', 'acquire this domain',
+    'godaddy', 'namecheap', 'sedo', 'afternic', 'hugedomains', 'dan.com',
+    'escrow.com', 'flippa', 'brandpa', 'squadhelp', 'undeveloped',
+    'domain.com', 'name.com', 'networksolutions', 'dynadot',
+    'brandable.com', 'brandroot', 'domainhostingview', 'whois.net',
+    'domainmarket', 'premiumdomains', 'brandbucket', 'namerific',
+    'placeholder page', 'temporary page', 'site coming soon',
+    'website coming soon', 'launching soon', 'site under development',
+    'default page', 'apache2 debian default page', 'nginx default page',
+    'it works!', 'apache2 ubuntu default page', 'welcome to nginx',
+    'cpanel', 'whm', 'plesk', 'directadmin', 'hostgator', 'bluehost',
+    'shared hosting', 'web hosting', 'hosting account', 'server default',
+    'this domain is hosted by', 'hosted on',
+    'this site is temporarily unavailable', 'account suspended',
+    'domain suspended', 'hosting account suspended', 'service unavailable',
+    'bandwidth limit exceeded', 'quota exceeded', 'site maintenance',
+    'temporarily down', 'website offline', 'server error',
+    'suspended domain', 'suspended account', 'terms of service violation',
+    'directory listing', 'index of /', 'apache directory listing',
+    'welcome to your new website', 'congratulations on your new domain',
+    'this domain has been registered', 'domain successfully registered',
+    'thank you for registering', 'domain registration successful',
+    'business for sale', 'website for sale', 'established domain',
+    'traffic included', 'seo optimized domain', 'keyword rich domain',
+    'exact match domain', 'premium .com domain', 'valuable domain',
+    'investment opportunity', 'revenue generating', 'monetized domain',
+    'landing page', 'lead capture', 'affiliate marketing', 'monetization',
+    'ppc ready', 'adsense ready', 'revenue potential', 'traffic value',
+    'type-in traffic', 'direct navigation', 'category killer',
+    '.gallery domain', '.ist domain', '.qa domain', 'new tld',
+    'premium extension', 'new domain extension'
+])
+
+# Parked page indicators checked by is_parked_domain_fixed()
+STRONG_PARKED_INDICATORS = (
+    'this domain is for sale',
+    'buy this domain',
+    'domain is parked',
+    'domain parking',
+    'purchase this domain',
+    'domain available for sale',
+    'get this domain',
+    'own this domain',
+    'claim this domain',
+    'register this domain',
+    'domain auction',
+    'make an offer on this domain',
+    'inquire about purchasing',
+    'premium domain for sale',
+    'domain marketplace',
+    'undeveloped domain',
+    'domain is currently parked',
+    'parked by',
+    'parked at',
+    'this page is parked',
+    'hugedomains.com',
+    'sedo.com',
+    'dan.com',
+    'afternic.com'
+)
+
+COMING_SOON_INDICATORS = (
+    'coming soon',
+    'launching soon',
+    'under construction',
+    'site under development',
+    'website coming soon',
+    'under maintenance',
+    'be right back',
+    'stay tuned',
+    'work in progress',
+    'currently unavailable'
+)
+
+DEFAULT_PAGE_INDICATORS = (
+    'apache2 debian default',
+    'apache2 ubuntu default',
+    'welcome to nginx',
+    'it works!',
+    'default web page',
+    'test page for',
+    'placeholder page',
+    'cpanel default',
+    'plesk default'
+)
+
+# Vacation rental terms that make is_parked_domain lenient
+PARKED_VR_KEYWORDS = freeze_keywords([
+    'vacation rental', 'holiday home', 'beach house', 'cabin',
+    'cottage', 'villa', 'property rental', 'book now', 'check availability'
+])
+
+# Parked indicators still conclusive on a page with vacation rental terms
+VR_STRONG_PARKED_INDICATORS = freeze_keywords([
+    'domain for sale', 'buy this domain', 'this domain is for sale',
+    'domain parking', 'hugedomains', 'godaddy auction'
+    'domain for sale', 'buy this domain', 'parked domain', 'coming soon',
+    'under construction', 'this domain is for sale', 'expired domain',
+    'register this domain', 'domain parking', 'premium domain',
+    'inquire about this domain', 'make an offer', 'domain auction',
+    'brandable domain', 'great domain', 'perfect domain', 'domain available',
+    'inquire now', 'buy now', 'purchase this domain', 'acquire this domain',
+    'godaddy', 'namecheap', 'sedo', 'afternic', 'hugedomains', 'dan.com', 
+    'escrow.com', 'flippa', 'brandpa', 'squadhelp', 'undeveloped',
+    'domain.com', 'name.com', 'networksolutions', 'dynadot',
+    'brandable.com', 'brandroot', 'domainhostingview', 'whois.net',
+    'domainmarket', 'premiumdomains', 'brandbucket', 'namerific',
+    'placeholder page', 'temporary page', 'site coming soon',
+    'website coming soon', 'launching soon', 'site under development',
+    'default page', 'apache2 debian default page', 'nginx default page',
+    'it works!', 'apache2 ubuntu default page', 'welcome to nginx',
+    'cpanel', 'whm', 'plesk', 'directadmin', 'hostgator', 'bluehost',
+    'shared hosting', 'web hosting', 'hosting account', 'server default',
+    'this domain is hosted by', 'hosted on',
+    'this site is temporarily unavailable', 'account suspended',
+    'domain suspended', 'hosting account suspended', 'service unavailable',
+    'bandwidth limit exceeded', 'quota exceeded', 'site maintenance',
+    'temporarily down', 'website offline', 'server error',
+    'suspended domain', 'suspended account', 'terms of service violation',
+    'directory listing', 'index of /', 'apache directory listing',
+    'welcome to your new website', 'congratulations on your new domain',
+    'this domain has been registered', 'domain successfully registered',
+    'thank you for registering', 'domain registration successful',
+    'business for sale', 'website for sale', 'established domain',
+    'traffic included', 'seo optimized domain', 'keyword rich domain',
+    'exact match domain', 'premium .com domain', 'valuable domain',
+    'investment opportunity', 'revenue generating', 'monetized domain',
+    'landing page', 'lead capture', 'affiliate marketing', 'monetization',
+    'ppc ready', 'adsense ready', 'revenue potential', 'traffic value',
+    'type-in traffic', 'direct navigation', 'category killer',
+    '.gallery domain', '.ist domain', '.qa domain', 'new tld',
+    'premium extension', 'new domain extension'
+])
+
+# Parked hints counted on near-empty pages
+MINIMAL_PARKED_PATTERNS = freeze_keywords([
+    'domain', 'sale', 'buy', 'purchase', 'available', 'premium',
+    'coming soon', 'under construction', 'placeholder'
+])
+
+# Sale and error wording that marks a near-empty page as parked
+PARKED_SALE_KEYWORDS = freeze_keywords(['for sale', 'domain sale', 'buy now', 'purchase'])
+PARKED_ERROR_KEYWORDS = freeze_keywords(['suspended', 'not found', 'error', 'forbidden'])
+
+# Launching-soon and error-page phrases that make content not meaningful
+NOT_READY_PHRASES = freeze_keywords([
+    'launching soon', 'coming soon', 'under construction',
+    'be right back', 'website will be available',
+    'page not found', '404 not found', '403 forbidden',
+    '500 internal server error', 'bad gateway'
+])
+
+# Spam keywords injected into hacked websites
+HACKING_KEYWORDS = freeze_keywords([
+    # Pharmacy spam
+    'viagra', 'cialis', 'levitra', 'pharmacy', 'prescription drugs',
+    'buy pills online', 'cheap meds', 'online pharmacy', 'medications',
+
+    # Casino/gambling spam
+    'online casino', 'poker online', 'slots', 'gambling', 'bet online',
+    'play casino', 'win money', 'jackpot', 'betting site',
+
+    # Porn/adult content (when unexpected)
+    'xxx', 'porn', 'adult content', 'sex', 'nude', 'escorts',
+
+    # Loan/financial scams
+    'payday loan', 'quick loan', 'fast cash', 'instant approval',
+    'bad credit loan', 'no credit check', 'guaranteed approval',
+
+    # Crypto scams
+    'bitcoin mining', 'crypto investment', 'blockchain profit',
+    'cryptocurrency trading', 'btc doubler', 'ethereum giveaway',
+
+    # SEO spam
+    'seo services', 'backlinks for sale', 'link building',
+    'google ranking', 'first page guaranteed',
+
+    # Other common spam
+    'replica watches', 'fake documents', 'essay writing service',
+    'weight loss pills', 'work from home', 'make money online'
+])
+
+# Image alt words that mark property photos rather than stock images
+PROPERTY_PHOTO_KEYWORDS = freeze_keywords(['bedroom', 'kitchen', 'living', 'bathroom', 'view', 'pool', 'exterior'])
+
+# Adjectives of a specific property description
+PROPERTY_DESCRIPTION_KEYWORDS = freeze_keywords([
+    'spacious', 'cozy', 'renovated', 'modern', 'charming',
+    'comfortable', 'private', 'peaceful', 'stunning views'
+])
+# Headings that introduce a property's amenity list
+AMENITY_LIST_MARKERS = freeze_keywords(['amenities:', 'features:', 'includes:'])
+# Words that put a published email address in a booking context
+BOOKING_CONTEXT_KEYWORDS = freeze_keywords(['book', 'reserve', 'inquiry', 'availability', 'rates'])
+
+# Company size phrases checked by classify_company_size() and its helpers
+LARGE_BUSINESS_RED_FLAGS = freeze_keywords([
+    'api integration', 'enterprise api', 'developer portal', 'white label',
+    'franchise opportunities', 'investor relations', 'press releases',
+    'corporate partnerships', 'global expansion', 'ipo', 'acquisition'
+])
+# Team-size estimates, largest first - the first size with a phrase on the page wins
+EMPLOYEE_ESTIMATE_PHRASES = freeze_keywords({
+    'large': ['thousands of employees', 'million employees'],
+    'medium': ['hundreds of employees', 'large team'],
+    'small': ['small team', 'boutique', 'family business'],
+})
+GLOBAL_PRESENCE_INDICATORS = freeze_keywords([
+    'worldwide', 'global presence', 'international offices',
+    'offices around the world', 'global locations'
+])
+SOCIAL_SHARING_INDICATORS = freeze_keywords(['share', 'tweet', 'like', 'follow'])
+# Social networks recognised in link targets, and the domains extract_social_media_links() reports them by
+SOCIAL_MEDIA_DOMAINS = freeze_keywords({
+    'facebook': ['facebook.com', 'fb.com'],
+    'twitter': ['twitter.com', 'x.com'],
+    'instagram': ['instagram.com'],
+    'linkedin': ['linkedin.com'],
+    'youtube': ['youtube.com', 'youtu.be'],
+    'tiktok': ['tiktok.com'],
+    'pinterest': ['pinterest.com'],
+    'snapchat': ['snapchat.com'],
+    'whatsapp': ['whatsapp.com', 'wa.me'],
+    'telegram': ['telegram.me', 't.me']
+})
+SOCIAL_PLATFORM_RE = re.compile('facebook|twitter|linkedin|instagram|youtube|tiktok|pinterest|snapchat|telegram|whatsapp')
+
+# Business-website signals checked by is_business_website and extract_business_info
+VR_SITE_TERMS = freeze_keywords([
+    'vacation rental', 'holiday rental', 'property rental',
+    'beach house', 'cabin rental', 'vacation home'
+])
+VR_BUSINESS_INDICATORS = freeze_keywords([
+    'contact', 'email', 'phone', 'book', 'availability',
+    'property', 'rental', 'rate', 'price', 'location'
+])
+BUSINESS_INDICATORS = freeze_keywords([
+    'about us', 'contact us', 'services', 'products', 'company',
+    'business', 'team', 'careers', 'support', 'customer',
+    'phone', 'email', 'address', 'location', 'hours'
+])
+ONLINE_BOOKING_PHRASES = freeze_keywords(['book now', 'reserve now', 'schedule appointment', 'book online', 'make reservation'])
+
+# Form text and field names of booking/inquiry forms
+BOOKING_FORM_KEYWORDS = freeze_keywords([
+    'inquiry', 'booking', 'reservation', 'check-in',
+    'check-out', 'guests', 'dates', 'availability'
+])
+
+# ASCII-lowered byte forms, matched against bytes.lower() of the raw response without decoding
+PARKED_PAGE_INDICATOR_BYTES = tuple(indicator.encode('ascii') for indicator in
+                                    STRONG_PARKED_INDICATORS + COMING_SOON_INDICATORS + DEFAULT_PAGE_INDICATORS)
+
+# Indicators conclusive enough to stop downloading a page once they show up in its text
+EARLY_STOP_INDICATORS = STRONG_PARKED_INDICATORS + DEFAULT_PAGE_INDICATORS
+EARLY_STOP_INDICATOR_BYTES = tuple(indicator.encode('ascii') for indicator in EARLY_STOP_INDICATORS)
+EARLY_STOP_OVERLAP = max(len(indicator) for indicator in EARLY_STOP_INDICATOR_BYTES)
+STREAM_CHUNK_SIZE = 4096
+
+# Enhanced company size indicators with more detailed analysis
+LARGE_COMPANY_INDICATORS = freeze_keywords({
+    'listing_platform_keywords': [
+        'thousands of listings', 'millions of properties', 'search properties',
+        'browse listings', 'property listings', 'rental listings', 'accommodation listings',
+        'booking platform', 'reservation platform', 'marketplace', 'directory',
+        'find properties', 'compare properties', 'property search engine',
+        'listing database', 'property database', 'inventory of', 'catalog of'
+    ],
+    'headquarters_indicators': [
+        'headquarters', 'corporate headquarters', 'global headquarters', 'hq',
+        'head office', 'corporate office', 'main office', 'principal office',
+        'executive offices', 'corporate campus', 'world headquarters'
+    ],
+    'fortune_keywords': [
+        'fortune 500', 'fortune 1000', 'nasdaq', 'nyse', 'stock exchange',
+        'publicly traded', 'shareholders', 'investor relations', 'sec filings',
+        'annual report', 'quarterly earnings', 'market cap', 'ticker symbol',
+        's&p 500', 'dow jones', 'public company', 'publicly held'
+    ],
+    'scale_indicators': [
+        'global', 'worldwide', 'international', 'multinational', 'enterprise',
+        'corporation', 'corporate', 'offices worldwide', 'global presence', 
+        'international offices', 'regional offices', 'subsidiaries', 'divisions', 
+        'business units', 'operating companies', 'franchise locations',
+        'nationwide', 'countrywide', 'multi-state', 'multi-national'
+    ],
+    'size_keywords': [
+        'thousands of employees', 'million employees', 'billion', 'millions of customers',
+        'fortune', 'largest', 'leading provider', 'market leader', 'industry leader',
+        'global leader', 'worldwide leader', 'established 18', 'established 19',
+        'since 18', 'since 19', 'founded 18', 'founded 19', 'over 100 years',
+        'billions in revenue', 'millions in revenue', 'market capitalization'
+    ],
+    'corporate_structure': [
+        'chief executive officer', 'chief financial officer', 'chief technology officer',
+        'board of directors', 'executive team', 'leadership team', 'senior management',
+        'c-suite', 'executive committee', 'advisory board', 'board members',
+        'vice president', 'senior vice president', 'executive vice president',
+        'managing director', 'general manager', 'regional manager'
+    ],
+    'compliance_indicators': [
+        'privacy policy', 'terms of service', 'cookie policy', 'gdpr', 'ccpa',
+        'compliance', 'regulatory', 'sox compliance', 'iso certified',
+        'quality management', 'certifications', 'accreditation', 'legal disclaimer',
+        'terms and conditions', 'user agreement', 'service agreement'
+    ],
+    'enterprise_services': [
+        'enterprise solutions', 'b2b', 'business solutions', 'enterprise grade',
+        'scalable solutions', 'white paper', 'case studies', 'implementation',
+        'professional services', 'consulting', 'support portal', 'api documentation',
+        'enterprise clients', 'corporate clients', 'institutional clients'
+    ],
+    'big_business_indicators': [
+        'press releases', 'media center', 'news room', 'newsroom', 'press center',
+        'media kit', 'brand assets', 'corporate communications', 'public relations',
+        'investor center', 'corporate governance', 'sustainability report',
+        'corporate responsibility', 'annual reports', 'quarterly reports'
+    ]
+})
+
+MEDIUM_COMPANY_INDICATORS = freeze_keywords({
+    'regional_presence': [
+        'regional', 'multi-location', 'multiple offices', 'branch offices',
+        'locations', 'established', 'growing company', 'expanding',
+        'several locations', 'multiple branches', 'regional service',
+        'serving multiple cities', 'multiple markets'
+    ],
+    'professional_services': [
+        'professional', 'certified', 'licensed', 'accredited', 'experienced team',
+        'expert', 'specialists', 'consultants', 'advisors', 'professional staff',
+        'qualified team', 'industry experts', 'certified professionals'
+    ],
+    'business_maturity': [
+        'years of experience', 'established business', 'trusted partner',
+        'proven track record', 'industry expertise', 'comprehensive services',
+        'experienced company', 'established reputation', 'trusted provider'
+    ],
+    'medium_scale_indicators': [
+        'regional leader', 'local market leader', 'growing business',
+        'expanding operations', 'multiple departments', 'dedicated team',
+        'specialized services', 'full-service', 'comprehensive solutions'
+    ]
+})
+
+# Enhanced small business indicators (these get HIGHER scores now)
+SMALL_COMPANY_INDICATORS = freeze_keywords({
+    'local_business': [
+        'local', 'family owned', 'family business', 'locally owned',
+        'community', 'neighborhood', 'hometown', 'serving [city]',
+        'local service', 'neighborhood business', 'community focused',
+        'locally operated', 'hometown favorite', 'local expertise'
+    ],
+    'personal_touch': [
+        'personal service', 'personalized', 'one-on-one', 'direct contact',
+        'owner operated', 'small business', 'boutique', 'specialized',
+        'personal attention', 'individual service', 'custom service',
+        'tailored solutions', 'hands-on approach', 'direct owner involvement'
+    ],
+    'simple_structure': [
+        'contact us', 'call us', 'email us', 'get in touch', 'reach out',
+        'call today', 'contact owner', 'speak directly', 'personal consultation'
+    ],
+    'authentic_small_business': [
+        'family tradition', 'generations', 'local family', 'small team',
+        'intimate setting', 'cozy', 'welcoming', 'friendly staff',
+        'know your name', 'personal relationships', 'community member',
+        'local knowledge', 'neighborhood expert', 'personal touch'
+    ],
+    'single_location_indicators': [
+        'our location', 'visit us at', 'stop by', 'come see us',
+        'our shop', 'our store', 'our office', 'single location',
+        'one location', 'locally based', 'conveniently located'
+    ]
+})
+
+# Technology stack indicators for company size
+TECH_INDICATORS = freeze_keywords({
+    'enterprise_tech': [
+        'salesforce', 'oracle', 'sap', 'microsoft dynamics', 'workday',
+        'servicenow', 'tableau', 'adobe experience', 'marketo', 'hubspot enterprise'
+    ],
+    'enterprise_hosting': [
+        'akamai', 'cloudflare enterprise', 'aws enterprise', 'azure enterprise',
+        'google cloud enterprise', 'cdn', 'load balancer', 'redundancy'
+    ],
+    'small_business_tech': [
+        'wix', 'squarespace', 'wordpress.com', 'weebly', 'shopify basic',
+        'godaddy website builder', 'site123'
+    ]
+})
+
+# Business model classification for vacation rental industry
+VACATION_RENTAL_BUSINESS_MODELS = freeze_keywords({
+    'marketplace_platforms': {
+        'keywords': [
+            'airbnb', 'vrbo', 'booking.com', 'expedia', 'tripadvisor rentals',
+            'homeaway', 'vacasa', 'hometogo', 'flipkey', 'vacationrenter',
+            'rentals.com', 'redawning', 'turnkey', 'awaze', 'novasol',
+            'marketplace', 'platform', 'book now', 'search rentals',
+            'find vacation rentals', 'browse properties', 'compare prices',
+            'book direct', 'instant book', 'millions of rentals',
+            'thousands of properties', 'rental marketplace'
+        ],
+        'url_indicators': [
+            'airbnb', 'vrbo', 'booking', 'expedia',
+            'tripadvisor', 'homeaway', 'vacasa', 'hometogo'
+        ],
+        'exclusion_reason': 'marketplace_platform'
+    },
+    'third_party_listings': {
+        'url_patterns': [
+        ],
+        'content_indicators': [
+            'property id', 'listing id', 'rental id', 'property #', 'listing #',
+            'property number', 'listing number', 'id:', 'ref:', 'reference:',
+            'book this property', 'reserve this listing', 'property details',
+            'listing details', 'view more properties', 'browse more rentals',
+            'similar properties', 'more listings like this', 'other properties',
+            'property amenities', 'listing amenities', 'check availability',
+            'booking calendar', 'reservation system', 'instant booking',
+            'property photos', 'listing photos', 'property gallery',
+            'hosted by', 'managed by', 'listed by', 'property owner:',
+            'contact host', 'message host', 'call host', 'property manager',
+            'booking fee', 'service fee', 'cleaning fee', 'security deposit',
+            'cancellation policy', 'house rules', 'guest reviews',
+            'verified listing', 'verified property', 'trust & safety'
+        ],
+        'template_indicators': [
+            'check-in:', 'check-out:', 'guests:', 'bedrooms:', 'bathrooms:',
+            'sleeps up to', 'accommodates', 'maximum occupancy',
+            'wifi included', 'parking included', 'pet friendly',
+            'smoking policy', 'minimum stay', 'maximum stay',
+            'property type:', 'accommodation type:', 'rental type:',
+            'neighborhood:', 'area:', 'location:', 'address:',
+            'price per night', 'nightly rate', 'weekly rate', 'monthly rate',
+            'total price', 'taxes and fees', 'additional charges'
+        ],
+        'navigation_indicators': [
+            'browse properties', 'search rentals', 'find accommodation',
+            'property search', 'rental search', 'advanced search',
+            'filter results', 'sort by', 'map view', 'list view',
+            'saved properties', 'favorite listings', 'compare properties',
+            'recently viewed', 'recommended for you', 'popular destinations',
+            'top-rated properties', 'new listings', 'last minute deals'
+        ],
+        'generic_contact_indicators': [
+            'customer service', 'customer support', 'help center',
+            'support team', 'booking support', 'contact us',
+            'help desk', 'call center', '1-800-', '1-888-', '1-877-',
+            'toll free', 'support@', 'help@', 'booking@', 'reservations@',
+            'info@', 'contact@', 'customer@', 'service@'
+        ],
+        'exclusion_reason': 'third_party_listing'
+    },
+    'b2b_service_providers': {
+        'keywords': [
+            'property management software', 'vacation rental software', 
+            'channel manager', 'pms', 'property management system',
+            'rental management platform', 'booking engine', 'reservation system',
+            'dynamic pricing', 'revenue management', 'pricing tool',
+            'cleaning management', 'maintenance software', 'guest messaging',
+            'automation tools', 'rental tools', 'property manager tools',
+            'vacation rental management', 'short term rental software',
+            'airbnb management', 'rental automation', 'hospitality software',
+            'directory of tools', 'tools and resources', 'software solutions',
+            'service provider', 'technology partner', 'integration',
+            'api', 'white label', 'enterprise solution', 'saas',
+            'subscription', 'pricing plans', 'free trial', 'demo',
+            'for property managers', 'for hosts', 'for owners'
+        ],
+        'exclusion_reason': 'b2b_service_provider'
+    },
+    'marketing_lead_gen': {
+        'keywords': [
+            'leads', 'lead generation', 'marketing services', 'seo services',
+            'website design', 'digital marketing', 'social media marketing',
+            'advertising', 'promotion', 'marketing platform', 'generate bookings',
+            'increase revenue', 'boost occupancy', 'marketing tools',
+            'listing optimization', 'rank higher', 'more visibility',
+            'marketing agency', 'consulting', 'growth services'
+        ],
+        'exclusion_reason': 'marketing_service'
+    },
+    'aggregator_listing_sites': {
+        'keywords': [
+            'compare', 'search all sites', 'aggregator', 'find deals',
+            'best prices', 'price comparison', 'all vacation rentals',
+            'search engine', 'rental search', 'compare rentals',
+            'find rentals', 'rental finder', 'vacation rental search',
+            'browse all', 'search properties', 'rental listings',
+            'property search', 'vacation search'
+        ],
+        'exclusion_reason': 'aggregator_site'
+    },
+    'actual_rental_operators': {
+        # These are the ones we WANT - actual vacation rental businesses
+        'positive_indicators': [
+            'our properties', 'our rentals', 'our vacation homes',
+            'family owned', 'locally owned', 'established', 'since',
+            'years of experience', 'personal service', 'local knowledge',
+            'property portfolio', 'rental portfolio', 'vacation homes',
+            'beach houses', 'mountain cabins', 'lake houses',
+            'contact us', 'call us', 'email us', 'visit us',
+            'based in', 'located in', 'serving', 'specializing in',
+            'luxury rentals', 'premium properties', 'exclusive rentals',
+            'hand-picked', 'carefully selected', 'curated collection',
+            'direct owner', 'property owner', 'private owner',
+            'no booking fees', 'no service fees', 'book direct',
+            'personal attention', 'concierge service', 'local host'
+        ],
+        'business_model': 'direct_rental_operator'
+    }
+})
+
+# Industry classification keywords
+INDUSTRY_KEYWORDS = freeze_keywords({
+    'vacation_rental': [
+        'vacation rental', 'holiday rental', 'vacation home', 'holiday home',
+        'short term rental', 'vacation property', 'rental property',
+        'beach house', 'cabin rental', 'cottage rental', 'villa rental',
+        'vacation accommodation', 'holiday accommodation', 'getaway',
+        'book now', 'check availability', 'nightly rate', 'per night',
+        'airbnb', 'vrbo', 'homeaway', 'booking.com', 'expedia',
+        'resort', 'lodge', 'retreat', 'bed and breakfast', 'b&b',
+        'oceanfront', 'beachfront', 'lakefront', 'mountain view',
+        'private pool', 'hot tub', 'fireplace', 'kitchen', 'wifi'
+    ],
+    'real_estate': [
+        'real estate', 'property', 'homes for sale', 'houses for sale',
+        'buy home', 'sell home', 'realtor', 'real estate agent',
+        'mls', 'multiple listing', 'property search', 'home search',
+        'mortgage', 'loan', 'financing', 'closing', 'escrow',
+        'square feet', 'sq ft', 'bedroom', 'bathroom', 'garage',
+        'lot size', 'acre', 'price reduced', 'new listing', 'sold'
+    ],
+    'dental': [
+        'dentist', 'dental', 'teeth', 'tooth', 'oral health',
+        'dental care', 'dental office', 'dental practice', 'orthodontist',
+        'oral surgeon', 'periodontist', 'endodontist', 'hygienist',
+        'cleaning', 'filling', 'crown', 'bridge', 'implant',
+        'whitening', 'braces', 'invisalign', 'root canal', 'extraction'
+    ],
+    'home_services': [
+        'plumber', 'plumbing', 'electrician', 'electrical', 'hvac',
+        'heating', 'cooling', 'air conditioning', 'contractor',
+        'construction', 'renovation', 'remodeling', 'roofing',
+        'painting', 'flooring', 'landscaping', 'cleaning service',
+        'handyman', 'repair', 'installation', 'maintenance'
+    ],
+    'legal': [
+        'lawyer', 'attorney', 'legal', 'law firm', 'legal services',
+        'personal injury', 'divorce', 'criminal defense', 'bankruptcy',
+        'estate planning', 'wills', 'probate', 'litigation',
+        'consultation', 'legal advice', 'court', 'settlement'
+    ],
+    'financial': [
+        'bank', 'banking', 'credit union', 'financial', 'loan',
+        'mortgage', 'insurance', 'investment', 'financial advisor',
+        'accounting', 'tax', 'cpa', 'bookkeeping', 'payroll',
+        'retirement', '401k', 'ira', 'wealth management', 'portfolio'
+    ],
+    'restaurant_food': [
+        'restaurant', 'cafe', 'bar', 'dining', 'menu', 'food',
+        'catering', 'delivery', 'takeout', 'reservation', 'chef',
+        'cuisine', 'breakfast', 'lunch', 'dinner', 'pizza',
+        'burger', 'coffee', 'bakery', 'deli', 'grill'
+    ],
+    'healthcare_medical': [
+        'doctor', 'physician', 'medical', 'clinic', 'hospital',
+        'health', 'patient', 'appointment', 'treatment', 'surgery',
+        'therapy', 'diagnosis', 'prescription', 'insurance',
+        'medicare', 'medicaid', 'emergency', 'urgent care'
+    ]
+})
+
+# NEW: Enhanced vacation rental business model classification
+ENHANCED_VR_BUSINESS_MODELS = freeze_keywords({
+    'direct_owner_small': {
+        'keywords': [
+            'our property', 'our home', 'our cabin', 'our cottage', 'our villa',
+            'my property', 'my home', 'my cabin', 'family owned', 'family vacation home',
+            'personal vacation', 'private owner', 'owner direct', 'by owner',
+            'no booking fees', 'book direct and save', 'family retreat',
+            'our beach house', 'our mountain home', 'our lake house',
+            'we purchased', 'we bought', 'we renovated', 'we built'
+        ],
+        'property_count_indicators': ['property', 'home', 'house', 'cabin', 'cottage'],
+        'property_range': (1, 5),
+        'is_target': True,
+        'priority': 'high'
+    },
+    'direct_owner_medium': {
+        'keywords': [
+            'our properties', 'our homes', 'our rentals', 'portfolio',
+            'collection of homes', 'several properties', 'multiple locations',
+            'expanding our', 'growing portfolio', 'newest addition',
+            'properties include', 'locations include', 'we own',
+            'investment properties', 'rental portfolio'
+        ],
+        'property_count_indicators': ['properties', 'homes', 'rentals', 'units'],
+        'property_range': (6, 15),
+        'is_target': True,
+        'priority': 'high'
+    },
+    'property_manager_small': {
+        'keywords': [
+            'we manage', 'professionally managed', 'management services',
+            'local property management', 'property care', 'full service management',
+            'locally owned and operated', 'boutique property management',
+            'personalized management', 'hands-on management', 'dedicated team',
+            'small company', 'local company', 'family business',
+            'select properties', 'curated collection', 'hand-picked homes'
+        ],
+        'property_count_indicators': ['manage', 'managing', 'portfolio', 'properties under management'],
+        'property_range': (10, 50),
+        'is_target': True,
+        'priority': 'high'
+    },
+    'property_manager_medium': {
+        'keywords': [
+            'professional property management', 'established management company',
+            'regional leader', 'growing management', 'multiple office locations',
+            'expanding portfolio', 'acquisitions', 'new markets',
+            'management team', 'property managers', 'experienced staff',
+            'comprehensive management', 'full-service company'
+        ],
+        'property_count_indicators': ['properties', 'units', 'rentals', 'homes under management'],
+        'property_range': (51, 200),
+        'is_target': True,
+        'priority': 'medium'
+    },
+    'property_manager_large': {
+        'keywords': [
+            'nationwide', 'multiple states', 'corporate', 'enterprise',
+            'leading property management', 'largest', 'hundreds of properties',
+            'institutional', 'corporate housing', 'investor relations',
+            'publicly traded', 'franchise', 'multi-state operations'
+        ],
+        'property_count_indicators': ['properties', 'units', 'locations'],
+        'property_range': (201, 10000),
+        'is_target': False,
+        'priority': 'exclude',
+        'exclusion_reason': 'too_large'
+    },
+    'listing_platform_small': {
+        'keywords': [
+            'local directory', 'area listings', 'regional marketplace',
+            'find rentals in', 'search properties', 'browse homes',
+            'list your property', 'add your rental', 'featured listings',
+            'local vacation rentals', 'area vacation homes'
+        ],
+        'url_patterns': ['/search', '/listings', '/browse', '/find'],
+        'is_target': True,  # They might want to upgrade to a booking platform
+        'priority': 'medium'
+    },
+    'listing_platform_large': {
+        'keywords': [
+            'airbnb', 'vrbo', 'homeaway', 'booking.com', 'expedia',
+            'thousands of properties', 'millions of listings', 'global marketplace',
+            'book your next', 'compare prices', 'instant booking',
+            'traveler reviews', 'verified properties', 'secure booking'
+        ],
+        'is_target': False,
+        'priority': 'exclude',
+        'exclusion_reason': 'marketplace_platform'
+    },
+    'software_provider': {
+        'keywords': [
+            'property management software', 'pms', 'saas', 'booking engine',
+            'channel manager', 'vacation rental software', 'automation',
+            'api', 'integration', 'white label', 'pricing plans',
+            'free trial', 'demo', 'features', 'solutions for',
+            'tools for property managers', 'software for', 'platform for'
+        ],
+        'is_target': False,
+        'priority': 'exclude',
+        'exclusion_reason': 'b2b_software'
+    },
+    'marketing_agency': {
+        'keywords': [
+            'marketing services', 'seo for vacation rentals', 'listing optimization',
+            'increase bookings', 'digital marketing', 'social media management',
+            'content creation', 'photography services', 'virtual tours',
+            'lead generation', 'advertising services', 'promotion'
+        ],
+        'is_target': False,
+        'priority': 'exclude',
+        'exclusion_reason': 'marketing_service'
+    }
+})
+
+
+class VRModel(namedtuple('VRModel', 'name keywords pattern indicators property_range is_target priority exclusion_reason')):
+    """Enhanced VR business model frozen into a flat record; property_range is packed as (lo << 32) | hi"""
+    __slots__ = ()
+
+    def covers(self, count):
+        return self.property_range != 0 and (self.property_range >> 32) <= count <= (self.property_range & 0xFFFFFFFF)
+
+
+def freeze_vr_models(models):
+    """Build the tuple of VRModel records the classifier iterates instead of the nested dicts"""
+    frozen = []
+    for name, info in models.items():
+        keywords = info.get('keywords', ())
+        lo, hi = info.get('property_range', (0, 0))
+        frozen.append(VRModel(
+            name=name,
+            keywords=keywords,
+            pattern=re.compile('|'.join(map(re.escape, keywords))) if keywords else None,
+            indicators=frozenset(info.get('property_count_indicators', ())),
+            property_range=(lo << 32) | hi,
+            is_target=info.get('is_target', False),
+            priority=info.get('priority', 'low'),
+            exclusion_reason=info.get('exclusion_reason'),
+        ))
+    return tuple(frozen)
+
+
+VR_MODELS = freeze_vr_models(ENHANCED_VR_BUSINESS_MODELS)
+
+# NEW: Decision maker accessibility indicators
+DECISION_MAKER_INDICATORS = freeze_keywords({
+    'high_accessibility': {
+        'patterns': [
+            r'\b(call|contact|text)\s+\w+\s+(directly|personally)',
+            r'owner[\s\-]?(direct|operated)',
+            r'ask for \w+',
+            r'speak (to|with) \w+',
+            r'\w+@[a-zA-Z0-9-]+\.[a-zA-Z]{2,}',  # Personal email (firstname@domain)
+            r'my (name is|cell|phone|direct)',
+            r'I (started|founded|own|manage)',
+            r'(family|locally) owned and operated'
+        ],
+        'keywords': [
+            'owner direct', 'call me', 'text me', 'personally manage',
+            'family owned', 'owner operated', 'ask for', 'speak to',
+            'direct line', 'cell phone', 'mobile number', 'personal service'
+        ],
+        'negative_keywords': [
+            'corporate', 'headquarters', 'investor relations', 'press inquiries',
+            'human resources', 'legal department', 'compliance'
+        ]
+    },
+    'low_accessibility': {
+        'keywords': [
+            'corporate office', 'headquarters', 'investor relations',
+            'press inquiries', 'media contact', 'hr department',
+            'legal counsel', 'board of directors', 'shareholders',
+            'publicly traded', 'stock symbol', 'sec filings'
+        ],
+        'email_patterns': ['info@', 'contact@', 'support@', 'hello@', 'admin@']
+    }
+})
+
+# Indicator strings reported for matched decision maker keywords
+DECISION_MAKER_KEYWORD_LABELS = label_keywords('Keyword', DECISION_MAKER_INDICATORS['high_accessibility']['keywords'])
+DECISION_MAKER_NEGATIVE_LABELS = label_keywords('Negative', DECISION_MAKER_INDICATORS['high_accessibility']['negative_keywords'])
+DECISION_MAKER_CORPORATE_LABELS = label_keywords('Corporate indicator', DECISION_MAKER_INDICATORS['low_accessibility']['keywords'])
+
+# NEW: Website quality and upgrade need indicators
+WEBSITE_QUALITY_INDICATORS = freeze_keywords({
+    'needs_upgrade': {
+        'technical': [
+            'last updated', 'under construction', 'coming soon',
+            'best viewed in internet explorer', 'requires flash',
+            'site best viewed at', 'enable javascript', 'frames version',
+            'text only version', 'low bandwidth version'
+        ],
+        'functional': [
+            'email for availability', 'call for rates', 'contact for pricing',
+            'inquire about dates', 'check availability by phone',
+            'no online booking', 'email to reserve', 'call to book',
+            'fax your request', 'mail check', 'money order accepted'
+        ],
+        'design': [
+            'welcome to my website', 'thanks for visiting', 'you are visitor number',
+            'page counter', 'guestbook', 'sign my guestbook', 'web ring',
+            'site map', 'frames', 'table layout', 'animated gif',
+            'under construction gif', 'spinning logo', 'marquee text'
+        ],
+        'age_patterns': [
+            r'copyright\s*(?:©)?\s*(\d{4})',  # Old copyright years
+            r'last\s*updated?\s*:?\s*(\d{4})',
+            r'(?:established|since|founded)\s*:?\s*(\d{4})'
+        ]
+    },
+    'modern_indicators': {
+        'technical': [
+            'mobile responsive', 'ssl secure', 'instant booking',
+            'real-time availability', 'online payment', 'secure checkout',
+            'api integration', 'channel sync', 'dynamic pricing'
+        ],
+        'platforms': [
+            'wordpress 5', 'react', 'vue', 'angular', 'next.js',
+            'gatsby', 'jamstack', 'headless cms', 'graphql'
+        ]
+    }
+})
+
+# Indicator strings reported for matched upgrade keywords
+UPGRADE_TECHNICAL_LABELS = label_keywords('Technical issue', WEBSITE_QUALITY_INDICATORS['needs_upgrade']['technical'])
+UPGRADE_FUNCTIONAL_LABELS = label_keywords('Functional limitation', WEBSITE_QUALITY_INDICATORS['needs_upgrade']['functional'])
+UPGRADE_DESIGN_LABELS = label_keywords('Design issue', WEBSITE_QUALITY_INDICATORS['needs_upgrade']['design'])
+
+# NEW: Property count detection patterns
+PROPERTY_COUNT_PATTERNS = freeze_keywords([
+    # Specific numbers
+    (r'(\d+)\s*(?:properties|homes|rentals|units|cabins|cottages|villas|condos)', 'exact'),
+    (r'(?:manage|managing|own|offer)\s*(\d+)', 'exact'),
+    (r'portfolio of\s*(\d+)', 'exact'),
+    (r'(\d+)\s*vacation\s*(?:homes|properties|rentals)', 'exact'),
+
+    # Ranges
+    (r'(\d+)\s*(?:to|-)\s*(\d+)\s*(?:properties|homes|rentals)', 'range'),
+    (r'between\s*(\d+)\s*and\s*(\d+)', 'range'),
+
+    # Descriptive
+    (r'dozens of properties', 'dozens'),
+    (r'hundreds of properties', 'hundreds'),
+    (r'thousands of properties', 'thousands'),
+    (r'handful of properties', 'handful'),
+    (r'few select properties', 'few'),
+    (r'multiple properties', 'multiple'),
+    (r'several properties', 'several')
+])
+
+# NEW: Geographic scope patterns
+GEOGRAPHIC_SCOPE_PATTERNS = freeze_keywords({
+    'local': {
+        'keywords': ['local', 'locally owned', 'serving [city]', 'in [city]', 
+                   'area', 'neighborhood', 'community', 'hometown'],
+        'patterns': [r'serving\s+\w+\s*(?:area|region|community)'],
+        'scope_score': 1
+    },
+    'regional': {
+        'keywords': ['regional', 'multiple cities', 'throughout [state]', 
+                   'across [state]', 'statewide', '[state] properties'],
+        'patterns': [r'(?:throughout|across)\s+\w+'],
+        'scope_score': 2
+    },
+    'national': {
+        'keywords': ['nationwide', 'national', 'coast to coast', 
+                   'multiple states', 'across america', 'usa wide'],
+        'patterns': [r'(?:nationwide|national|multiple states)'],
+        'scope_score': 3
+    },
+    'international': {
+        'keywords': ['international', 'global', 'worldwide', 
+                   'multiple countries', 'globally'],
+        'patterns': [r'(?:international|global|worldwide)'],
+        'scope_score': 4
+    }
+})
+
+# NEW: Industry-specific patterns for vacation rentals
+VR_INDUSTRY_PATTERNS = freeze_keywords({
+    'beach': {
+        'keywords': ['beach', 'ocean', 'oceanfront', 'beachfront', 'coastal',
+                   'seaside', 'shore', 'gulf', 'atlantic', 'pacific',
+                   'sand', 'surf', 'waves', 'tides', 'dunes'],
+        'seasonal_indicators': ['summer rentals', 'spring break', 'off-season rates'],
+        'amenity_keywords': ['beach access', 'ocean view', 'beach chairs', 'umbrellas']
+    },
+    'mountain': {
+        'keywords': ['mountain', 'ski', 'alpine', 'cabin', 'chalet',
+                   'elevation', 'peaks', 'slopes', 'trails', 'hiking',
+                   'ski-in', 'ski-out', 'lodge', 'retreat'],
+        'seasonal_indicators': ['ski season', 'summer hiking', 'fall colors'],
+        'amenity_keywords': ['hot tub', 'fireplace', 'ski storage', '4wd required']
+    },
+    'lake': {
+        'keywords': ['lake', 'lakefront', 'waterfront', 'dock', 'boat',
+                   'fishing', 'swimming', 'water sports', 'marina'],
+        'seasonal_indicators': ['summer season', 'boating season'],
+        'amenity_keywords': ['private dock', 'boat launch', 'fishing gear', 'kayaks']
+    },
+    'urban': {
+        'keywords': ['downtown', 'city center', 'metro', 'urban', 'walkable',
+                   'transit', 'nightlife', 'restaurants', 'shopping'],
+        'seasonal_indicators': ['event pricing', 'convention rates'],
+        'amenity_keywords': ['parking included', 'walk to', 'public transit', 'wifi']
+    },
+    'rural': {
+        'keywords': ['country', 'rural', 'farm', 'ranch', 'secluded',
+                   'private', 'acres', 'peaceful', 'quiet', 'nature'],
+        'seasonal_indicators': ['harvest season', 'hunting season'],
+        'amenity_keywords': ['acreage', 'privacy', 'wildlife', 'stargazing']
+    }
+})
+
+# Regex tables compiled once - the classifiers run them on every page
+# Numeric property-count patterns need regex captures; the descriptive ones are literal
+# phrases, looked up in the shared keyword scan and mapped to an estimated count
+PROPERTY_COUNT_REGEXES = tuple((re.compile(pattern), pattern_type) for pattern, pattern_type in PROPERTY_COUNT_PATTERNS
+                               if pattern_type in ('exact', 'range'))
+PROPERTY_COUNT_ESTIMATES = MappingProxyType({
+    'handful': 3, 'few': 5, 'several': 8, 'multiple': 12,
+    'dozens': 36, 'hundreds': 200, 'thousands': 2000
+})
+PROPERTY_COUNT_PHRASES = tuple((phrase, PROPERTY_COUNT_ESTIMATES.get(pattern_type, 10)) for phrase, pattern_type in PROPERTY_COUNT_PATTERNS
+                               if pattern_type not in ('exact', 'range'))
+DECISION_MAKER_PATTERNS = PatternSetMatcher(DECISION_MAKER_INDICATORS['high_accessibility']['patterns'])
+PERSONAL_PHONE_RE = re.compile(r'(cell|mobile|direct|personal)', re.IGNORECASE)
+# Generic mailbox prefixes ('info@', ...) - an address is generic when its local part + '@' ends with one
+GENERIC_EMAIL_PREFIXES = tuple(DECISION_MAKER_INDICATORS['low_accessibility']['email_patterns'])
+# All age patterns as one alternation - each keeps its own year group, so one findall
+# returns tuples with the year in the slot of the pattern that matched
+WEBSITE_AGE_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in WEBSITE_QUALITY_INDICATORS['needs_upgrade']['age_patterns']),
+                            re.IGNORECASE)
+GEOGRAPHIC_SCOPE_REGEXES = MappingProxyType({
+    scope: compile_patterns(data['patterns']) for scope, data in GEOGRAPHIC_SCOPE_PATTERNS.items()
+})
+
+# Rental page structure: one class-name regex for a single DOM traversal, then the
+# per-section patterns (with the tags each applies to) to bucket the matched elements
+RENTAL_STRUCTURE_SECTIONS = (
+    ('property', ('div', 'section'), re.compile(r'property|rental|accommodation|listing|details|features|amenities', re.I)),
+    ('rate', ('table', 'div'), re.compile(r'rate|price|tariff', re.I)),
+    ('calendar', ('div', 'table', 'iframe'), re.compile(r'calendar|availability|booking|schedule', re.I)),
+    ('gallery', ('div', 'section'), re.compile(r'gallery|photos|images|slideshow', re.I)),
+)
+RENTAL_STRUCTURE_TAGS = sorted({tag for _, tags, _ in RENTAL_STRUCTURE_SECTIONS for tag in tags})
+RENTAL_STRUCTURE_CLASS_RE = re.compile('|'.join(pattern.pattern for _, _, pattern in RENTAL_STRUCTURE_SECTIONS), re.I)
+
+# Extraction and detection patterns - compiled once at import instead of per call
+BEDROOM_RE = re.compile(r'\b(\d+)\s*(?:bed|br|bedroom)')
+BATHROOM_RE = re.compile(r'\b(\d+)\s*(?:bath|ba|bathroom)')
+# Street address, "located at ..." or "address: ..." - one alternation, searched once
+PROPERTY_ADDRESS_RE = re.compile(r'\d+\s+\w+\s+(?:street|st|avenue|ave|road|rd|drive|dr)'
+                                 r'|located at\s+[\w\s,]+'
+                                 r'|address:\s*[\w\s,]+', re.I)
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+US_PHONE_RE = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+PHONE_REGEXES = compile_patterns([
+    r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b',  # US format
+    r'\(\d{3}\)\s?\d{3}[-.\s]?\d{4}',      # (123) 456-7890
+    r'\b\d{3}\.\d{3}\.\d{4}\b',            # 123.456.7890
+    r'\+\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}',  # International
+], flags=0)
+ADDRESS_REGEXES = compile_patterns([
+    # Street address patterns
+    r'\d+\s+[A-Za-z0-9\s,.-]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Court|Ct|Place|Pl)\s*,?\s*[A-Za-z\s]+,?\s*[A-Z]{2}\s+\d{5}',
+    r'\d+\s+[A-Za-z0-9\s,.-]+,\s*[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}',
+    # PO Box patterns
+    r'P\.?O\.?\s+Box\s+\d+,?\s*[A-Za-z\s]+,?\s*[A-Z]{2}\s+\d{5}',
+])
+CONTACT_SECTION_CLASS_RE = re.compile(r'contact|address|location', re.I)
+CITY_REGEXES = compile_patterns([
+    r'\bin\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b',
+    r'\blocated\s+in\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b',
+    r'\bserving\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b',
+    r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*[A-Z]{2}\b'
+], flags=0)
+LOCAL_AREA_REGEXES = compile_patterns([
+    r'\bdowntown\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b',
+    r'\bnear\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b',
+    r'\bclose\s+to\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b',
+    r'\bminutes\s+from\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b',
+    r'\bin\s+the\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+area\b',
+    r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+neighborhood\b'
+])
+SERVICE_AREA_REGEXES = compile_patterns([
+    r'\bserving\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?(?:,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)*)\b',
+    r'\bwe\s+serve\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?(?:,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)*)\b',
+    r'\bavailable\s+in\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?(?:,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)*)\b',
+    r'\bdelivering\s+to\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?(?:,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)*)\b'
+])
+BUSINESS_HOURS_REGEXES = compile_patterns([
+    r'(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*[:\s-]*\s*\d{1,2}[:\s]*\d{0,2}\s*(?:am|pm|a\.m\.|p\.m\.)?[\s-]*\d{1,2}[:\s]*\d{0,2}\s*(?:am|pm|a\.m\.|p\.m\.)?',
+    r'hours?\s*:?\s*\d{1,2}[:\s]*\d{0,2}\s*(?:am|pm|a\.m\.|p\.m\.)?[\s-]*\d{1,2}[:\s]*\d{0,2}\s*(?:am|pm|a\.m\.|p\.m\.)?',
+    r'open\s*:?\s*\d{1,2}[:\s]*\d{0,2}\s*(?:am|pm|a\.m\.|p\.m\.)?[\s-]*\d{1,2}[:\s]*\d{0,2}\s*(?:am|pm|a\.m\.|p\.m\.)?'
+], flags=re.IGNORECASE | re.MULTILINE)
+# "<number> employees / team members / staff" in one pass; the unit is the last group that matched (3-5) and
+# ranks in that order - the first positive count of the best-ranked unit found wins.
+# "over/more than N employees" always contains "N employees", so needs no pattern of its own
+EMPLOYEE_COUNT_RE = re.compile(r'(\d+),?(\d+)?\+?\s*(?:(employees)|(team members)|(staff))', re.IGNORECASE)
+LOCATION_COUNT_RE = re.compile(r'(\d+)\s*(?:offices?|locations?|branches?|stores?|facilities|countries|states)', re.IGNORECASE)
+# Throwaway or placeholder addresses left out of the extracted emails
+PLACEHOLDER_EMAIL_RE = re.compile('noreply|donotreply|example|test|spam')
+HIDDEN_STYLE_RE = re.compile(r'display:\s*none|visibility:\s*hidden')
+# Raw-markup prefilter for the hacked-page element checks: a hidden style or a suspicious
+# script term has to appear in the bytes for any hidden element, script or iframe to count
+HACKED_MARKUP_RE = re.compile(rb'(?i:eval\(|base64|fromcharcode|unescape)|display:\s*none|visibility:\s*hidden')
+# Obfuscation terms in a script body; ASCII case folding matches exactly what lower() + `in` found
+SUSPICIOUS_SCRIPT_RE = re.compile(r'eval\(|base64|fromcharcode|unescape', re.I | re.A)
+CONTENT_LANGUAGE_RE = re.compile('content-language', re.I)
+# Embed hosts whose hidden iframes are not counted as injections
+SAFE_IFRAME_SRC_RE = re.compile('youtube|vimeo|google|facebook')
+# Letters counted by detect_website_language() on all-ASCII pages
+ASCII_LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+ASCII_LETTER_BYTES = ASCII_LETTERS.encode('ascii')
+# Writing systems scored by detect_website_language(): language -> inclusive code point ranges
+LANGUAGE_SCRIPT_RANGES = MappingProxyType({
+    'chinese': ((0x4E00, 0x9FFF),),  # CJK Unified Ideographs
+    'japanese': ((0x3040, 0x309F), (0x30A0, 0x30FF)),  # Hiragana and Katakana
+    'arabic': ((0x0600, 0x06FF),),  # Arabic
+    'russian': ((0x0400, 0x04FF),),  # Cyrillic
+})
+# Redirect targets that don't count as a hijack: these domains and their subdomains
+TRUSTED_REDIRECT_DOMAINS = frozenset(['google.com', 'facebook.com', 'microsoft.com', 'cloudflare.com'])
+TRUSTED_REDIRECT_SUFFIXES = tuple('.' + domain for domain in TRUSTED_REDIRECT_DOMAINS)
+
+# Marketplace page widgets: (widget, tags it applies to or None for any tag, class-name pattern).
+# One combined class regex finds the candidates in a single traversal, then each is bucketed.
+# Per-widget lxml XPath counts (contains() over translate(@class)) benchmark several times slower
+MARKETPLACE_WIDGETS = (
+    ('booking_form', ('form',), re.compile(r'book|reserv|avail', re.I)),
+    ('calendar', None, re.compile(r'calendar|datepicker|availability', re.I)),
+    ('review', None, re.compile(r'review|rating|feedback', re.I)),
+    ('gallery', None, re.compile(r'gallery|slideshow|carousel|photo', re.I)),
+    ('amenity', None, re.compile(r'amenity|amenities|feature', re.I)),
+    ('price', None, re.compile(r'price|rate|cost|fee', re.I)),
+    ('host', None, re.compile(r'host|owner|manager', re.I)),
+    ('similar', None, re.compile(r'similar|related|recommend', re.I)),
+    ('map', ('iframe', 'div'), re.compile(r'map|location', re.I)),
+)
+MARKETPLACE_CLASS_RE = re.compile('|'.join(pattern.pattern for _, _, pattern in MARKETPLACE_WIDGETS), re.I)
+# Known listing platforms: names looked for in a page's URL, and branding phrases in its text
+LISTING_PLATFORM_DOMAINS = freeze_keywords([
+    'airbnb', 'vrbo', 'booking', 'expedia', 'tripadvisor', 'homeaway',
+    'vacasa', 'turnkey', 'awaze', 'novasol', 'rentals.com', 'flipkey',
+    'redawning', 'vacationrenter', 'hometogo', 'rentbyowner',
+    'holidaylettings', 'homelidays', 'wimdu', 'citybase', 'uktvillas',
+    'villasofthepworld', 'luxuryretreats', 'onefinestay', 'sonder',
+    'vacationhomerentals', 'beachhouse', 'mountaincabingetaway'
+])
+LISTING_PLATFORM_BRANDING = freeze_keywords([
+    'airbnb', 'vrbo', 'booking.com',
+    'tripadvisor', 'homeaway', 'vacasa',
+    'listed on', 'featured on', 'available on', 'book through',
+    'reserve on', 'property management by', 'managed by'
+])
+# Property specification words whose presence marks a listing-style page
+MARKETPLACE_SPEC_KEYWORDS = freeze_keywords(['bed', 'bath', 'sleep', 'guest', 'sqft', 'sq ft'])
+
+
+def scan_dom(soup):
+    """Collect the page-structure facts the upgrade and rental-structure checks need in one tree walk"""
+    dom = {
+        'has_form_or_button': False,
+        'has_viewport': False,
+        'has_frames': False,
+        'tables': 0,
+        'layout_tables': 0,
+        'sections': Counter(),
+        'img_alts': [],
+    }
+    tables = []
+    headed_tables = set()
+    for tag in soup.find_all(True):
+        name = tag.name
+        if name in ('form', 'button'):
+            dom['has_form_or_button'] = True
+        elif name == 'meta':
+            if tag.get('name') == 'viewport':
+                dom['has_viewport'] = True
+        elif name in ('frame', 'frameset'):
+            dom['has_frames'] = True
+        elif name == 'table':
+            tables.append(tag)
+        elif name == 'th':
+            headed_tables.update(id(parent) for parent in tag.parents if parent.name == 'table')
+        elif name == 'img':
+            dom['img_alts'].append(tag.get('alt', '').lower())
+        
+        if name in RENTAL_STRUCTURE_TAGS and tag.get('class'):
+            classes = ' '.join(tag['class'])
+            if RENTAL_STRUCTURE_CLASS_RE.search(classes):
+                for section, section_tags, pattern in RENTAL_STRUCTURE_SECTIONS:
+                    if name in section_tags and pattern.search(classes):
+                        dom['sections'][section] += 1
+    
+    dom['tables'] = len(tables)
+    dom['layout_tables'] = sum(1 for table in tables if id(table) not in headed_tables)
+    return dom
+
+
+def count_marketplace_widgets(soup):
+    """Number of elements per MARKETPLACE_WIDGETS entry, from one class-filtered traversal"""
+    counts = Counter()
+    for tag in soup.find_all(class_=MARKETPLACE_CLASS_RE):
+        classes = ' '.join(tag.get('class', ()))
+        for widget, widget_tags, pattern in MARKETPLACE_WIDGETS:
+            if (widget_tags is None or tag.name in widget_tags) and pattern.search(classes):
+                counts[widget] += 1
+    return counts
+
+
+def scan_page_features(soup):
+    """Collect the scripts, iframes and hidden div/span elements detect_hacked_website checks in one traversal"""
+    features = {
+        'scripts': [],
+        'iframes': [],
+        'hidden_elements': [],
+    }
+    # find_all(True) filtered here is cheaper than bs4's per-tag matching of a name list
+    for tag in soup.find_all(True):
+        name = tag.name
+        if name == 'script':
+            features['scripts'].append(tag)
+        elif name == 'iframe':
+            features['iframes'].append(tag)
+        elif name in ('div', 'span'):
+            if HIDDEN_STYLE_RE.search(tag.get('style', '')):
+                features['hidden_elements'].append(tag)
+    return features
+
+
+def scan_element_counts(soup):
+    """Tag counts plus the link, stylesheet and list-item figures the website-size metrics need, in one tree walk"""
+    counts = {
+        'tags': Counter(),
+        'internal_links': 0,
+        'script_sources': 0,
+        'stylesheets': 0,
+        'navigation_items': 0,
+    }
+    tags = counts['tags']
+    for tag in soup.find_all(True):
+        name = tag.name
+        tags[name] += 1
+        if name == 'a':
+            href = tag.get('href')
+            if href is not None and (href.startswith('/') or not href.startswith('http')):
+                counts['internal_links'] += 1
+        elif name == 'script':
+            if tag.get('src') is not None:
+                counts['script_sources'] += 1
+        elif name == 'link':
+            if 'stylesheet' in (tag.get('rel') or ()):
+                counts['stylesheets'] += 1
+        elif name == 'li':
+            # each enclosing nav/ul/ol counts it once, like a find_all('li') per list element
+            counts['navigation_items'] += sum(1 for parent in tag.parents if parent.name in ('nav', 'ul', 'ol'))
+    return counts
+
+
+def scan_dom_stream(content):
+    """scan_dom() straight from the response bytes with lxml iterparse - no tree is built.
+
+    Elements are cleared as soon as they close. Returns None when lxml is missing or the body does not parse.
+    """
+    if lxml_html is None:
+        return None
+    dom = {
+        'has_form_or_button': False,
+        'has_viewport': False,
+        'has_frames': False,
+        'tables': 0,
+        'layout_tables': 0,
+        'sections': Counter(),
+        'img_alts': [],
+    }
+    open_tables = []  # per enclosing <table>: has a <th> been seen inside it
+    try:
+        for event, element in lxml_etree.iterparse(BytesIO(content), events=('start', 'end'), html=True):
+            name = element.tag
+            if event == 'end':
+                if name == 'table' and open_tables and not open_tables.pop():
+                    dom['layout_tables'] += 1
+                element.clear(keep_tail=True)
+                continue
+            
+            if name in ('form', 'button'):
+                dom['has_form_or_button'] = True
+            elif name == 'meta':
+                if element.get('name') == 'viewport':
+                    dom['has_viewport'] = True
+            elif name in ('frame', 'frameset'):
+                dom['has_frames'] = True
+            elif name == 'table':
+                dom['tables'] += 1
+                open_tables.append(False)
+            elif name == 'th':
+                open_tables[:] = [True] * len(open_tables)
+            elif name == 'img':
+                dom['img_alts'].append(element.get('alt', '').lower())
+            
+            if name in RENTAL_STRUCTURE_TAGS:
+                classes = element.get('class')
+                if classes and RENTAL_STRUCTURE_CLASS_RE.search(classes):
+                    for section, section_tags, pattern in RENTAL_STRUCTURE_SECTIONS:
+                        if name in section_tags and pattern.search(classes):
+                            dom['sections'][section] += 1
+    except lxml_etree.LxmlError:
+        return None
+    return dom
+
+# Content phrases scored by the enhanced VR classification
+ACTUAL_RENTAL_PHRASES = freeze_keywords([
+    # Ownership indicators
+    'our vacation rental', 'our property', 'our home', 'our beach house',
+    'our cabin', 'our cottage', 'we own', 'property we manage',
+    'welcome to our', 'stay at our', 'rent our', 'book our',
+
+    # Direct booking language
+    'book directly with us', 'book direct', 'no booking fees',
+    'contact us directly', 'call us to book', 'email for rates',
+    'check our calendar', 'see availability', 'reserve now',
+
+    # Property descriptions
+    'sleeps', 'bedrooms', 'bathrooms', 'square feet', 'accommodates',
+    'fully equipped kitchen', 'private pool', 'ocean view', 'mountain view',
+    'walking distance', 'minutes from', 'located in', 'situated on',
+
+    # Amenities lists
+    'amenities include', 'features include', 'property features',
+    'what we offer', 'included in your stay', 'guest access',
+
+    # Rates and policies
+    'nightly rate', 'weekly rate', 'seasonal rates', 'minimum stay',
+    'cleaning fee', 'security deposit', 'cancellation policy',
+    'house rules', 'check-in time', 'check-out time',
+
+    # Local host indicators
+    'your host', 'meet your host', 'about us', 'why choose us',
+    'local recommendations', 'area guide', 'things to do',
+    'we recommend', 'our favorite', 'local tips'
+])
+
+LISTING_PLATFORM_PHRASES = freeze_keywords([
+    # Search functionality
+    'search properties', 'find rentals', 'browse listings',
+    'filter results', 'sort by price', 'map view',
+    'search by location', 'advanced search', 'refine search',
+
+    # Multiple properties language
+    'thousands of properties', 'hundreds of rentals',
+    'properties worldwide', 'rentals in multiple',
+    'compare properties', 'similar listings',
+
+    # Platform features
+    'list your property', 'become a host', 'host dashboard',
+    'traveler reviews', 'verified properties', 'trust and safety',
+    'secure payments', 'booking protection', '24/7 support',
+
+    # Aggregator language
+    'best prices guaranteed', 'price match', 'deals from',
+    'compare rates', 'lowest prices', 'exclusive deals'
+])
+
+def build_property_type_weights(patterns_by_type):
+    """keyword -> (type index, weight, scored per occurrence) entries, so the classifier only visits keywords the page contains"""
+    weights = {}
+    for type_index, patterns in enumerate(patterns_by_type.values()):
+        for field, weight, per_occurrence in (('keywords', 3, True),
+                                              ('seasonal_indicators', 5, False),
+                                              ('amenity_keywords', 4, False)):
+            for keyword in patterns[field]:
+                weights.setdefault(keyword, []).append((type_index, weight, per_occurrence))
+    return MappingProxyType({keyword: tuple(entries) for keyword, entries in weights.items()})
+
+
+VR_PROPERTY_TYPES = tuple(VR_INDUSTRY_PATTERNS)
+VR_PROPERTY_TYPE_WEIGHTS = build_property_type_weights(VR_INDUSTRY_PATTERNS)
+
+# Extra direct-operator signals in the business model classification
+DIRECT_OPERATOR_PROPERTY_TYPES = freeze_keywords(['beach house', 'mountain cabin', 'lake house', 'ski chalet', 'downtown condo'])
+DIRECT_OPERATOR_LOCATION_PHRASES = freeze_keywords(['located in', 'based in', 'serving', 'minutes from', 'close to', 'near'])
+
+# Country detection patterns for location extraction
+COUNTRY_PATTERNS = freeze_keywords({
+    'United States': {
+        'patterns': [
+            r'\b(?:USA|United States|US|America)\b',
+            r'\b[A-Z]{2}\s+\d{5}(?:-\d{4})?\b',  # US ZIP codes
+            # The lookaheads only let the long code alternations run where a code could start
+            r'\b(?=[A-Z]{2}\s+\d)(?:AL|AK|AZ|AR|CA|CO|CT|DE|FL|GA|HI|ID|IL|IN|IA|KS|KY|LA|ME|MD|MA|MI|MN|MS|MO|MT|NE|NV|NH|NJ|NM|NY|NC|ND|OH|OK|OR|PA|RI|SC|SD|TN|TX|UT|VT|VA|WA|WV|WI|WY)\s+\d{5}\b',
+        ],
+        'indicators': ['USD', 'dollars', 'ZIP', 'state', 'county'],
+        'states': ['Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado', 'Connecticut', 'Delaware', 'Florida', 'Georgia', 'Hawaii', 'Idaho', 'Illinois', 'Indiana', 'Iowa', 'Kansas', 'Kentucky', 'Louisiana', 'Maine', 'Maryland', 'Massachusetts', 'Michigan', 'Minnesota', 'Mississippi', 'Missouri', 'Montana', 'Nebraska', 'Nevada', 'New Hampshire', 'New Jersey', 'New Mexico', 'New York', 'North Carolina', 'North Dakota', 'Ohio', 'Oklahoma', 'Oregon', 'Pennsylvania', 'Rhode Island', 'South Carolina', 'South Dakota', 'Tennessee', 'Texas', 'Utah', 'Vermont', 'Virginia', 'Washington', 'West Virginia', 'Wisconsin', 'Wyoming']
+    },
+    'Canada': {
+        'patterns': [
+            r'\bCanada\b',
+            r'\b[A-Z]\d[A-Z]\s*\d[A-Z]\d\b',  # Canadian postal codes
+            r'\b(?=[A-Z]{2}\b)(?:AB|BC|MB|NB|NL|NS|NT|NU|ON|PE|QC|SK|YT)\b',
+        ],
+        'indicators': ['CAD', 'Canadian', 'province', 'postal code'],
+        'provinces': ['Alberta', 'British Columbia', 'Manitoba', 'New Brunswick', 'Newfoundland and Labrador', 'Northwest Territories', 'Nova Scotia', 'Nunavut', 'Ontario', 'Prince Edward Island', 'Quebec', 'Saskatchewan', 'Yukon']
+    },
+    'United Kingdom': {
+        'patterns': [
+            r'\b(?:UK|United Kingdom|Britain|England|Scotland|Wales|Northern Ireland)\b',
+            r'\b[A-Z]{1,2}\d[A-Z\d]?\s*\d[A-Z]{2}\b',  # UK postcodes
+        ],
+        'indicators': ['£', 'GBP', 'pounds', 'postcode', 'shire', 'county'],
+        'regions': ['England', 'Scotland', 'Wales', 'Northern Ireland']
+    },
+    'Australia': {
+        'patterns': [
+            r'\bAustralia\b',
+            r'\b\d{4}\s*(?:NSW|VIC|QLD|WA|SA|TAS|ACT|NT)\b',
+        ],
+        'indicators': ['AUD', 'Australian', 'postcode'],
+        'states': ['New South Wales', 'Victoria', 'Queensland', 'Western Australia', 'South Australia', 'Tasmania', 'Australian Capital Territory', 'Northern Territory']
+    },
+    'Germany': {
+        'patterns': [
+            r'\bDeutschland\b|\bGermany\b',
+            r'\b\d{5}\s*(?:Germany|Deutschland)\b',
+        ],
+        'indicators': ['EUR', '€', 'euros', 'German'],
+        'regions': ['Bavaria', 'Baden-Württemberg', 'North Rhine-Westphalia', 'Berlin', 'Hamburg']
+    },
+    'France': {
+        'patterns': [
+            r'\bFrance\b|\bFrançais\b',
+            r'\b\d{5}\s*France\b',
+        ],
+        'indicators': ['EUR', '€', 'euros', 'French'],
+        'regions': ['Paris', 'Lyon', 'Marseille', 'Toulouse', 'Nice']
+    },
+    'Spain': {
+        'patterns': [
+            r'\bSpain\b|\bEspaña\b',
+            r'\b\d{5}\s*Spain\b',
+        ],
+        'indicators': ['EUR', '€', 'euros', 'Spanish'],
+        'regions': ['Madrid', 'Barcelona', 'Valencia', 'Seville', 'Bilbao']
+    },
+    'Italy': {
+        'patterns': [
+            r'\bItaly\b|\bItalia\b',
+            r'\b\d{5}\s*Italy\b',
+        ],
+        'indicators': ['EUR', '€', 'euros', 'Italian'],
+        'regions': ['Rome', 'Milan', 'Naples', 'Turin', 'Florence']
+    },
+    'Netherlands': {
+        'patterns': [
+            r'\bNetherlands\b|\bHolland\b',
+            r'\b\d{4}\s*[A-Z]{2}\s*Netherlands\b',
+        ],
+        'indicators': ['EUR', '€', 'euros', 'Dutch'],
+        'regions': ['Amsterdam', 'Rotterdam', 'The Hague', 'Utrecht']
+    },
+    'Mexico': {
+        'patterns': [
+            r'\bMexico\b|\bMéxico\b',
+            r'\b\d{5}\s*Mexico\b',
+        ],
+        'indicators': ['MXN', 'pesos', 'Mexican'],
+        'regions': ['Mexico City', 'Guadalajara', 'Monterrey', 'Cancun', 'Puerto Vallarta']
+    }
+})
+
+
+def lowered_terms(terms):
+    """Pair each display term with its interned lowercase form for matching against lowered text"""
+    return tuple((term, sys.intern(term.lower())) for term in terms)
+
+
+# Per-country (term, lowered) pairs; regions fall back from states to provinces to regions
+COUNTRY_TERMS = MappingProxyType({
+    country: (lowered_terms(data['indicators']),
+              lowered_terms(data.get('states', data.get('provinces', data.get('regions', ())))))
+    for country, data in COUNTRY_PATTERNS.items()
+})
+# Canonical-URL TLDs that point to a country (a .co.uk URL scores both UK entries)
+COUNTRY_TLDS = MappingProxyType({
+    '.uk': 'United Kingdom',
+    '.co.uk': 'United Kingdom',
+    '.ca': 'Canada',
+    '.au': 'Australia',
+    '.com.au': 'Australia',
+    '.de': 'Germany',
+    '.fr': 'France',
+    '.es': 'Spain',
+    '.it': 'Italy',
+    '.nl': 'Netherlands',
+    '.mx': 'Mexico',
+    '.com.mx': 'Mexico'
+})
+COUNTRY_REGEXES = MappingProxyType({
+    country: compile_patterns(data['patterns']) for country, data in COUNTRY_PATTERNS.items()
+})
+
+# Common cities by country, as (name, lowered) pairs for extract_city_names
+CITY_TERMS = MappingProxyType({country: lowered_terms(cities) for country, cities in {
+    'United States': [
+        'New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix', 'Philadelphia',
+        'San Antonio', 'San Diego', 'Dallas', 'San Jose', 'Austin', 'Jacksonville',
+        'Fort Worth', 'Columbus', 'Charlotte', 'San Francisco', 'Indianapolis',
+        'Seattle', 'Denver', 'Washington', 'Boston', 'El Paso', 'Nashville',
+        'Detroit', 'Oklahoma City', 'Portland', 'Las Vegas', 'Memphis', 'Louisville',
+        'Baltimore', 'Milwaukee', 'Albuquerque', 'Tucson', 'Fresno', 'Sacramento',
+        'Mesa', 'Kansas City', 'Atlanta', 'Long Beach', 'Colorado Springs', 'Raleigh',
+        'Miami', 'Virginia Beach', 'Omaha', 'Oakland', 'Minneapolis', 'Tulsa',
+        'Arlington', 'Tampa', 'New Orleans', 'Wichita', 'Cleveland', 'Bakersfield'
+    ],
+    'Canada': [
+        'Toronto', 'Montreal', 'Vancouver', 'Calgary', 'Edmonton', 'Ottawa',
+        'Winnipeg', 'Quebec City', 'Hamilton', 'Kitchener', 'London', 'Victoria',
+        'Halifax', 'Oshawa', 'Windsor', 'Saskatoon', 'St. Catharines', 'Regina',
+        'Kelowna', 'Barrie', 'Sherbrooke', 'Guelph', 'Kanata', 'Abbotsford'
+    ],
+    'United Kingdom': [
+        'London', 'Birmingham', 'Manchester', 'Glasgow', 'Liverpool', 'Edinburgh',
+        'Leeds', 'Sheffield', 'Bristol', 'Cardiff', 'Leicester', 'Belfast',
+        'Nottingham', 'Newcastle', 'Brighton', 'Hull', 'Plymouth', 'Stoke',
+        'Wolverhampton', 'Derby', 'Swansea', 'Southampton', 'Salford', 'Aberdeen'
+    ],
+    'Australia': [
+        'Sydney', 'Melbourne', 'Brisbane', 'Perth', 'Adelaide', 'Gold Coast',
+        'Newcastle', 'Canberra', 'Sunshine Coast', 'Wollongong', 'Geelong',
+        'Hobart', 'Townsville', 'Cairns', 'Darwin', 'Toowoomba', 'Ballarat'
+    ]
+}.items()})
+
+# Membership lookups (exact keyword matches, not substring searches)
+MAJOR_MARKETPLACE_KEYWORDS = frozenset(['airbnb', 'vrbo', 'booking.com', 'expedia'])
+CORE_B2B_SOFTWARE_KEYWORDS = frozenset(['property management software', 'vacation rental software', 'pms'])
+GENERIC_B2B_TOOL_KEYWORDS = frozenset(['tools', 'software', 'platform', 'solution'])
+OWNERSHIP_OPERATOR_INDICATORS = frozenset(['our properties', 'our rentals', 'our vacation homes', 'direct owner', 'property owner'])
+PERSONAL_OPERATOR_INDICATORS = frozenset(['family owned', 'locally owned', 'personal service', 'no booking fees'])
+# Business-model scoring per VACATION_RENTAL_BUSINESS_MODELS keyword hit, resolved once into a lookup table
+BUSINESS_MODEL_SCORING = (
+    ('marketplace_platform', 'marketplace_platforms', 'keywords', ((MAJOR_MARKETPLACE_KEYWORDS, 10),), 3),
+    ('b2b_service_provider', 'b2b_service_providers', 'keywords',
+     ((CORE_B2B_SOFTWARE_KEYWORDS, 8), (GENERIC_B2B_TOOL_KEYWORDS, 4)), 2),
+    ('marketing_service', 'marketing_lead_gen', 'keywords', (), 3),
+    ('aggregator_site', 'aggregator_listing_sites', 'keywords', (), 3),
+    ('direct_rental_operator', 'actual_rental_operators', 'positive_indicators',
+     ((OWNERSHIP_OPERATOR_INDICATORS, 10), (PERSONAL_OPERATOR_INDICATORS, 8)), 3),
+)
+BUSINESS_MODEL_KEYWORD_WEIGHTS = keyword_weight_table(VACATION_RENTAL_BUSINESS_MODELS, BUSINESS_MODEL_SCORING)
+# Company-size score per keyword hit, by indicator category (unlisted categories: 3 large, 4 small)
+LARGE_COMPANY_CATEGORY_WEIGHTS = MappingProxyType({
+    'listing_platform_keywords': 15,  # Strong indicator of listing platform
+    'headquarters_indicators': 12,    # Strong corporate indicator
+    'fortune_keywords': 10,           # Public company indicator
+    'big_business_indicators': 8,     # Corporate communications
+    'scale_indicators': 6,
+    'corporate_structure': 4
+})
+SMALL_COMPANY_CATEGORY_WEIGHTS = MappingProxyType({
+    'authentic_small_business': 8,    # Highest score for authentic small business
+    'local_business': 6,              # High score for local business
+    'personal_touch': 6,              # High score for personal service
+    'single_location_indicators': 5   # Good score for single location
+})
+CONNECTIVITY_OK_STATUSES = frozenset([200, 301, 302, 403, 404])
+
+
 class DomainChecker:
-    def __init__(self, timeout=8, max_workers=10, batch_size=50, enable_deep_crawl=True):
+    def __init__(self, timeout=8, max_workers=10, batch_size=50, enable_deep_crawl=True, use_async=True):
         self.timeout = timeout
         self.enable_deep_crawl = enable_deep_crawl
         self.max_workers = max_workers
         self.batch_size = batch_size
+        # Async fetching with aiohttp; the threaded requests session is kept as the sync fallback
+        self.use_async = use_async and aiohttp is not None
+        if use_async and aiohttp is None:
+            logger.info("aiohttp not installed - using threaded requests fallback")
+        self.ssl_context = None
+        self.legacy_session = None
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -45,694 +2231,204 @@ class DomainChecker:
         self.last_connectivity_check = 0
         self.connectivity_lock = threading.Lock()
         
+        # DNS answers shared across async batches: host -> (expires_at, addresses)
+        self.dns_cache = OrderedDict()
+        
+        # Analysis results of identical pages (parking templates): content key -> analyzed fields
+        self.content_cache = OrderedDict()
+        self.content_cache_lock = threading.Lock()
+        
+        # Request hedging state for the async path (hedge_session only exists during a batch)
+        self.fetch_latency = LatencyTracker()
+        self.hedge_budget = HedgeBudget()
+        self.hedge_session = None
+        
+        # Worker processes for page analysis (created on first use)
+        self.classify_pool = None
+        self.classify_pool_lock = threading.Lock()
+        
+        # Queued domain -> other input hosts of the same registered domain (see preprocess_domains)
+        self.domain_aliases = {}
+        
         # Progress tracking
         self.progress_file = None
-        self.processed_domains = set()
+        self.processed_domains = ProcessedDomainFilter()
         self.current_batch = 0
         self.total_batches = 0
         
         # Real-time CSV tracking
         self.csv_files = {}
         self.csv_writers = {}
+        self.csv_buffers = {'main': [], 'high_priority': []}
+        self.csv_lock = threading.Lock()
         self.stats = {
             'total_processed': 0,
             'working': 0,
             'business': 0,
             'parked': 0,
             'failed': 0,
-            'industries': {},
-            'company_sizes': {},
+            'industries': Counter(),
+            'company_sizes': Counter(),
             'target_customers': 0,
-            'excluded_businesses': {},
+            'excluded_businesses': Counter(),
             'start_time': None,
             'current_batch': 0,
             'total_batches': 0,
             # NEW STATS FIELDS
-            'vr_business_models': {},
+            'vr_business_models': Counter(),
             'high_priority_targets': 0,
             'medium_priority_targets': 0,
             'decision_maker_accessible': 0,
             'website_needs_upgrade': 0,
-            'vr_property_types': {}
+            'vr_property_types': Counter()
         }
+        # Per-batch tallies merged into self.stats by merge_batch_stats(): scalar counts in
+        # fixed slots indexed by StatSlot, breakdowns keyed by (stat name, value)
+        self.batch_counters = array('q', bytes(8 * len(StatSlot)))
+        self.batch_stats = Counter()
+        self.stats_lock = threading.Lock()
         
         # Simple SSL configuration
         try:
-            import ssl
             from requests.adapters import HTTPAdapter
-            from urllib3.util.ssl_ import create_urllib3_context
             
             class SSLAdapter(HTTPAdapter):
+                def __init__(self, ssl_context=SHARED_SSL_CONTEXT, **kwargs):
+                    self.ssl_context = ssl_context
+                    super().__init__(**kwargs)
+                
                 def init_poolmanager(self, *args, **kwargs):
-                    try:
-                        ctx = create_urllib3_context()
-                        ctx.check_hostname = False
-                        ctx.verify_mode = ssl.CERT_NONE
-                        try:
-                            ctx.set_ciphers('DEFAULT')
-                        except:
-                            pass
-                        kwargs['ssl_context'] = ctx
-                    except Exception:
-                        pass
-                    return super().init_poolmanager(*args, **kwargs)
-            
-            self.session.mount('https://', SSLAdapter())
+                    if self.ssl_context is not None:
+                        kwargs['ssl_context'] = self.ssl_context
+                    super().init_poolmanager(*args, **kwargs)
+                    self.poolmanager.pool_classes_by_scheme = MAX_AGE_POOL_CLASSES
+            
+            # Keep-alive pool sized for the worker count; only server errors are retried here
+            pool_size = self.max_workers * 4
+            adapter = SSLAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                                 max_retries=CappedRetry(total=2, connect=0, read=0, other=0, backoff_factor=0.2,
+                                                         status_forcelist=(500, 502, 503, 504),
+                                                         respect_retry_after_header=True,
+                                                         raise_on_status=False))
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+            
+            # Separate session for retrying failed TLS handshakes with LEGACY_SSL_CONTEXT
+            if LEGACY_SSL_CONTEXT is not None:
+                self.legacy_session = requests.Session()
+                self.legacy_session.headers = self.session.headers
+                self.legacy_session.mount('https://', SSLAdapter(LEGACY_SSL_CONTEXT, pool_connections=pool_size,
+                                                                 pool_maxsize=pool_size))
+            
+            # Same relaxed context for the aiohttp connector
+            self.ssl_context = SHARED_SSL_CONTEXT
             
         except Exception as e:
             logger.warning(f"SSL adapter setup failed: {e}")
         
-        # Enhanced parked domain indicators
-        self.parked_indicators = [
-            'domain for sale', 'buy this domain', 'parked domain', 'coming soon',
-            'under construction', 'this domain is for sale', 'expired domain',
-            'register this domain', 'domain parking', 'premium domain',
-            'inquire about this domain', 'make an offer', 'domain auction',
-            'brandable domain', 'great domain', 'perfect domain', 'domain available',
-            'inquire now', 'buy now', 'purchase this domain', 'acquire this domain',
-            'godaddy', 'namecheap', 'sedo', 'afternic', 'hugedomains', 'dan.com', 
-            'escrow.com', 'flippa', 'brandpa', 'squadhelp', 'undeveloped',
-            'domain.com', 'name.com', 'networksolutions', 'dynadot',
-            'brandable.com', 'brandroot', 'domainhostingview', 'whois.net',
-            'domainmarket', 'premiumdomains', 'brandbucket', 'namerific',
-            'placeholder page', 'temporary page', 'site coming soon',
-            'website coming soon', 'launching soon', 'site under development',
-            'default page', 'apache2 debian default page', 'nginx default page',
-            'it works!', 'apache2 ubuntu default page', 'welcome to nginx',
-            'cpanel', 'whm', 'plesk', 'directadmin', 'hostgator', 'bluehost',
-            'shared hosting', 'web hosting', 'hosting account', 'server default',
-            'this domain is hosted by', 'hosted on',
-            'this site is temporarily unavailable', 'account suspended',
-            'domain suspended', 'hosting account suspended', 'service unavailable',
-            'bandwidth limit exceeded', 'quota exceeded', 'site maintenance',
-            'temporarily down', 'website offline', 'server error',
-            'suspended domain', 'suspended account', 'terms of service violation',
-            'directory listing', 'index of /', 'apache directory listing',
-            'welcome to your new website', 'congratulations on your new domain',
-            'this domain has been registered', 'domain successfully registered',
-            'thank you for registering', 'domain registration successful',
-            'business for sale', 'website for sale', 'established domain',
-            'traffic included', 'seo optimized domain', 'keyword rich domain',
-            'exact match domain', 'premium .com domain', 'valuable domain',
-            'investment opportunity', 'revenue generating', 'monetized domain',
-            'landing page', 'lead capture', 'affiliate marketing', 'monetization',
-            'ppc ready', 'adsense ready', 'revenue potential', 'traffic value',
-            'type-in traffic', 'direct navigation', 'category killer',
-            '.gallery domain', '.ist domain', '.qa domain', 'new tld',
-            'premium extension', 'new domain extension'
-        ]
-        
-        # Enhanced company size indicators with more detailed analysis
-        self.large_company_indicators = {
-            'listing_platform_keywords': [
-                'thousands of listings', 'millions of properties', 'search properties',
-                'browse listings', 'property listings', 'rental listings', 'accommodation listings',
-                'booking platform', 'reservation platform', 'marketplace', 'directory',
-                'find properties', 'compare properties', 'property search engine',
-                'listing database', 'property database', 'inventory of', 'catalog of'
-            ],
-            'headquarters_indicators': [
-                'headquarters', 'corporate headquarters', 'global headquarters', 'hq',
-                'head office', 'corporate office', 'main office', 'principal office',
-                'executive offices', 'corporate campus', 'world headquarters'
-            ],
-            'fortune_keywords': [
-                'fortune 500', 'fortune 1000', 'nasdaq', 'nyse', 'stock exchange',
-                'publicly traded', 'shareholders', 'investor relations', 'sec filings',
-                'annual report', 'quarterly earnings', 'market cap', 'ticker symbol',
-                's&p 500', 'dow jones', 'public company', 'publicly held'
-            ],
-            'scale_indicators': [
-                'global', 'worldwide', 'international', 'multinational', 'enterprise',
-                'corporation', 'corporate', 'offices worldwide', 'global presence', 
-                'international offices', 'regional offices', 'subsidiaries', 'divisions', 
-                'business units', 'operating companies', 'franchise locations',
-                'nationwide', 'countrywide', 'multi-state', 'multi-national'
-            ],
-            'size_keywords': [
-                'thousands of employees', 'million employees', 'billion', 'millions of customers',
-                'fortune', 'largest', 'leading provider', 'market leader', 'industry leader',
-                'global leader', 'worldwide leader', 'established 18', 'established 19',
-                'since 18', 'since 19', 'founded 18', 'founded 19', 'over 100 years',
-                'billions in revenue', 'millions in revenue', 'market capitalization'
-            ],
-            'corporate_structure': [
-                'chief executive officer', 'chief financial officer', 'chief technology officer',
-                'board of directors', 'executive team', 'leadership team', 'senior management',
-                'c-suite', 'executive committee', 'advisory board', 'board members',
-                'vice president', 'senior vice president', 'executive vice president',
-                'managing director', 'general manager', 'regional manager'
-            ],
-            'compliance_indicators': [
-                'privacy policy', 'terms of service', 'cookie policy', 'gdpr', 'ccpa',
-                'compliance', 'regulatory', 'sox compliance', 'iso certified',
-                'quality management', 'certifications', 'accreditation', 'legal disclaimer',
-                'terms and conditions', 'user agreement', 'service agreement'
-            ],
-            'enterprise_services': [
-                'enterprise solutions', 'b2b', 'business solutions', 'enterprise grade',
-                'scalable solutions', 'white paper', 'case studies', 'implementation',
-                'professional services', 'consulting', 'support portal', 'api documentation',
-                'enterprise clients', 'corporate clients', 'institutional clients'
-            ],
-            'big_business_indicators': [
-                'press releases', 'media center', 'news room', 'newsroom', 'press center',
-                'media kit', 'brand assets', 'corporate communications', 'public relations',
-                'investor center', 'corporate governance', 'sustainability report',
-                'corporate responsibility', 'annual reports', 'quarterly reports'
-            ]
-        }
-        
-        self.medium_company_indicators = {
-            'regional_presence': [
-                'regional', 'multi-location', 'multiple offices', 'branch offices',
-                'locations', 'established', 'growing company', 'expanding',
-                'several locations', 'multiple branches', 'regional service',
-                'serving multiple cities', 'multiple markets'
-            ],
-            'professional_services': [
-                'professional', 'certified', 'licensed', 'accredited', 'experienced team',
-                'expert', 'specialists', 'consultants', 'advisors', 'professional staff',
-                'qualified team', 'industry experts', 'certified professionals'
-            ],
-            'business_maturity': [
-                'years of experience', 'established business', 'trusted partner',
-                'proven track record', 'industry expertise', 'comprehensive services',
-                'experienced company', 'established reputation', 'trusted provider'
-            ],
-            'medium_scale_indicators': [
-                'regional leader', 'local market leader', 'growing business',
-                'expanding operations', 'multiple departments', 'dedicated team',
-                'specialized services', 'full-service', 'comprehensive solutions'
-            ]
-        }
-        
-        # Enhanced small business indicators (these get HIGHER scores now)
-        self.small_company_indicators = {
-            'local_business': [
-                'local', 'family owned', 'family business', 'locally owned',
-                'community', 'neighborhood', 'hometown', 'serving [city]',
-                'local service', 'neighborhood business', 'community focused',
-                'locally operated', 'hometown favorite', 'local expertise'
-            ],
-            'personal_touch': [
-                'personal service', 'personalized', 'one-on-one', 'direct contact',
-                'owner operated', 'small business', 'boutique', 'specialized',
-                'personal attention', 'individual service', 'custom service',
-                'tailored solutions', 'hands-on approach', 'direct owner involvement'
-            ],
-            'simple_structure': [
-                'contact us', 'call us', 'email us', 'get in touch', 'reach out',
-                'call today', 'contact owner', 'speak directly', 'personal consultation'
-            ],
-            'authentic_small_business': [
-                'family tradition', 'generations', 'local family', 'small team',
-                'intimate setting', 'cozy', 'welcoming', 'friendly staff',
-                'know your name', 'personal relationships', 'community member',
-                'local knowledge', 'neighborhood expert', 'personal touch'
-            ],
-            'single_location_indicators': [
-                'our location', 'visit us at', 'stop by', 'come see us',
-                'our shop', 'our store', 'our office', 'single location',
-                'one location', 'locally based', 'conveniently located'
-            ]
-        }
-        
-        # Technology stack indicators for company size
-        self.tech_indicators = {
-            'enterprise_tech': [
-                'salesforce', 'oracle', 'sap', 'microsoft dynamics', 'workday',
-                'servicenow', 'tableau', 'adobe experience', 'marketo', 'hubspot enterprise'
-            ],
-            'enterprise_hosting': [
-                'akamai', 'cloudflare enterprise', 'aws enterprise', 'azure enterprise',
-                'google cloud enterprise', 'cdn', 'load balancer', 'redundancy'
-            ],
-            'small_business_tech': [
-                'wix', 'squarespace', 'wordpress.com', 'weebly', 'shopify basic',
-                'godaddy website builder', 'site123'
-            ]
-        }
-        
-        # Business model classification for vacation rental industry
-        self.vacation_rental_business_models = {
-            'marketplace_platforms': {
-                'keywords': [
-                    'airbnb', 'vrbo', 'booking.com', 'expedia', 'tripadvisor rentals',
-                    'homeaway', 'vacasa', 'hometogo', 'flipkey', 'vacationrenter',
-                    'rentals.com', 'redawning', 'turnkey', 'awaze', 'novasol',
-                    'marketplace', 'platform', 'book now', 'search rentals',
-                    'find vacation rentals', 'browse properties', 'compare prices',
-                    'book direct', 'instant book', 'millions of rentals',
-                    'thousands of properties', 'rental marketplace'
-                ],
-                'url_indicators': [
-                    'airbnb', 'vrbo', 'booking', 'expedia',
-                    'tripadvisor', 'homeaway', 'vacasa', 'hometogo'
-                ],
-                'exclusion_reason': 'marketplace_platform'
-            },
-            'third_party_listings': {
-                'url_patterns': [
-                ],
-                'content_indicators': [
-                    'property id', 'listing id', 'rental id', 'property #', 'listing #',
-                    'property number', 'listing number', 'id:', 'ref:', 'reference:',
-                    'book this property', 'reserve this listing', 'property details',
-                    'listing details', 'view more properties', 'browse more rentals',
-                    'similar properties', 'more listings like this', 'other properties',
-                    'property amenities', 'listing amenities', 'check availability',
-                    'booking calendar', 'reservation system', 'instant booking',
-                    'property photos', 'listing photos', 'property gallery',
-                    'hosted by', 'managed by', 'listed by', 'property owner:',
-                    'contact host', 'message host', 'call host', 'property manager',
-                    'booking fee', 'service fee', 'cleaning fee', 'security deposit',
-                    'cancellation policy', 'house rules', 'guest reviews',
-                    'verified listing', 'verified property', 'trust & safety'
-                ],
-                'template_indicators': [
-                    'check-in:', 'check-out:', 'guests:', 'bedrooms:', 'bathrooms:',
-                    'sleeps up to', 'accommodates', 'maximum occupancy',
-                    'wifi included', 'parking included', 'pet friendly',
-                    'smoking policy', 'minimum stay', 'maximum stay',
-                    'property type:', 'accommodation type:', 'rental type:',
-                    'neighborhood:', 'area:', 'location:', 'address:',
-                    'price per night', 'nightly rate', 'weekly rate', 'monthly rate',
-                    'total price', 'taxes and fees', 'additional charges'
-                ],
-                'navigation_indicators': [
-                    'browse properties', 'search rentals', 'find accommodation',
-                    'property search', 'rental search', 'advanced search',
-                    'filter results', 'sort by', 'map view', 'list view',
-                    'saved properties', 'favorite listings', 'compare properties',
-                    'recently viewed', 'recommended for you', 'popular destinations',
-                    'top-rated properties', 'new listings', 'last minute deals'
-                ],
-                'generic_contact_indicators': [
-                    'customer service', 'customer support', 'help center',
-                    'support team', 'booking support', 'contact us',
-                    'help desk', 'call center', '1-800-', '1-888-', '1-877-',
-                    'toll free', 'support@', 'help@', 'booking@', 'reservations@',
-                    'info@', 'contact@', 'customer@', 'service@'
-                ],
-                'exclusion_reason': 'third_party_listing'
-            },
-            'b2b_service_providers': {
-                'keywords': [
-                    'property management software', 'vacation rental software', 
-                    'channel manager', 'pms', 'property management system',
-                    'rental management platform', 'booking engine', 'reservation system',
-                    'dynamic pricing', 'revenue management', 'pricing tool',
-                    'cleaning management', 'maintenance software', 'guest messaging',
-                    'automation tools', 'rental tools', 'property manager tools',
-                    'vacation rental management', 'short term rental software',
-                    'airbnb management', 'rental automation', 'hospitality software',
-                    'directory of tools', 'tools and resources', 'software solutions',
-                    'service provider', 'technology partner', 'integration',
-                    'api', 'white label', 'enterprise solution', 'saas',
-                    'subscription', 'pricing plans', 'free trial', 'demo',
-                    'for property managers', 'for hosts', 'for owners'
-                ],
-                'exclusion_reason': 'b2b_service_provider'
-            },
-            'marketing_lead_gen': {
-                'keywords': [
-                    'leads', 'lead generation', 'marketing services', 'seo services',
-                    'website design', 'digital marketing', 'social media marketing',
-                    'advertising', 'promotion', 'marketing platform', 'generate bookings',
-                    'increase revenue', 'boost occupancy', 'marketing tools',
-                    'listing optimization', 'rank higher', 'more visibility',
-                    'marketing agency', 'consulting', 'growth services'
-                ],
-                'exclusion_reason': 'marketing_service'
-            },
-            'aggregator_listing_sites': {
-                'keywords': [
-                    'compare', 'search all sites', 'aggregator', 'find deals',
-                    'best prices', 'price comparison', 'all vacation rentals',
-                    'search engine', 'rental search', 'compare rentals',
-                    'find rentals', 'rental finder', 'vacation rental search',
-                    'browse all', 'search properties', 'rental listings',
-                    'property search', 'vacation search'
-                ],
-                'exclusion_reason': 'aggregator_site'
-            },
-            'actual_rental_operators': {
-                # These are the ones we WANT - actual vacation rental businesses
-                'positive_indicators': [
-                    'our properties', 'our rentals', 'our vacation homes',
-                    'family owned', 'locally owned', 'established', 'since',
-                    'years of experience', 'personal service', 'local knowledge',
-                    'property portfolio', 'rental portfolio', 'vacation homes',
-                    'beach houses', 'mountain cabins', 'lake houses',
-                    'contact us', 'call us', 'email us', 'visit us',
-                    'based in', 'located in', 'serving', 'specializing in',
-                    'luxury rentals', 'premium properties', 'exclusive rentals',
-                    'hand-picked', 'carefully selected', 'curated collection',
-                    'direct owner', 'property owner', 'private owner',
-                    'no booking fees', 'no service fees', 'book direct',
-                    'personal attention', 'concierge service', 'local host'
-                ],
-                'business_model': 'direct_rental_operator'
-            }
-        }
-        
-        # Industry classification keywords
-        self.industry_keywords = {
-            'vacation_rental': [
-                'vacation rental', 'holiday rental', 'vacation home', 'holiday home',
-                'short term rental', 'vacation property', 'rental property',
-                'beach house', 'cabin rental', 'cottage rental', 'villa rental',
-                'vacation accommodation', 'holiday accommodation', 'getaway',
-                'book now', 'check availability', 'nightly rate', 'per night',
-                'airbnb', 'vrbo', 'homeaway', 'booking.com', 'expedia',
-                'resort', 'lodge', 'retreat', 'bed and breakfast', 'b&b',
-                'oceanfront', 'beachfront', 'lakefront', 'mountain view',
-                'private pool', 'hot tub', 'fireplace', 'kitchen', 'wifi'
-            ],
-            'real_estate': [
-                'real estate', 'property', 'homes for sale', 'houses for sale',
-                'buy home', 'sell home', 'realtor', 'real estate agent',
-                'mls', 'multiple listing', 'property search', 'home search',
-                'mortgage', 'loan', 'financing', 'closing', 'escrow',
-                'square feet', 'sq ft', 'bedroom', 'bathroom', 'garage',
-                'lot size', 'acre', 'price reduced', 'new listing', 'sold'
-            ],
-            'dental': [
-                'dentist', 'dental', 'teeth', 'tooth', 'oral health',
-                'dental care', 'dental office', 'dental practice', 'orthodontist',
-                'oral surgeon', 'periodontist', 'endodontist', 'hygienist',
-                'cleaning', 'filling', 'crown', 'bridge', 'implant',
-                'whitening', 'braces', 'invisalign', 'root canal', 'extraction'
-            ],
-            'home_services': [
-                'plumber', 'plumbing', 'electrician', 'electrical', 'hvac',
-                'heating', 'cooling', 'air conditioning', 'contractor',
-                'construction', 'renovation', 'remodeling', 'roofing',
-                'painting', 'flooring', 'landscaping', 'cleaning service',
-                'handyman', 'repair', 'installation', 'maintenance'
-            ],
-            'legal': [
-                'lawyer', 'attorney', 'legal', 'law firm', 'legal services',
-                'personal injury', 'divorce', 'criminal defense', 'bankruptcy',
-                'estate planning', 'wills', 'probate', 'litigation',
-                'consultation', 'legal advice', 'court', 'settlement'
-            ],
-            'financial': [
-                'bank', 'banking', 'credit union', 'financial', 'loan',
-                'mortgage', 'insurance', 'investment', 'financial advisor',
-                'accounting', 'tax', 'cpa', 'bookkeeping', 'payroll',
-                'retirement', '401k', 'ira', 'wealth management', 'portfolio'
-            ],
-            'restaurant_food': [
-                'restaurant', 'cafe', 'bar', 'dining', 'menu', 'food',
-                'catering', 'delivery', 'takeout', 'reservation', 'chef',
-                'cuisine', 'breakfast', 'lunch', 'dinner', 'pizza',
-                'burger', 'coffee', 'bakery', 'deli', 'grill'
-            ],
-            'healthcare_medical': [
-                'doctor', 'physician', 'medical', 'clinic', 'hospital',
-                'health', 'patient', 'appointment', 'treatment', 'surgery',
-                'therapy', 'diagnosis', 'prescription', 'insurance',
-                'medicare', 'medicaid', 'emergency', 'urgent care'
-            ]
-        }
-        
-        # NEW: Enhanced vacation rental business model classification
-        self.enhanced_vr_business_models = {
-            'direct_owner_small': {
-                'keywords': [
-                    'our property', 'our home', 'our cabin', 'our cottage', 'our villa',
-                    'my property', 'my home', 'my cabin', 'family owned', 'family vacation home',
-                    'personal vacation', 'private owner', 'owner direct', 'by owner',
-                    'no booking fees', 'book direct and save', 'family retreat',
-                    'our beach house', 'our mountain home', 'our lake house',
-                    'we purchased', 'we bought', 'we renovated', 'we built'
-                ],
-                'property_count_indicators': ['property', 'home', 'house', 'cabin', 'cottage'],
-                'property_range': (1, 5),
-                'is_target': True,
-                'priority': 'high'
-            },
-            'direct_owner_medium': {
-                'keywords': [
-                    'our properties', 'our homes', 'our rentals', 'portfolio',
-                    'collection of homes', 'several properties', 'multiple locations',
-                    'expanding our', 'growing portfolio', 'newest addition',
-                    'properties include', 'locations include', 'we own',
-                    'investment properties', 'rental portfolio'
-                ],
-                'property_count_indicators': ['properties', 'homes', 'rentals', 'units'],
-                'property_range': (6, 15),
-                'is_target': True,
-                'priority': 'high'
-            },
-            'property_manager_small': {
-                'keywords': [
-                    'we manage', 'professionally managed', 'management services',
-                    'local property management', 'property care', 'full service management',
-                    'locally owned and operated', 'boutique property management',
-                    'personalized management', 'hands-on management', 'dedicated team',
-                    'small company', 'local company', 'family business',
-                    'select properties', 'curated collection', 'hand-picked homes'
-                ],
-                'property_count_indicators': ['manage', 'managing', 'portfolio', 'properties under management'],
-                'property_range': (10, 50),
-                'is_target': True,
-                'priority': 'high'
-            },
-            'property_manager_medium': {
-                'keywords': [
-                    'professional property management', 'established management company',
-                    'regional leader', 'growing management', 'multiple office locations',
-                    'expanding portfolio', 'acquisitions', 'new markets',
-                    'management team', 'property managers', 'experienced staff',
-                    'comprehensive management', 'full-service company'
-                ],
-                'property_count_indicators': ['properties', 'units', 'rentals', 'homes under management'],
-                'property_range': (51, 200),
-                'is_target': True,
-                'priority': 'medium'
-            },
-            'property_manager_large': {
-                'keywords': [
-                    'nationwide', 'multiple states', 'corporate', 'enterprise',
-                    'leading property management', 'largest', 'hundreds of properties',
-                    'institutional', 'corporate housing', 'investor relations',
-                    'publicly traded', 'franchise', 'multi-state operations'
-                ],
-                'property_count_indicators': ['properties', 'units', 'locations'],
-                'property_range': (201, 10000),
-                'is_target': False,
-                'priority': 'exclude',
-                'exclusion_reason': 'too_large'
-            },
-            'listing_platform_small': {
-                'keywords': [
-                    'local directory', 'area listings', 'regional marketplace',
-                    'find rentals in', 'search properties', 'browse homes',
-                    'list your property', 'add your rental', 'featured listings',
-                    'local vacation rentals', 'area vacation homes'
-                ],
-                'url_patterns': ['/search', '/listings', '/browse', '/find'],
-                'is_target': True,  # They might want to upgrade to a booking platform
-                'priority': 'medium'
-            },
-            'listing_platform_large': {
-                'keywords': [
-                    'airbnb', 'vrbo', 'homeaway', 'booking.com', 'expedia',
-                    'thousands of properties', 'millions of listings', 'global marketplace',
-                    'book your next', 'compare prices', 'instant booking',
-                    'traveler reviews', 'verified properties', 'secure booking'
-                ],
-                'is_target': False,
-                'priority': 'exclude',
-                'exclusion_reason': 'marketplace_platform'
-            },
-            'software_provider': {
-                'keywords': [
-                    'property management software', 'pms', 'saas', 'booking engine',
-                    'channel manager', 'vacation rental software', 'automation',
-                    'api', 'integration', 'white label', 'pricing plans',
-                    'free trial', 'demo', 'features', 'solutions for',
-                    'tools for property managers', 'software for', 'platform for'
-                ],
-                'is_target': False,
-                'priority': 'exclude',
-                'exclusion_reason': 'b2b_software'
-            },
-            'marketing_agency': {
-                'keywords': [
-                    'marketing services', 'seo for vacation rentals', 'listing optimization',
-                    'increase bookings', 'digital marketing', 'social media management',
-                    'content creation', 'photography services', 'virtual tours',
-                    'lead generation', 'advertising services', 'promotion'
-                ],
-                'is_target': False,
-                'priority': 'exclude',
-                'exclusion_reason': 'marketing_service'
-            }
-        }
-        
-        # NEW: Decision maker accessibility indicators
-        self.decision_maker_indicators = {
-            'high_accessibility': {
-                'patterns': [
-                    r'\b(call|contact|text)\s+\w+\s+(directly|personally)',
-                    r'owner[\s\-]?(direct|operated)',
-                    r'ask for \w+',
-                    r'speak (to|with) \w+',
-                    r'\w+@[a-zA-Z0-9-]+\.[a-zA-Z]{2,}',  # Personal email (firstname@domain)
-                    r'my (name is|cell|phone|direct)',
-                    r'I (started|founded|own|manage)',
-                    r'(family|locally) owned and operated'
-                ],
-                'keywords': [
-                    'owner direct', 'call me', 'text me', 'personally manage',
-                    'family owned', 'owner operated', 'ask for', 'speak to',
-                    'direct line', 'cell phone', 'mobile number', 'personal service'
-                ],
-                'negative_keywords': [
-                    'corporate', 'headquarters', 'investor relations', 'press inquiries',
-                    'human resources', 'legal department', 'compliance'
-                ]
-            },
-            'low_accessibility': {
-                'keywords': [
-                    'corporate office', 'headquarters', 'investor relations',
-                    'press inquiries', 'media contact', 'hr department',
-                    'legal counsel', 'board of directors', 'shareholders',
-                    'publicly traded', 'stock symbol', 'sec filings'
-                ],
-                'email_patterns': ['info@', 'contact@', 'support@', 'hello@', 'admin@']
-            }
-        }
-        
-        # NEW: Website quality and upgrade need indicators
-        self.website_quality_indicators = {
-            'needs_upgrade': {
-                'technical': [
-                    'last updated', 'under construction', 'coming soon',
-                    'best viewed in internet explorer', 'requires flash',
-                    'site best viewed at', 'enable javascript', 'frames version',
-                    'text only version', 'low bandwidth version'
-                ],
-                'functional': [
-                    'email for availability', 'call for rates', 'contact for pricing',
-                    'inquire about dates', 'check availability by phone',
-                    'no online booking', 'email to reserve', 'call to book',
-                    'fax your request', 'mail check', 'money order accepted'
-                ],
-                'design': [
-                    'welcome to my website', 'thanks for visiting', 'you are visitor number',
-                    'page counter', 'guestbook', 'sign my guestbook', 'web ring',
-                    'site map', 'frames', 'table layout', 'animated gif',
-                    'under construction gif', 'spinning logo', 'marquee text'
-                ],
-                'age_patterns': [
-                    r'copyright\s*(?:©)?\s*(\d{4})',  # Old copyright years
-                    r'last\s*updated?\s*:?\s*(\d{4})',
-                    r'(?:established|since|founded)\s*:?\s*(\d{4})'
-                ]
-            },
-            'modern_indicators': {
-                'technical': [
-                    'mobile responsive', 'ssl secure', 'instant booking',
-                    'real-time availability', 'online payment', 'secure checkout',
-                    'api integration', 'channel sync', 'dynamic pricing'
-                ],
-                'platforms': [
-                    'wordpress 5', 'react', 'vue', 'angular', 'next.js',
-                    'gatsby', 'jamstack', 'headless cms', 'graphql'
-                ]
-            }
-        }
-        
-        # NEW: Property count detection patterns
-        self.property_count_patterns = [
-            # Specific numbers
-            (r'(\d+)\s*(?:properties|homes|rentals|units|cabins|cottages|villas|condos)', 'exact'),
-            (r'(?:manage|managing|own|offer)\s*(\d+)', 'exact'),
-            (r'portfolio of\s*(\d+)', 'exact'),
-            (r'(\d+)\s*vacation\s*(?:homes|properties|rentals)', 'exact'),
-            
-            # Ranges
-            (r'(\d+)\s*(?:to|-)\s*(\d+)\s*(?:properties|homes|rentals)', 'range'),
-            (r'between\s*(\d+)\s*and\s*(\d+)', 'range'),
-            
-            # Descriptive
-            (r'dozens of properties', 'dozens'),
-            (r'hundreds of properties', 'hundreds'),
-            (r'thousands of properties', 'thousands'),
-            (r'handful of properties', 'handful'),
-            (r'few select properties', 'few'),
-            (r'multiple properties', 'multiple'),
-            (r'several properties', 'several')
-        ]
-        
-        # NEW: Geographic scope patterns
-        self.geographic_scope_patterns = {
-            'local': {
-                'keywords': ['local', 'locally owned', 'serving [city]', 'in [city]', 
-                           'area', 'neighborhood', 'community', 'hometown'],
-                'patterns': [r'serving\s+\w+\s*(?:area|region|community)'],
-                'scope_score': 1
-            },
-            'regional': {
-                'keywords': ['regional', 'multiple cities', 'throughout [state]', 
-                           'across [state]', 'statewide', '[state] properties'],
-                'patterns': [r'(?:throughout|across)\s+\w+'],
-                'scope_score': 2
-            },
-            'national': {
-                'keywords': ['nationwide', 'national', 'coast to coast', 
-                           'multiple states', 'across america', 'usa wide'],
-                'patterns': [r'(?:nationwide|national|multiple states)'],
-                'scope_score': 3
-            },
-            'international': {
-                'keywords': ['international', 'global', 'worldwide', 
-                           'multiple countries', 'globally'],
-                'patterns': [r'(?:international|global|worldwide)'],
-                'scope_score': 4
-            }
-        }
-        
-        # NEW: Industry-specific patterns for vacation rentals
-        self.vr_industry_patterns = {
-            'beach': {
-                'keywords': ['beach', 'ocean', 'oceanfront', 'beachfront', 'coastal',
-                           'seaside', 'shore', 'gulf', 'atlantic', 'pacific',
-                           'sand', 'surf', 'waves', 'tides', 'dunes'],
-                'seasonal_indicators': ['summer rentals', 'spring break', 'off-season rates'],
-                'amenity_keywords': ['beach access', 'ocean view', 'beach chairs', 'umbrellas']
-            },
-            'mountain': {
-                'keywords': ['mountain', 'ski', 'alpine', 'cabin', 'chalet',
-                           'elevation', 'peaks', 'slopes', 'trails', 'hiking',
-                           'ski-in', 'ski-out', 'lodge', 'retreat'],
-                'seasonal_indicators': ['ski season', 'summer hiking', 'fall colors'],
-                'amenity_keywords': ['hot tub', 'fireplace', 'ski storage', '4wd required']
-            },
-            'lake': {
-                'keywords': ['lake', 'lakefront', 'waterfront', 'dock', 'boat',
-                           'fishing', 'swimming', 'water sports', 'marina'],
-                'seasonal_indicators': ['summer season', 'boating season'],
-                'amenity_keywords': ['private dock', 'boat launch', 'fishing gear', 'kayaks']
-            },
-            'urban': {
-                'keywords': ['downtown', 'city center', 'metro', 'urban', 'walkable',
-                           'transit', 'nightlife', 'restaurants', 'shopping'],
-                'seasonal_indicators': ['event pricing', 'convention rates'],
-                'amenity_keywords': ['parking included', 'walk to', 'public transit', 'wifi']
-            },
-            'rural': {
-                'keywords': ['country', 'rural', 'farm', 'ranch', 'secluded',
-                           'private', 'acres', 'peaceful', 'quiet', 'nature'],
-                'seasonal_indicators': ['harvest season', 'hunting season'],
-                'amenity_keywords': ['acreage', 'privacy', 'wildlife', 'stargazing']
-            }
+        # Keyword tables (shared, read-only module constants)
+        self.parked_indicators = PARKED_INDICATORS
+        self.large_company_indicators = LARGE_COMPANY_INDICATORS
+        self.medium_company_indicators = MEDIUM_COMPANY_INDICATORS
+        self.small_company_indicators = SMALL_COMPANY_INDICATORS
+        self.tech_indicators = TECH_INDICATORS
+        self.vacation_rental_business_models = VACATION_RENTAL_BUSINESS_MODELS
+        self.industry_keywords = INDUSTRY_KEYWORDS
+        self.enhanced_vr_business_models = ENHANCED_VR_BUSINESS_MODELS
+        self.vr_models_frozen = VR_MODELS
+        self.decision_maker_indicators = DECISION_MAKER_INDICATORS
+        self.website_quality_indicators = WEBSITE_QUALITY_INDICATORS
+        self.property_count_patterns = PROPERTY_COUNT_REGEXES
+        self.property_count_phrases = PROPERTY_COUNT_PHRASES
+        self.geographic_scope_patterns = GEOGRAPHIC_SCOPE_PATTERNS
+        self.vr_industry_patterns = VR_INDUSTRY_PATTERNS
+        self.vr_property_type_weights = VR_PROPERTY_TYPE_WEIGHTS
+        self.decision_maker_patterns = DECISION_MAKER_PATTERNS
+        self.website_age_re = WEBSITE_AGE_RE
+        self.geographic_scope_regexes = GEOGRAPHIC_SCOPE_REGEXES
+        
+        # Precompiled keyword patterns - one regex search instead of a Python loop per keyword
+        self.patterns = {
+            'parked': compile_keywords(self.parked_indicators),
+            'vr_strong_parked': compile_keywords(VR_STRONG_PARKED_INDICATORS),
+            'not_ready': compile_keywords(NOT_READY_PHRASES),
+            'property_photo': compile_keywords(PROPERTY_PHOTO_KEYWORDS),
+            'booking_form': compile_keywords(BOOKING_FORM_KEYWORDS),
+            'listing_platform_url': compile_keywords(LISTING_PLATFORM_DOMAINS)
         }
+        self.third_party_url_patterns = PatternSetMatcher(
+            self.vacation_rental_business_models['third_party_listings']['url_patterns'])
+        
+        # All keyword tables in one matcher, tagged by (table, category), so a page is scanned once
+        keyword_groups = {}
+        for table_name, table in (('large', self.large_company_indicators),
+                                  ('medium', self.medium_company_indicators),
+                                  ('small', self.small_company_indicators),
+                                  ('tech', self.tech_indicators),
+                                  ('industry', self.industry_keywords)):
+            for category, keywords in table.items():
+                keyword_groups[(table_name, category)] = keywords
+        for model, fields in self.vacation_rental_business_models.items():
+            for field, keywords in fields.items():
+                # url_* entries are matched against the URL, not the page text
+                if isinstance(keywords, tuple) and not field.startswith('url_'):
+                    keyword_groups[('vr_models', model, field)] = keywords
+        for model in self.vr_models_frozen:
+            keyword_groups[('enhanced_vr', model.name)] = model.keywords
+        for level, fields in self.decision_maker_indicators.items():
+            for field in ('keywords', 'negative_keywords'):
+                if field in fields:
+                    keyword_groups[('decision_maker', level, field)] = fields[field]
+        for level, fields in self.website_quality_indicators.items():
+            for field, keywords in fields.items():
+                if field != 'age_patterns':
+                    keyword_groups[('website_quality', level, field)] = keywords
+        for prop_type, fields in self.vr_industry_patterns.items():
+            for field, keywords in fields.items():
+                keyword_groups[('vr_property_type', prop_type, field)] = keywords
+        keyword_groups[('enhanced_phrases', 'rental_operator')] = ACTUAL_RENTAL_PHRASES
+        keyword_groups[('enhanced_phrases', 'listing_platform')] = LISTING_PLATFORM_PHRASES
+        keyword_groups[('direct_operator', 'property_types')] = DIRECT_OPERATOR_PROPERTY_TYPES
+        keyword_groups[('direct_operator', 'location_phrases')] = DIRECT_OPERATOR_LOCATION_PHRASES
+        keyword_groups[('property_count', 'descriptive')] = [phrase for phrase, _ in PROPERTY_COUNT_PHRASES]
+        for scope, data in self.geographic_scope_patterns.items():
+            keyword_groups[('geographic_scope', scope)] = data['keywords']
+        keyword_groups[('parked', 'vr_keywords')] = PARKED_VR_KEYWORDS
+        keyword_groups[('parked', 'strong')] = STRONG_PARKED_INDICATORS
+        keyword_groups[('parked', 'coming_soon')] = COMING_SOON_INDICATORS
+        keyword_groups[('parked', 'default_page')] = DEFAULT_PAGE_INDICATORS
+        keyword_groups[('parked', 'sale')] = PARKED_SALE_KEYWORDS
+        keyword_groups[('parked', 'error')] = PARKED_ERROR_KEYWORDS
+        keyword_groups[('parked', 'minimal')] = MINIMAL_PARKED_PATTERNS
+        keyword_groups[('hacked', 'spam')] = HACKING_KEYWORDS
+        keyword_groups[('property_details', 'description')] = PROPERTY_DESCRIPTION_KEYWORDS
+        keyword_groups[('property_details', 'amenity_list')] = AMENITY_LIST_MARKERS
+        keyword_groups[('booking', 'context')] = BOOKING_CONTEXT_KEYWORDS
+        keyword_groups[('marketplace', 'specs')] = MARKETPLACE_SPEC_KEYWORDS
+        keyword_groups[('marketplace', 'platform_branding')] = LISTING_PLATFORM_BRANDING
+        keyword_groups[('company_size', 'red_flags')] = LARGE_BUSINESS_RED_FLAGS
+        for size, phrases in EMPLOYEE_ESTIMATE_PHRASES.items():
+            keyword_groups[('employee_estimate', size)] = phrases
+        keyword_groups[('company_size', 'global_presence')] = GLOBAL_PRESENCE_INDICATORS
+        keyword_groups[('company_size', 'social_sharing')] = SOCIAL_SHARING_INDICATORS
+        keyword_groups[('business_site', 'vr_terms')] = VR_SITE_TERMS
+        keyword_groups[('business_site', 'vr_indicators')] = VR_BUSINESS_INDICATORS
+        keyword_groups[('business_site', 'indicators')] = BUSINESS_INDICATORS
+        keyword_groups[('business_site', 'online_booking')] = ONLINE_BOOKING_PHRASES
+        for country, (indicators, regions) in COUNTRY_TERMS.items():
+            keyword_groups[('country', country, 'indicators')] = [lowered for _, lowered in indicators]
+            keyword_groups[('country', country, 'regions')] = [lowered for _, lowered in regions]
+        
+        self.keyword_matcher = KeywordMatcher(keyword_groups)
+        # The classifiers scan the same lowercased text - share the scan
+        self.scan_keywords = lru_cache(maxsize=32)(self.keyword_matcher.counts)
+        
+        # Text-only helpers of the enhanced VR classification
+        self.detect_property_count = TextMemo(self.detect_property_count)
+        self.classify_vr_property_type = TextMemo(self.classify_vr_property_type)
+        self.detect_geographic_scope = TextMemo(self.detect_geographic_scope)
+        # Registrar parking and placeholder pages repeat the same text across many domains
+        self.is_parked_domain_fixed = TextMemo(self.is_parked_domain_fixed)
 
     def preprocess_domains(self, domains):
         """Preprocess domains: remove duplicates and filter out known large platforms"""
@@ -780,6 +2476,8 @@ class DomainChecker:
         # Clean and deduplicate domains
         cleaned_domains = []
         seen_domains = set()
+        site_domains = {}  # registered domain -> the queued domain that represents it
+        self.domain_aliases = {}
         excluded_count = 0
         
         for domain in domains:
@@ -796,8 +2494,8 @@ class DomainChecker:
             if domain.startswith('www.'):
                 domain = domain[4:]
             
-            # Remove trailing slashes
-            domain = domain.rstrip('/')
+            # Remove trailing slashes and the root dot
+            domain = domain.rstrip('/').rstrip('.')
             
             # Skip if already seen (duplicate)
             if domain in seen_domains:
@@ -813,11 +2511,19 @@ class DomainChecker:
                     break
             
             if not is_excluded:
-                cleaned_domains.append(domain)
                 seen_domains.add(domain)
+                # Other hosts of an already queued site are answered from that site's result
+                site = registered_domain(domain)
+                if site in site_domains:
+                    self.domain_aliases.setdefault(site_domains[site], []).append(domain)
+                    continue
+                cleaned_domains.append(domain)
+                site_domains[site] = domain
         
+        alias_count = sum(len(aliases) for aliases in self.domain_aliases.values())
         logger.info(f"✅ Preprocessed domains: {len(domains)} → {len(cleaned_domains)}")
-        logger.info(f"   - Removed {len(domains) - len(cleaned_domains) - excluded_count} duplicates")
+        logger.info(f"   - Removed {len(domains) - len(cleaned_domains) - excluded_count - alias_count} duplicates")
+        logger.info(f"   - Merged {alias_count} hosts into the same registered domain")
         logger.info(f"   - Excluded {excluded_count} known platforms")
         
         return cleaned_domains
@@ -902,97 +2608,41 @@ class DomainChecker:
         return False, None
     
     
-    def is_parked_domain_fixed(self, page_text, title):
+    def is_parked_domain_fixed(self, page_text, title, text_lower=None):
         """Fixed parked domain detection - ignores domain name completely"""
         # IGNORE the domain name in the URL - only check page content
-        text_to_check = page_text.lower()
+        text_to_check = page_text.lower() if text_lower is None else text_lower
         
         # Don't include title in check if it's just the domain name
-        if title and not any(tld in title.lower() for tld in ['.com', '.net', '.org', '.co', '.io']):
-            text_to_check += ' ' + title.lower()
-        
-        # List of VERY SPECIFIC parked page indicators
-        strong_parked_indicators = [
-            'this domain is for sale',
-            'buy this domain',
-            'domain is parked',
-            'domain parking',
-            'purchase this domain',
-            'domain available for sale',
-            'get this domain',
-            'own this domain',
-            'claim this domain',
-            'register this domain',
-            'domain auction',
-            'make an offer on this domain',
-            'inquire about purchasing',
-            'premium domain for sale',
-            'domain marketplace',
-            'undeveloped domain',
-            'domain is currently parked',
-            'parked by',
-            'parked at',
-            'this page is parked',
-            'hugedomains.com',
-            'sedo.com',
-            'dan.com',
-            'afternic.com'
-        ]
-        
-        # Coming soon indicators
-        coming_soon_indicators = [
-            'coming soon',
-            'launching soon',
-            'under construction',
-            'site under development',
-            'website coming soon',
-            'under maintenance',
-            'be right back',
-            'stay tuned',
-            'work in progress',
-            'currently unavailable'
-        ]
-        
-        # Default page indicators
-        default_page_indicators = [
-            'apache2 debian default',
-            'apache2 ubuntu default',
-            'welcome to nginx',
-            'it works!',
-            'default web page',
-            'test page for',
-            'placeholder page',
-            'cpanel default',
-            'plesk default'
-        ]
+        title_lower = (title or '').lower()
+        if title and not any(tld in title_lower for tld in ['.com', '.net', '.org', '.co', '.io']):
+            text_to_check += ' ' + title_lower
         
+        # One keyword scan answers every indicator list below
+        keyword_totals = self.keyword_matcher.tag_totals(self.scan_keywords(text_to_check))
+
         # Check for strong parked indicators
-        for indicator in strong_parked_indicators:
-            if indicator in text_to_check:
-                return True
-        
+        if ('parked', 'strong') in keyword_totals:
+            return True
+
         # Check for coming soon pages
-        for indicator in coming_soon_indicators:
-            if indicator in text_to_check:
-                # Verify it's not just mentioning "coming soon" for a feature
-                word_count = len(page_text.split())
-                if word_count < 200:  # Small page with coming soon = parked
-                    return True
-        
-        # Check for default pages
-        for indicator in default_page_indicators:
-            if indicator in text_to_check:
+        if ('parked', 'coming_soon') in keyword_totals:
+            # Verify it's not just mentioning "coming soon" for a feature
+            if count_words(page_text, 200) < 200:  # Small page with coming soon = parked
                 return True
-        
+
+        # Check for default pages
+        if ('parked', 'default_page') in keyword_totals:
+            return True
+
         # Check for minimal content with sale/auction keywords
-        word_count = len(page_text.split())
+        word_count = count_words(page_text, 100)
         if word_count < 100:
-            if any(keyword in text_to_check for keyword in ['for sale', 'domain sale', 'buy now', 'purchase']):
+            if ('parked', 'sale') in keyword_totals:
                 return True
-        
+
         # Suspended/error pages
-        if word_count < 50 and any(error in text_to_check for error in 
-                                   ['suspended', 'not found', 'error', 'forbidden']):
+        if word_count < 50 and ('parked', 'error') in keyword_totals:
             return True
         
         return False
@@ -1008,7 +2658,7 @@ class DomainChecker:
             # Check exact number patterns
             for pattern, pattern_type in self.property_count_patterns:
                 if pattern_type == 'exact':
-                    matches = re.findall(pattern, text_lower)
+                    matches = pattern.findall(text_lower)
                     for match in matches:
                         try:
                             count = int(match)
@@ -1018,7 +2668,7 @@ class DomainChecker:
                             continue
                 
                 elif pattern_type == 'range':
-                    matches = re.findall(pattern, text_lower)
+                    matches = pattern.findall(text_lower)
                     for match in matches:
                         try:
                             if isinstance(match, tuple):
@@ -1027,19 +2677,16 @@ class DomainChecker:
                                 return {'count': avg, 'confidence': 80, 'type': 'range'}
                         except:
                             continue
-                
-                else:
-                    # Descriptive patterns
-                    if re.search(pattern, text_lower):
-                        estimates = {
-                            'handful': 3, 'few': 5, 'several': 8, 'multiple': 12,
-                            'dozens': 36, 'hundreds': 200, 'thousands': 2000
-                        }
-                        return {
-                            'count': estimates.get(pattern_type, 10),
-                            'confidence': 60,
-                            'type': 'estimate'
-                        }
+            
+            # Descriptive phrases
+            keyword_counts = self.scan_keywords(text_lower)
+            for phrase, estimate in self.property_count_phrases:
+                if phrase in keyword_counts:
+                    return {
+                        'count': estimate,
+                        'confidence': 60,
+                        'type': 'estimate'
+                    }
             
             return {'count': None, 'confidence': 0, 'type': None}
             
@@ -1047,59 +2694,59 @@ class DomainChecker:
             logger.error(f"Error detecting property count: {e}")
             return {'count': None, 'confidence': 0, 'type': None}
 
-    def calculate_decision_maker_score(self, soup, text, business_info):
+    def calculate_decision_maker_score(self, soup, text, business_info, text_lower=None, include_indicators=True):
         """Calculate how accessible the decision maker is"""
         try:
+            text_lower = text.lower() if text_lower is None else text_lower
             score = 0
             indicators_found = []
+            keyword_counts = self.scan_keywords(text_lower)
+            # Each keyword list has a single weight, so only the hit counts are needed for
+            # scoring; indicator strings are built only when the caller wants them
+            high_keywords = matched_keywords(self.decision_maker_indicators['high_accessibility']['keywords'], keyword_counts)
+            negative_keywords = matched_keywords(self.decision_maker_indicators['high_accessibility']['negative_keywords'], keyword_counts)
+            corporate_keywords = matched_keywords(self.decision_maker_indicators['low_accessibility']['keywords'], keyword_counts)
             
             # Check for high accessibility patterns
-            for pattern in self.decision_maker_indicators['high_accessibility']['patterns']:
-                if re.search(pattern, text, re.IGNORECASE):
-                    score += 20
-                    indicators_found.append(f"Pattern: {pattern}")
+            patterns = self.decision_maker_patterns.matching(text)
+            score += 20 * len(patterns)
             
             # Check for high accessibility keywords
-            for keyword in self.decision_maker_indicators['high_accessibility']['keywords']:
-                if keyword.lower() in text.lower():
-                    score += 10
-                    indicators_found.append(f"Keyword: {keyword}")
+            score += 10 * len(high_keywords)
             
             # Check email patterns
-            emails = business_info.get('emails', [])
-            for email in emails:
-                # Personal email (firstname@domain) scores high
-                if email and not any(prefix in email.lower() for prefix in 
-                                    self.decision_maker_indicators['low_accessibility']['email_patterns']):
-                    score += 25
-                    indicators_found.append(f"Personal email: {email}")
+            # Personal email (firstname@domain) scores high
+            personal_emails = [email for email in business_info.get('emails', [])
+                               if email and not (email.lower().partition('@')[0] + '@').endswith(GENERIC_EMAIL_PREFIXES)]
+            score += 25 * len(personal_emails)
             
             # Check for negative indicators
-            for keyword in self.decision_maker_indicators['high_accessibility']['negative_keywords']:
-                if keyword.lower() in text.lower():
-                    score -= 15
-                    indicators_found.append(f"Negative: {keyword}")
+            score -= 15 * len(negative_keywords)
             
             # Check for low accessibility indicators
-            for keyword in self.decision_maker_indicators['low_accessibility']['keywords']:
-                if keyword.lower() in text.lower():
-                    score -= 20
-                    indicators_found.append(f"Corporate indicator: {keyword}")
+            score -= 20 * len(corporate_keywords)
             
             # Phone number accessibility
+            # Check if it's a personal/cell phone pattern
             phones = business_info.get('phones', [])
-            if phones:
-                # Check if it's a personal/cell phone pattern
-                for phone in phones:
-                    if re.search(r'(cell|mobile|direct|personal)', text.lower()):
-                        score += 15
-                        indicators_found.append("Personal phone number")
+            personal_phones = len(phones) if phones and PERSONAL_PHONE_RE.search(text) else 0
+            score += 15 * personal_phones
             
             # Website size factor (smaller sites = more accessible)
             website_metrics = business_info.get('website_metrics', {})
-            if website_metrics.get('word_count', 0) < 1000:
+            small_website = website_metrics.get('word_count', 0) < 1000
+            if small_website:
                 score += 10
-                indicators_found.append("Small website (likely owner-operated)")
+            
+            if include_indicators:
+                indicators_found.extend(f"Pattern: {pattern.pattern}" for pattern in patterns)
+                indicators_found.extend(map(DECISION_MAKER_KEYWORD_LABELS.__getitem__, high_keywords))
+                indicators_found.extend(f"Personal email: {email}" for email in personal_emails)
+                indicators_found.extend(map(DECISION_MAKER_NEGATIVE_LABELS.__getitem__, negative_keywords))
+                indicators_found.extend(map(DECISION_MAKER_CORPORATE_LABELS.__getitem__, corporate_keywords))
+                indicators_found.extend(["Personal phone number"] * personal_phones)
+                if small_website:
+                    indicators_found.append("Small website (likely owner-operated)")
             
             # Calculate confidence
             confidence = min(95, abs(score))
@@ -1116,35 +2763,36 @@ class DomainChecker:
             logger.error(f"Error calculating decision maker score: {e}")
             return {'score': 0, 'confidence': 0, 'level': 'unknown', 'indicators': []}
 
-    def detect_website_upgrade_needs(self, soup, text, response):
+    def detect_website_upgrade_needs(self, soup, text, response, dom=None, text_lower=None):
         """Detect if website needs upgrading"""
         try:
+            dom = dom or scan_dom(soup)
+            text_lower = text.lower() if text_lower is None else text_lower
             upgrade_score = 0
             upgrade_indicators = []
             modern_score = 0
+            keyword_counts = self.scan_keywords(text_lower)
             
             # Check technical indicators
-            for indicator in self.website_quality_indicators['needs_upgrade']['technical']:
-                if indicator.lower() in text.lower():
-                    upgrade_score += 15
-                    upgrade_indicators.append(f"Technical issue: {indicator}")
+            found = matched_keywords(self.website_quality_indicators['needs_upgrade']['technical'], keyword_counts)
+            upgrade_score += 15 * len(found)
+            upgrade_indicators.extend(map(UPGRADE_TECHNICAL_LABELS.__getitem__, found))
             
             # Check functional limitations
-            for indicator in self.website_quality_indicators['needs_upgrade']['functional']:
-                if indicator.lower() in text.lower():
-                    upgrade_score += 20
-                    upgrade_indicators.append(f"Functional limitation: {indicator}")
+            found = matched_keywords(self.website_quality_indicators['needs_upgrade']['functional'], keyword_counts)
+            upgrade_score += 20 * len(found)
+            upgrade_indicators.extend(map(UPGRADE_FUNCTIONAL_LABELS.__getitem__, found))
             
             # Check design issues
-            for indicator in self.website_quality_indicators['needs_upgrade']['design']:
-                if indicator.lower() in text.lower():
-                    upgrade_score += 10
-                    upgrade_indicators.append(f"Design issue: {indicator}")
+            found = matched_keywords(self.website_quality_indicators['needs_upgrade']['design'], keyword_counts)
+            upgrade_score += 10 * len(found)
+            upgrade_indicators.extend(map(UPGRADE_DESIGN_LABELS.__getitem__, found))
             
             # Check copyright/update dates
-            for pattern in self.website_quality_indicators['needs_upgrade']['age_patterns']:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                for match in matches:
+            # One scan; years are reported pattern by pattern as before
+            years_by_pattern = list(zip(*self.website_age_re.findall(text)))
+            for years in years_by_pattern:
+                for match in filter(None, years):
                     try:
                         year = int(match)
                         if year < 2020:  # Site older than 4 years
@@ -1155,17 +2803,14 @@ class DomainChecker:
                         continue
             
             # Check for modern indicators (reduces upgrade need)
-            for indicator in self.website_quality_indicators['modern_indicators']['technical']:
-                if indicator.lower() in text.lower():
-                    modern_score += 15
+            modern_score += 15 * len(matched_keywords(self.website_quality_indicators['modern_indicators']['technical'], keyword_counts))
 
              # Bonus points for poor quality sites (they need help!)
-            word_count = len(text.split())
-            if word_count < 50:
+            if count_words(text, 50) < 50:
                 upgrade_score += 30
                 upgrade_indicators.append("Very small website - needs content")
             
-            if not soup.find(['form', 'button']) or 'contact' not in text.lower():
+            if not dom['has_form_or_button'] or 'contact' not in text_lower:
                 upgrade_score += 25
                 upgrade_indicators.append("No contact form or booking system")       
             
@@ -1177,22 +2822,19 @@ class DomainChecker:
                 upgrade_indicators.append("No SSL certificate")
             
             # Check mobile responsiveness
-            viewport_tag = soup.find('meta', attrs={'name': 'viewport'})
-            if not viewport_tag:
+            if not dom['has_viewport']:
                 upgrade_score += 25
                 upgrade_indicators.append("Not mobile responsive")
             
             # Check for outdated technology
-            if soup.find_all('frame') or soup.find_all('frameset'):
+            if dom['has_frames']:
                 upgrade_score += 30
                 upgrade_indicators.append("Uses frames (very outdated)")
             
             # Table-based layout detection
-            tables = soup.find_all('table')
-            if len(tables) > 5:
+            if dom['tables'] > 5:
                 # Check if tables are used for layout
-                layout_tables = [t for t in tables if not t.find_all('th')]
-                if len(layout_tables) > 3:
+                if dom['layout_tables'] > 3:
                     upgrade_score += 20
                     upgrade_indicators.append("Table-based layout")
             
@@ -1222,25 +2864,17 @@ class DomainChecker:
             property_scores = {}
             
             all_text = (text + ' ' + (title or '') + ' ' + (description or '')).lower()
+            keyword_counts = self.scan_keywords(all_text)
             
-            for prop_type, patterns in self.vr_industry_patterns.items():
-                score = 0
-                
-                # Check main keywords
-                for keyword in patterns['keywords']:
-                    count = all_text.count(keyword)
-                    score += count * 3
-                
-                # Check seasonal indicators
-                for indicator in patterns['seasonal_indicators']:
-                    if indicator in all_text:
-                        score += 5
-                
-                # Check amenity keywords
-                for amenity in patterns['amenity_keywords']:
-                    if amenity in all_text:
-                        score += 4
-                
+            # Main keywords score per occurrence, seasonal/amenity keywords once; scores are
+            # accumulated in a flat list indexed by property type
+            scores = [0] * len(VR_PROPERTY_TYPES)
+            for keyword in keyword_counts.keys() & self.vr_property_type_weights.keys():
+                for type_index, weight, per_occurrence in self.vr_property_type_weights[keyword]:
+                    scores[type_index] += weight * keyword_counts[keyword] if per_occurrence else weight
+            
+            # Keep table order so ties resolve as before
+            for prop_type, score in zip(VR_PROPERTY_TYPES, scores):
                 if score > 0:
                     property_scores[prop_type] = score
             
@@ -1262,7 +2896,8 @@ class DomainChecker:
             return {'type': 'unknown', 'confidence': 0}
 
     # 2. FIX: Enhanced vacation rental classification to better detect listing sites
-    def enhanced_classify_vacation_rental_business(self, soup, page_text, title, description, final_url, business_info):
+    def enhanced_classify_vacation_rental_business(self, soup, page_text, title, description, final_url, business_info, dom=None,
+                                                   text_lower=None):
         """Enhanced classification focusing on CONTENT, not domain names"""
         try:
             # Get additional content from other pages
@@ -1271,116 +2906,51 @@ class DomainChecker:
                 additional_content = self.crawl_additional_pages(final_url, soup)  # <-- AND THIS LINE HERE
             logger.info(f"Crawled {len(additional_content.split())} additional words from other pages")
         
-            # Combine all content
-            all_text = (page_text + ' ' + (title or '') + ' ' + (description or '') + ' ' + additional_content).lower()
+            # Combine all content - lowercased once here and handed to the helpers
+            page_text_lower = page_text.lower() if text_lower is None else text_lower
+            all_text = ' '.join((page_text_lower, (title or '').lower(), (description or '').lower(), additional_content.lower()))
         
             # Initialize tracking
             model_scores = {}
             property_count_info = self.detect_property_count(all_text)
-            decision_maker_score = self.calculate_decision_maker_score(soup, page_text, business_info)
-            website_upgrade_info = self.detect_website_upgrade_needs(soup, page_text, None)
+            decision_maker_score = self.calculate_decision_maker_score(soup, page_text, business_info, text_lower=page_text_lower,
+                                                                       include_indicators=False)
+            dom = dom or scan_dom(soup)
+            website_upgrade_info = self.detect_website_upgrade_needs(soup, page_text, None, dom, text_lower=page_text_lower)
             property_type_info = self.classify_vr_property_type(page_text, title, description)
             
             # REMOVED: Domain-based classification
             # Now we ONLY look at content
-            
 
-            # Optionally crawl additional pages for vacation rental sites
-            additional_content = ''
-            if result.get('industry_type') == 'vacation_rental' or 'vacation' in page_text.lower():
-                additional_content = self.crawl_additional_pages(result.get('final_url', ''), soup)
-            
-            # Use combined content for classification
-            combined_text = page_text + ' ' + additional_content
+            # Additional pages come from the deep crawl above - all_text already includes them
+            keyword_counts = self.scan_keywords(all_text)
             
             # 1. DEEP CONTENT ANALYSIS - Look for actual rental operator indicators
-            rental_operator_score = 0
-            rental_operator_indicators = []
-            
+            # Both phrase lists come out of the same keyword scan; the matched phrases are the indicators
             # Strong indicators they actually rent properties
-            actual_rental_phrases = [
-                # Ownership indicators
-                'our vacation rental', 'our property', 'our home', 'our beach house',
-                'our cabin', 'our cottage', 'we own', 'property we manage',
-                'welcome to our', 'stay at our', 'rent our', 'book our',
-                
-                # Direct booking language
-                'book directly with us', 'book direct', 'no booking fees',
-                'contact us directly', 'call us to book', 'email for rates',
-                'check our calendar', 'see availability', 'reserve now',
-                
-                # Property descriptions
-                'sleeps', 'bedrooms', 'bathrooms', 'square feet', 'accommodates',
-                'fully equipped kitchen', 'private pool', 'ocean view', 'mountain view',
-                'walking distance', 'minutes from', 'located in', 'situated on',
-                
-                # Amenities lists
-                'amenities include', 'features include', 'property features',
-                'what we offer', 'included in your stay', 'guest access',
-                
-                # Rates and policies
-                'nightly rate', 'weekly rate', 'seasonal rates', 'minimum stay',
-                'cleaning fee', 'security deposit', 'cancellation policy',
-                'house rules', 'check-in time', 'check-out time',
-                
-                # Local host indicators
-                'your host', 'meet your host', 'about us', 'why choose us',
-                'local recommendations', 'area guide', 'things to do',
-                'we recommend', 'our favorite', 'local tips'
-            ]
-            
-            for phrase in actual_rental_phrases:
-                if phrase in all_text:
-                    rental_operator_score += 10
-                    rental_operator_indicators.append(phrase)
+            rental_operator_indicators = matched_keywords(ACTUAL_RENTAL_PHRASES, keyword_counts)
+            rental_operator_score = 10 * len(rental_operator_indicators)
             
             # 2. CHECK FOR LISTING PLATFORM INDICATORS (content-based)
-            listing_platform_score = 0
-            listing_indicators = []
-            
-            listing_platform_phrases = [
-                # Search functionality
-                'search properties', 'find rentals', 'browse listings',
-                'filter results', 'sort by price', 'map view',
-                'search by location', 'advanced search', 'refine search',
-                
-                # Multiple properties language
-                'thousands of properties', 'hundreds of rentals', 
-                'properties worldwide', 'rentals in multiple',
-                'compare properties', 'similar listings',
-                
-                # Platform features
-                'list your property', 'become a host', 'host dashboard',
-                'traveler reviews', 'verified properties', 'trust and safety',
-                'secure payments', 'booking protection', '24/7 support',
-                
-                # Aggregator language
-                'best prices guaranteed', 'price match', 'deals from',
-                'compare rates', 'lowest prices', 'exclusive deals'
-            ]
-            
-            for phrase in listing_platform_phrases:
-                if phrase in all_text:
-                    listing_platform_score += 15
-                    listing_indicators.append(phrase)
+            listing_indicators = matched_keywords(LISTING_PLATFORM_PHRASES, keyword_counts)
+            listing_platform_score = 15 * len(listing_indicators)
             
             # 3. ANALYZE PAGE STRUCTURE for actual rental content
-            content_structure_score = self.analyze_rental_content_structure(soup, all_text)
+            content_structure_score = self.analyze_rental_content_structure(soup, all_text, dom)
             
             # 4. CHECK FOR SPECIFIC PROPERTY DETAILS
             has_specific_property = self.detect_specific_property_details(soup, all_text)
             
             # 5. LOOK FOR BOOKING/INQUIRY FORMS
-            has_direct_booking = self.detect_direct_booking_capability(soup)
+            has_direct_booking = self.detect_direct_booking_capability(soup, all_text)
             
             # Calculate model scores based on CONTENT ONLY
             if rental_operator_score > 30 and has_specific_property:
-                if property_count_info['count'] and property_count_info['count'] <= 5:
-                    model_scores['direct_owner_small'] = rental_operator_score + 50
-                elif property_count_info['count'] and property_count_info['count'] <= 15:
-                    model_scores['direct_owner_medium'] = rental_operator_score + 40
-                else:
-                    model_scores['property_manager_small'] = rental_operator_score + 40
+                count = property_count_info['count']
+                owner_model = next((model.name for model in self.vr_models_frozen
+                                    if model.name.startswith('direct_owner') and count and model.covers(count)),
+                                   'property_manager_small')
+                model_scores[owner_model] = rental_operator_score + (50 if owner_model == 'direct_owner_small' else 40)
             
             if listing_platform_score > 40:
                 model_scores['listing_platform_large'] = listing_platform_score
@@ -1397,37 +2967,28 @@ class DomainChecker:
                 'exclusion_reason': 'classification_error'
             }
 
-    def analyze_rental_content_structure(self, soup, text):
+    def analyze_rental_content_structure(self, soup, text, dom=None):
         """Analyze page structure for vacation rental content patterns"""
+        dom = dom or scan_dom(soup)
+        sections = dom['sections']
         score = 0
         
         # Look for property detail sections
-        property_sections = soup.find_all(['div', 'section'], class_=re.compile(
-            r'property|rental|accommodation|listing|details|features|amenities', re.I
-        ))
-        score += len(property_sections) * 5
+        score += sections['property'] * 5
         
         # Look for rate/pricing tables
-        rate_elements = soup.find_all(['table', 'div'], class_=re.compile(r'rate|price|tariff', re.I))
-        if rate_elements:
+        if sections['rate']:
             score += 15
         
         # Look for availability calendars
-        calendar_elements = soup.find_all(['div', 'table', 'iframe'], class_=re.compile(
-            r'calendar|availability|booking|schedule', re.I
-        ))
-        if calendar_elements:
+        if sections['calendar']:
             score += 20
         
         # Look for photo galleries
-        gallery_elements = soup.find_all(['div', 'section'], class_=re.compile(
-            r'gallery|photos|images|slideshow', re.I
-        ))
-        if gallery_elements:
+        if sections['gallery']:
             # Check if it's property photos vs stock photos
-            img_alts = [img.get('alt', '').lower() for img in soup.find_all('img')]
-            property_photo_keywords = ['bedroom', 'kitchen', 'living', 'bathroom', 'view', 'pool', 'exterior']
-            property_photos = sum(1 for alt in img_alts if any(keyword in alt for keyword in property_photo_keywords))
+            img_alts = dom['img_alts']
+            property_photos = sum(1 for alt in img_alts if self.patterns['property_photo'].search(alt))
             if property_photos > 3:
                 score += 15
         
@@ -1436,87 +2997,69 @@ class DomainChecker:
     def detect_specific_property_details(self, soup, text):
         """Check if the page describes a specific property (not a directory)"""
         
-        # Count specific property details
+        # Count specific property details - amenity and description keywords come from one (cached) scan
         detail_count = 0
+        keyword_counts = self.scan_keywords(text)
         
         # Check for specific number of bedrooms/bathrooms
-        bedroom_match = re.search(r'\b(\d+)\s*(?:bed|br|bedroom)', text)
-        bathroom_match = re.search(r'\b(\d+)\s*(?:bath|ba|bathroom)', text)
-        if bedroom_match and bathroom_match:
+        if BEDROOM_RE.search(text) and BATHROOM_RE.search(text):
             detail_count += 2
         
-        # Check for specific address or location
-        address_patterns = [
-            r'\d+\s+\w+\s+(?:street|st|avenue|ave|road|rd|drive|dr)',
-            r'located at\s+[\w\s,]+',
-            r'address:\s*[\w\s,]+',
-        ]
-        for pattern in address_patterns:
-            if re.search(pattern, text, re.I):
-                detail_count += 1
-                break
-        
         # Check for specific amenity lists
-        if 'amenities:' in text or 'features:' in text or 'includes:' in text:
+        if any(marker in keyword_counts for marker in AMENITY_LIST_MARKERS):
             detail_count += 1
         
         # Check for property-specific description
-        description_keywords = ['spacious', 'cozy', 'renovated', 'modern', 'charming', 
-                              'comfortable', 'private', 'peaceful', 'stunning views']
-        description_count = sum(1 for keyword in description_keywords if keyword in text)
+        description_count = len(matched_keywords(PROPERTY_DESCRIPTION_KEYWORDS, keyword_counts))
         if description_count >= 3:
             detail_count += 1
         
+        # Check for specific address or location - the regex only runs if it can still decide the outcome
+        if detail_count == 2 and PROPERTY_ADDRESS_RE.search(text):
+            detail_count += 1
+        
         return detail_count >= 3  # Need at least 3 specific details
 
-    def detect_direct_booking_capability(self, soup):
+    def detect_direct_booking_capability(self, soup, text):
         """Check if site has direct booking/inquiry capability"""
         
-        # Look for inquiry/booking forms
+        # Look for inquiry/booking forms - all form texts, then all field names, each searched once
+        # (NUL-separated, so a keyword can't match across two forms or fields)
         forms = soup.find_all('form')
-        for form in forms:
-            form_text = form.get_text().lower()
-            form_inputs = form.find_all(['input', 'textarea', 'select'])
-            
-            # Check if it's a booking/inquiry form
-            booking_keywords = ['inquiry', 'booking', 'reservation', 'check-in', 
-                              'check-out', 'guests', 'dates', 'availability']
-            if any(keyword in form_text for keyword in booking_keywords):
+        if forms:
+            form_text = '\0'.join(form.get_text() for form in forms).lower()
+            if self.patterns['booking_form'].search(form_text):
                 return True
             
-            # Check form field names
-            for input_field in form_inputs:
-                field_name = (input_field.get('name', '') + input_field.get('id', '')).lower()
-                if any(keyword in field_name for keyword in booking_keywords):
-                    return True
-        
-        # Look for email/phone with booking context
-        booking_context = ['book', 'reserve', 'inquiry', 'availability', 'rates']
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        
-        for context in booking_context:
-            if context in text and re.search(email_pattern, text):
+            field_names = '\0'.join(input_field.get('name', '') + input_field.get('id', '')
+                                     for form in forms
+                                     for input_field in form.find_all(['input', 'textarea', 'select'])).lower()
+            if self.patterns['booking_form'].search(field_names):
                 return True
         
-        return False        
+        # Look for email with booking context - context words come from the shared keyword scan
+        keyword_counts = self.scan_keywords(text)
+        if any(context in keyword_counts for context in BOOKING_CONTEXT_KEYWORDS):
+            return EMAIL_RE.search(text) is not None
+        
+        return False
     
 
     def detect_geographic_scope(self, text):
         """Detect geographic scope of business"""
         try:
             scope_scores = {}
-            
+            keyword_counts = self.scan_keywords(text)
+
             for scope, data in self.geographic_scope_patterns.items():
                 score = 0
                 
                 # Check keywords
-                for keyword in data['keywords']:
-                    if keyword in text:
-                        score += 10
+                score += 10 * len(matched_keywords(data['keywords'], keyword_counts))
                 
                 # Check patterns
-                for pattern in data['patterns']:
-                    if re.search(pattern, text, re.IGNORECASE):
+                for pattern in self.geographic_scope_regexes[scope]:
+                    if pattern.search(text):
                         score += 15
                 
                 if score > 0:
@@ -1547,7 +3090,7 @@ class DomainChecker:
         # Create initial progress file if it doesn't exist
         if not os.path.exists(self.progress_file):
             initial_progress = {
-                'processed_domains': [],
+                'processed_count': 0,
                 'current_batch': 0,
                 'total_batches': 0,
                 'start_time': None,
@@ -1569,9 +3112,12 @@ class DomainChecker:
         """Load progress from file"""
         try:
             if os.path.exists(self.progress_file):
-                with open(self.progress_file, 'r') as f:
-                    progress = json.load(f)
-                    self.processed_domains = set(progress.get('processed_domains', []))
+                with open(self.progress_file, 'rb') as f:
+                    progress = load_json(f.read())
+                    # Older progress files store the processed domains inline
+                    for domain in progress.get('processed_domains', []):
+                        self.processed_domains.add(domain)
+                    self.processed_domains.flush()
                     self.current_batch = progress.get('current_batch', 0)
                     self.total_batches = progress.get('total_batches', 0)
                     saved_stats = progress.get('stats', {})
@@ -1579,7 +3125,7 @@ class DomainChecker:
                     # Update stats
                     for key, value in saved_stats.items():
                         if key in self.stats:
-                            self.stats[key] = value
+                            self.stats[key] = Counter(value) if isinstance(value, dict) else value
                     
                     logger.info(f"Loaded progress: {len(self.processed_domains)} domains processed")
                     return True
@@ -1588,11 +3134,12 @@ class DomainChecker:
         return False
 
     def save_progress(self, progress_data=None):
-        """Save progress to file"""
+        """Save batch position and stats to the progress file - processed domains go to the ProcessedDomainFilter log"""
         try:
             if progress_data is None:
+                self.processed_domains.flush()
                 progress_data = {
-                    'processed_domains': list(self.processed_domains),
+                    'processed_count': len(self.processed_domains),
                     'current_batch': self.current_batch,
                     'total_batches': self.total_batches,
                     'start_time': self.stats.get('start_time'),
@@ -1600,8 +3147,7 @@ class DomainChecker:
                     'stats': self.stats
                 }
             
-            with open(self.progress_file, 'w') as f:
-                json.dump(progress_data, f, indent=2)
+            write_file_atomic(self.progress_file, dump_json(progress_data))
         except Exception as e:
             logger.error(f"Error saving progress: {e}")
 
@@ -1627,9 +3173,15 @@ class DomainChecker:
             successful_connections = 0
             for url in test_urls:
                 try:
-                    response = self.session.get(url, timeout=5, allow_redirects=False)
-                    if response.status_code in [200, 301, 302, 403, 404]:
+                    # Only the status line matters - HEAD, or a streamed GET whose body is never read
+                    response = self.session.head(url, timeout=5, allow_redirects=False)
+                    if response.status_code == 405:
+                        with self.session.get(url, timeout=5, allow_redirects=False, stream=True) as response:
+                            pass
+                    if response.status_code in CONNECTIVITY_OK_STATUSES:
                         successful_connections += 1
+                        if successful_connections >= 2:
+                            break
                 except Exception as e:
                     logger.debug(f"Connectivity test failed for {url}: {e}")
                     continue
@@ -1664,11 +3216,9 @@ class DomainChecker:
         
         return False
 
-    def check_domain(self, domain):
-        """Check a single domain for availability and business information"""
-        # Check connectivity before processing
-
-          # Quick check for known platforms
+    def excluded_platform_result(self, domain):
+        """Return the result for a known large platform, or None if the domain should be checked"""
+        # Quick check for known platforms
         excluded_platforms = [
             'airbnb', 'vrbo', 'booking.com', 'expedia', 'tripadvisor',
             'hotels.com', 'homeaway', 'vacasa', 'flipkey', 'hometogo'
@@ -1683,36 +3233,13 @@ class DomainChecker:
                     'error': 'Known large platform - excluded',
                     'is_parked': False,
                     'is_business': False,
-                    'excluded_platform': True
-                }
-
-        if not self.check_network_connectivity():
-            if not self.wait_for_connectivity():
-                return {
-                    'domain': domain,
-                    'working': False,
-                    'final_url': '',
-                    'protocol': '',
-                    'status_code': '',
-                    'title': '',
-                    'description': '',
-                    'is_parked': False,
-                    'is_business': False,
-                    'business_info': {},
-                    'industry_type': '',
-                    'industry_confidence': 0,
-                    'company_size': '',
-                    'size_confidence': 0,
-                    'size_details': {},
-                    'vr_business_model': '',
-                    'vr_exclusion_reason': '',
-                    'is_target_customer': '',
-                    'vr_model_confidence': 0,
-                    'error': 'No network connectivity',
-                    'failed_due_to_connectivity': True
+                    'excluded_platform': True
                 }
-        
-        result = {
+        return None
+
+    def new_result(self, domain):
+        """Empty result record for a domain"""
+        return {
             'domain': domain,
             'working': False,
             'final_url': '',
@@ -1735,37 +3262,142 @@ class DomainChecker:
             'error': '',
             'failed_due_to_connectivity': False
         }
-        
+
+    def no_connectivity_result(self, domain):
+        """Result for a domain skipped because the network is down"""
+        result = self.new_result(domain)
+        result['error'] = 'No network connectivity'
+        result['failed_due_to_connectivity'] = True
+        return result
+
+    def normalize_host(self, domain):
+        """Lowercase the domain and strip any scheme"""
         domain = domain.strip().lower()
         if domain.startswith('http'):
             domain = urlparse(domain).netloc
+        return domain
+
+    def record_connection_error(self, result, e):
+        """Track a connection error - repeated failures point to a connectivity issue"""
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= 3:
+            result['error'] = 'Connection error - possible connectivity issue'
+            result['failed_due_to_connectivity'] = True
+        else:
+            result['error'] = f'Connection error: {str(e)}'
+
+    def classify_error(self, e):
+        """Map a fetch exception to a RETRY_POLICY error class"""
+        # Walk the wrapped exceptions (requests -> urllib3 -> socket, aiohttp -> OSError)
+        chain = []
+        while isinstance(e, BaseException) and e not in chain:
+            chain.append(e)
+            e = e.__cause__ or getattr(e, 'reason', None) or getattr(e, 'os_error', None) or e.__context__
+        
+        for error in chain:
+            if isinstance(error, socket.gaierror):
+                return 'dns_perm' if error.errno in DNS_PERMANENT_ERRNOS else 'dns_temp'
+        for error in chain:
+            if isinstance(error, requests.exceptions.ConnectTimeout):
+                return 'conn_timeout'
+            if aiohttp is not None and isinstance(error, aiohttp.ConnectionTimeoutError):
+                return 'conn_timeout'
+            if isinstance(error, (requests.exceptions.ReadTimeout, urllib3.exceptions.ReadTimeoutError, asyncio.TimeoutError)):
+                return 'read_timeout'
+            if isinstance(error, ssl.SSLError):
+                return 'tls'
+        return 'other'
+
+    def get_with_retries(self, url):
+        """GET a URL with the requests session, retrying failures per RETRY_POLICY"""
+        session = self.session
+        delays = None
+        while True:
+            try:
+                return read_capped(session.get(url, timeout=self.timeout, allow_redirects=True, verify=False, stream=True))
+            except Exception as e:
+                error_class = self.classify_error(e)
+                if delays is None:
+                    delays = iter(RETRY_POLICY[error_class])
+                delay = next(delays, None)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                if error_class == 'tls' and self.legacy_session is not None:
+                    session = self.legacy_session
+
+    def content_cache_key(self, response):
+        """Body hash plus the redirect details detect_hacked_website() looks at"""
+        history = response.history or []
+        return (hashlib.blake2b(response.content, digest_size=16).digest(), len(history),
+                urlparse(history[0].url).netloc if history else '', urlparse(response.url).netloc if history else '')
+
+    def analyze_content_cached(self, response, result):
+        """analyze_content, reusing the outcome for byte-identical pages"""
+        key = self.content_cache_key(response)
+        with self.content_cache_lock:
+            cached = self.content_cache.get(key)
+            if cached is not None:
+                self.content_cache.move_to_end(key)
+        if cached is not None:
+            result.update(copy.deepcopy(cached))
+            return
+        
+        before = dict(result)
+        self.analyze_content(response, result)
+        if result.get('industry_type') == 'vacation_rental':
+            return
+        
+        analyzed = {field: value for field, value in result.items() if field not in before or before[field] is not value}
+        with self.content_cache_lock:
+            self.content_cache[key] = copy.deepcopy(analyzed)
+            while len(self.content_cache) > CONTENT_CACHE_SIZE:
+                self.content_cache.popitem(last=False)
+
+    def process_response(self, response, result, protocol):
+        """Validate a 200 response and analyze it - returns False if the content is not usable"""
+        if not self.validate_content(response):
+            return False
+        
+        result.update({
+            'working': True,
+            'final_url': response.url,
+            'protocol': protocol,
+            'status_code': response.status_code
+        })
+        
+        self.analyze_content_cached(response, result)
+        self.consecutive_failures = 0  # Reset on success
+        return True
+
+    def check_domain(self, domain):
+        """Check a single domain for availability and business information"""
+        excluded = self.excluded_platform_result(domain)
+        if excluded:
+            return excluded
+
+        # Check connectivity before processing
+        if not self.check_network_connectivity():
+            if not self.wait_for_connectivity():
+                return self.no_connectivity_result(domain)
+        
+        result = self.new_result(domain)
+        domain = self.normalize_host(domain)
         
         for protocol in ['https', 'http']:
             url = f"{protocol}://{domain}"
             try:
-                response = self.session.get(url, timeout=self.timeout, allow_redirects=True, verify=False)
+                response = self.get_with_retries(url)
                 
                 if response.status_code == 200:
-                    if self.validate_content(response):
-                        result.update({
-                            'working': True,
-                            'final_url': response.url,
-                            'protocol': protocol,
-                            'status_code': response.status_code
-                        })
-                        
-                        self.analyze_content(response, result)
-                        self.consecutive_failures = 0  # Reset on success
+                    if self.analyze_response(response, result, protocol):
                         return result
                         
             except requests.exceptions.ConnectionError as e:
                 # This might be a connectivity issue
-                self.consecutive_failures += 1
-                if self.consecutive_failures >= 3:
-                    result['error'] = 'Connection error - possible connectivity issue'
-                    result['failed_due_to_connectivity'] = True
-                else:
-                    result['error'] = f'Connection error: {str(e)}'
+                self.record_connection_error(result, e)
+                if self.classify_error(e) == 'dns_perm':
+                    break  # NXDOMAIN - the other protocol won't resolve either
                 continue
             except Exception as e:
                 result['error'] = str(e)
@@ -1773,6 +3405,232 @@ class DomainChecker:
         
         return result
 
+    def has_parked_banner(self, content):
+        """True if the page text (not just its markup) shows a strong parked or default-page indicator"""
+        text = extract_text(content).lower()
+        return any(indicator in text for indicator in EARLY_STOP_INDICATORS)
+
+    async def read_body(self, resp, early_stop=False):
+        """Read a body in chunks up to MAX_PAGE_BYTES - early_stop also ends as soon as it is clearly a parked or default page"""
+        loop = asyncio.get_running_loop()
+        buffer = bytearray()
+        async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+            # Keep the tail of the previous chunks so indicators split across chunks are seen
+            window = (bytes(buffer[-EARLY_STOP_OVERLAP:]) + chunk).lower() if early_stop else None
+            buffer += chunk
+            if len(buffer) >= MAX_PAGE_BYTES:
+                break
+            if early_stop and any(indicator in window for indicator in EARLY_STOP_INDICATOR_BYTES):
+                if await loop.run_in_executor(None, self.has_parked_banner, bytes(buffer)):
+                    break
+        return bytes(buffer[:MAX_PAGE_BYTES])
+
+    async def fetch_async(self, session, url, method='GET', early_stop=False, **kwargs):
+        """Request a URL with aiohttp (GET by default) and read the body - early_stop ends parked pages early"""
+        async with session.request(method, url, allow_redirects=True, **kwargs) as resp:
+            content = await self.read_body(resp, early_stop)
+            history = [FetchedPage(str(r.url), r.status, r.headers) for r in resp.history]
+            final_url = str(resp.url)
+            if final_url.count('/') == 2:
+                final_url += '/'  # requests always reports the root path
+            return FetchedPage(final_url, resp.status, resp.headers, content, history)
+
+    def is_truncated(self, response):
+        """True if a ranged response holds only part of the body"""
+        if response.status_code != 206:
+            return False
+        total = response.headers.get('content-range', '').rpartition('/')[2]
+        if total.isdigit():
+            return int(total) > len(response.content)
+        return len(response.content) >= PROBE_RANGE_BYTES
+
+    def prefix_is_parked(self, response):
+        """Parked-page check on the first PROBE_RANGE_BYTES of a page"""
+        # Cheap byte scan first - a miss only costs the full fetch, so skip the parse
+        content_lower = response.content.lower()
+        if not any(indicator in content_lower for indicator in PARKED_PAGE_INDICATOR_BYTES):
+            return False
+        soup = BeautifulSoup(response.content, SOUP_PARSER)
+        title_tag = soup.find('title')
+        title = title_tag.get_text().strip() if title_tag else ''
+        return self.is_parked_domain_fixed(soup.get_text(), title)
+
+    async def probe_async(self, session, semaphore, url):
+        """HEAD, then a range-limited GET - the full page is only fetched when the prefix isn't conclusive"""
+        # One HEAD attempt - retries are left to the GET, so a stalled host isn't retried twice over
+        try:
+            async with semaphore:
+                head = await self.hedged_fetch_async(session, url, method='HEAD')
+        except Exception as e:
+            # Unreachable hosts fail GET the same way; anything else may just be a server that mishandles HEAD
+            if isinstance(e, aiohttp.ClientConnectorError) or self.classify_error(e) == 'conn_timeout':
+                raise
+            head = None
+        
+        if head is not None:
+            content_type = head.headers.get('content-type', '').lower()
+            if head.status_code in PROBE_FINAL_STATUSES:
+                return head
+            if 200 <= head.status_code < 300 and content_type and not any(ct in content_type for ct in ['text/html', 'text/plain']):
+                return head
+        
+        partial = await self.fetch_with_retries_async(session, semaphore, url, early_stop=True,
+                                                      headers={'Range': f'bytes=0-{PROBE_RANGE_BYTES - 1}'})
+        if partial.status_code == 206:
+            if self.is_truncated(partial):
+                loop = asyncio.get_running_loop()
+                if not await loop.run_in_executor(None, self.prefix_is_parked, partial):
+                    return await self.fetch_with_retries_async(session, semaphore, url)
+            partial.status_code = 200
+        return partial
+
+    async def hedged_fetch_async(self, session, url, **kwargs):
+        """fetch_async, racing a second request on the hedge session if the first is slower than the running p50"""
+        started = time.monotonic()
+        self.hedge_budget.earn()
+        primary = asyncio.ensure_future(self.fetch_async(session, url, **kwargs))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.fetch_latency.p50())
+            if not done and self.hedge_session is not None and self.hedge_budget.take():
+                tasks.add(asyncio.ensure_future(self.fetch_async(self.hedge_session, url, **kwargs)))
+            
+            pending = tasks
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self.fetch_latency.add(time.monotonic() - started)
+                        return task.result()
+            # Every request failed - report the original one
+            raise primary.exception()
+        finally:
+            for task in tasks:
+                if task.done():
+                    if not task.cancelled():
+                        task.exception()  # mark retrieved
+                else:
+                    task.cancel()
+
+    async def fetch_with_retries_async(self, session, semaphore, url, **kwargs):
+        """Async get_with_retries - also retries 5xx responses, which urllib3 handles on the sync path"""
+        delays = None
+        while True:
+            try:
+                async with semaphore:
+                    response = await self.hedged_fetch_async(session, url, **kwargs)
+                if response.status_code < 500:
+                    return response
+                error, error_class = None, 'http_5xx'
+            except Exception as e:
+                error, error_class = e, self.classify_error(e)
+            if delays is None:
+                delays = iter(RETRY_POLICY[error_class])
+            delay = next(delays, None)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            await asyncio.sleep(delay)
+            if error_class == 'tls' and LEGACY_SSL_CONTEXT is not None:
+                kwargs['ssl'] = LEGACY_SSL_CONTEXT
+
+    def get_classify_pool(self):
+        """Process pool for page analysis - None on single-core machines or if it can't be started"""
+        if self.classify_pool is None and (os.cpu_count() or 1) > 1:
+            with self.classify_pool_lock:
+                if self.classify_pool is None:
+                    try:
+                        self.classify_pool = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                                                 mp_context=multiprocessing.get_context('spawn'),
+                                                                 initializer=init_classify_worker,
+                                                                 initargs=(self.timeout, self.enable_deep_crawl))
+                    except Exception as e:
+                        logger.warning(f"Could not start analysis worker processes, using threads: {e}")
+        return self.classify_pool
+
+    def analyze_response(self, response, result, protocol):
+        """process_response in a worker process (in the calling thread if there is no pool)"""
+        pool = self.get_classify_pool()
+        if pool is None:
+            return self.process_response(response, result, protocol)
+        
+        usable, analyzed = pool.submit(classify_in_worker, response, result, protocol).result()
+        result.update(analyzed)
+        if usable:
+            self.consecutive_failures = 0  # Reset on success
+        return usable
+
+    async def analyze_response_async(self, response, result, protocol):
+        """process_response in a worker process (threads if there is no pool)"""
+        loop = asyncio.get_running_loop()
+        pool = self.get_classify_pool()
+        if pool is None:
+            return await loop.run_in_executor(None, self.process_response, response, result, protocol)
+        
+        usable, analyzed = await loop.run_in_executor(pool, classify_in_worker, response, result, protocol)
+        result.update(analyzed)
+        if usable:
+            self.consecutive_failures = 0  # Reset on success
+        return usable
+
+    async def check_domain_async(self, session, semaphore, domain):
+        """Async version of check_domain - fetches with aiohttp, parsing and analysis run in worker threads"""
+        excluded = self.excluded_platform_result(domain)
+        if excluded:
+            return excluded
+
+        loop = asyncio.get_running_loop()
+        if not await loop.run_in_executor(None, self.check_network_connectivity):
+            if not await loop.run_in_executor(None, self.wait_for_connectivity):
+                return self.no_connectivity_result(domain)
+        
+        result = self.new_result(domain)
+        domain = self.normalize_host(domain)
+        
+        # https is tried first; if its probe is slow (often a hanging TLS handshake) the http probe
+        # is started alongside it and whichever usable page arrives first wins
+        probes = {'https': asyncio.ensure_future(self.probe_async(session, semaphore, f"https://{domain}"))}
+        try:
+            done, _ = await asyncio.wait(set(probes.values()), timeout=self.fetch_latency.p50() * PROTOCOL_RACE_DELAY_FACTOR)
+            if not done and self.hedge_budget.take():
+                probes['http'] = asyncio.ensure_future(self.probe_async(session, semaphore, f"http://{domain}"))
+            
+            remaining = ['https', 'http']
+            while remaining:
+                running = [probes[protocol] for protocol in remaining if protocol in probes]
+                if not running:
+                    probes[remaining[0]] = asyncio.ensure_future(self.probe_async(session, semaphore, f"{remaining[0]}://{domain}"))
+                    running = [probes[remaining[0]]]
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                # https first when both have finished
+                protocol = next(protocol for protocol in remaining if probes.get(protocol) in done)
+                remaining.remove(protocol)
+                try:
+                    response = probes[protocol].result()
+                    
+                    if response.status_code == 200:
+                        if await self.analyze_response_async(response, result, protocol):
+                            return result
+                            
+                except aiohttp.ClientConnectionError as e:
+                    # This might be a connectivity issue
+                    self.record_connection_error(result, e)
+                    if self.classify_error(e) == 'dns_perm':
+                        break  # NXDOMAIN - the other protocol won't resolve either
+                    continue
+                except Exception as e:
+                    result['error'] = str(e) or type(e).__name__
+                    continue
+        finally:
+            for probe in probes.values():
+                if not probe.done():
+                    probe.cancel()
+                elif not probe.cancelled():
+                    probe.exception()  # mark retrieved
+        
+        return result
+
     def validate_content(self, response):
         """Validate that the response contains meaningful content"""
         try:
@@ -1783,32 +3641,18 @@ class DomainChecker:
             if not any(ct in content_type for ct in ['text/html', 'text/plain']):
                 return False
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            text = soup.get_text()
+            text = extract_text(response.content, content_type)
             
-            # Check for minimal content
-            cleaned_text = ' '.join(text.split())
-            if len(cleaned_text) < 100:
+            # Check for minimal content - length of the whitespace-collapsed text
+            words = text.split()
+            if sum(map(len, words)) + len(words) - 1 < 100:
                 return False
                 
-            # Check for launching soon type messages
-            launching_phrases = [
-                'launching soon', 'coming soon', 'under construction',
-                'be right back', 'website will be available'
-            ]
-            if any(phrase in text.lower() for phrase in launching_phrases):
-                return False
-            
-            critical_errors = [
-                'page not found', '404 not found', '403 forbidden', 
-                '500 internal server error', 'bad gateway'
-            ]
-            
+            # Check for launching soon type messages and error pages
             text_lower = text.lower()
-            if any(error in text_lower for error in critical_errors):
+            if self.patterns['not_ready'].search(text_lower):
                 return False
             
-            words = text.split()
             return len(words) >= 5
             
         except Exception:
@@ -1817,8 +3661,8 @@ class DomainChecker:
     def analyze_content(self, response, result):
         """Analyze webpage content - FIXED VERSION with new detections"""
         try:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
+            soup = BeautifulSoup(response.content, SOUP_PARSER)
+
             # Extract title
             title_tag = soup.find('title')
             if title_tag:
@@ -1830,15 +3674,20 @@ class DomainChecker:
                 result['description'] = desc_tag.get('content', '').strip()
             
             page_text = soup.get_text()
+            page_text_lower = page_text.lower()
+            # Page text plus title and description, lowercased piecewise - shared by the classifiers
+            all_text_lower = ' '.join((page_text_lower, (result.get('title') or '').lower(),
+                                       (result.get('description') or '').lower()))
             
             # NEW: Detect hacked websites
-            hacked_detection = self.detect_hacked_website(soup, page_text, response)
+            hacked_detection = self.detect_hacked_website(soup, page_text, response, text_lower=page_text_lower,
+                                                          title=result.get('title', ''))
             result['is_hacked'] = hacked_detection['is_hacked']
             result['hacked_indicators'] = hacked_detection['indicators']
             result['hacked_confidence'] = hacked_detection['confidence']
             
             # NEW: Detect language
-            language_detection = self.detect_website_language(soup, page_text)
+            language_detection = self.detect_website_language(soup, page_text, text_lower=page_text_lower)
             result['primary_language'] = language_detection['primary_language']
             result['is_non_english'] = language_detection['is_non_english']
             result['language_confidence'] = language_detection['confidence']
@@ -1851,17 +3700,18 @@ class DomainChecker:
                 return  # Don't continue analysis on hacked sites
             
             # Check if parked
-            result['is_parked'] = self.is_parked_domain_fixed(page_text, result.get('title', ''))
+            result['is_parked'] = self.is_parked_domain_fixed(page_text, result.get('title', ''), text_lower=page_text_lower)
             
             # Always run classification for working websites
             if not result['is_parked']:
-                result['is_business'] = self.is_business_website(soup, page_text.lower())
+                result['is_business'] = self.is_business_website(soup, page_text_lower, text_lower=page_text_lower)
             else:
                 result['is_business'] = False
             
             # Run industry and size classification for all working sites
             try:
-                industry_result = self.classify_industry(page_text.lower(), result.get('title', ''), result.get('description', ''))
+                industry_result = self.classify_industry(page_text_lower, result.get('title', ''), result.get('description', ''),
+                                                         all_text=all_text_lower)
                 result['industry_type'] = industry_result.get('industry', '')
                 result['industry_confidence'] = industry_result.get('confidence', 0)
             except Exception as e:
@@ -1871,8 +3721,16 @@ class DomainChecker:
             
             # Only classify company size for business websites
             if result['is_business']:
+                # Element counts and word count, shared by size classification and business info
+                try:
+                    website_metrics = self.analyze_detailed_website_metrics(soup, page_text)
+                except Exception as e:
+                    # Left to each consumer to retry, so a failure only clears the fields that depend on it
+                    logger.error(f"Error analyzing website metrics for {result['domain']}: {e}")
+                    website_metrics = None
                 try:
-                    size_result = self.classify_company_size(soup, page_text.lower(), result.get('title', ''), result.get('description', ''))
+                    size_result = self.classify_company_size(soup, page_text_lower, result.get('title', ''), result.get('description', ''),
+                                                             all_text=all_text_lower, website_metrics=website_metrics)
                     result['company_size'] = size_result.get('size', '')
                     result['size_confidence'] = size_result.get('confidence', 0)
                     result['size_details'] = size_result.get('details', {})
@@ -1884,7 +3742,8 @@ class DomainChecker:
                 
                 # Extract business info for business websites
                 try:
-                    result['business_info'] = self.extract_business_info(soup)
+                    result['business_info'] = self.extract_business_info(soup, page_text, website_metrics=website_metrics,
+                                                                          text_lower=page_text_lower)
                 except Exception as e:
                     logger.error(f"Error extracting business info for {result['domain']}: {e}")
                     result['business_info'] = {}
@@ -1898,9 +3757,10 @@ class DomainChecker:
             if result['industry_type'] == 'vacation_rental':
                 try:
                     vr_classification = self.enhanced_classify_vacation_rental_business(
-                        soup, page_text.lower(), result.get('title', ''), 
+                        soup, page_text_lower, result.get('title', ''), 
                         result.get('description', ''), result.get('final_url', ''),
-                        result.get('business_info', {})
+                        result.get('business_info', {}),
+                        dom=scan_dom_stream(response.content), text_lower=page_text_lower
                     )
                     
                     # Update result with enhanced classification
@@ -1965,76 +3825,25 @@ class DomainChecker:
     # Also update the is_parked_domain function to be more content-aware
     def is_parked_domain(self, page_text, title):
         """Check if domain is parked - with vacation rental awareness"""
-        text_to_check = (page_text + ' ' + title.lower()).lower()
+        text_to_check = (page_text + ' ' + title).lower()
         
         # First, check if it's actually a vacation rental site with minimal content
-        vr_keywords = ['vacation rental', 'holiday home', 'beach house', 'cabin', 
-                       'cottage', 'villa', 'property rental', 'book now', 'check availability']
-        
-        vr_score = sum(1 for keyword in vr_keywords if keyword in text_to_check)
+        keyword_counts = self.scan_keywords(text_to_check)
+        vr_score = len(matched_keywords(PARKED_VR_KEYWORDS, keyword_counts))
         
         # If it has vacation rental keywords, be more lenient
         if vr_score >= 2:
             # Only mark as parked if VERY clear indicators
-            strong_parked_indicators = [
-                'domain for sale', 'buy this domain', 'this domain is for sale',
-                'domain parking', 'hugedomains', 'godaddy auction'
-                'domain for sale', 'buy this domain', 'parked domain', 'coming soon',
-                'under construction', 'this domain is for sale', 'expired domain',
-                'register this domain', 'domain parking', 'premium domain',
-                'inquire about this domain', 'make an offer', 'domain auction',
-                'brandable domain', 'great domain', 'perfect domain', 'domain available',
-                'inquire now', 'buy now', 'purchase this domain', 'acquire this domain',
-                'godaddy', 'namecheap', 'sedo', 'afternic', 'hugedomains', 'dan.com', 
-                'escrow.com', 'flippa', 'brandpa', 'squadhelp', 'undeveloped',
-                'domain.com', 'name.com', 'networksolutions', 'dynadot',
-                'brandable.com', 'brandroot', 'domainhostingview', 'whois.net',
-                'domainmarket', 'premiumdomains', 'brandbucket', 'namerific',
-                'placeholder page', 'temporary page', 'site coming soon',
-                'website coming soon', 'launching soon', 'site under development',
-                'default page', 'apache2 debian default page', 'nginx default page',
-                'it works!', 'apache2 ubuntu default page', 'welcome to nginx',
-                'cpanel', 'whm', 'plesk', 'directadmin', 'hostgator', 'bluehost',
-                'shared hosting', 'web hosting', 'hosting account', 'server default',
-                'this domain is hosted by', 'hosted on',
-                'this site is temporarily unavailable', 'account suspended',
-                'domain suspended', 'hosting account suspended', 'service unavailable',
-                'bandwidth limit exceeded', 'quota exceeded', 'site maintenance',
-                'temporarily down', 'website offline', 'server error',
-                'suspended domain', 'suspended account', 'terms of service violation',
-                'directory listing', 'index of /', 'apache directory listing',
-                'welcome to your new website', 'congratulations on your new domain',
-                'this domain has been registered', 'domain successfully registered',
-                'thank you for registering', 'domain registration successful',
-                'business for sale', 'website for sale', 'established domain',
-                'traffic included', 'seo optimized domain', 'keyword rich domain',
-                'exact match domain', 'premium .com domain', 'valuable domain',
-                'investment opportunity', 'revenue generating', 'monetized domain',
-                'landing page', 'lead capture', 'affiliate marketing', 'monetization',
-                'ppc ready', 'adsense ready', 'revenue potential', 'traffic value',
-                'type-in traffic', 'direct navigation', 'category killer',
-                '.gallery domain', '.ist domain', '.qa domain', 'new tld',
-                'premium extension', 'new domain extension'
-            ]
-            return any(indicator in text_to_check for indicator in strong_parked_indicators)
+            return bool(self.patterns['vr_strong_parked'].search(text_to_check))
         
         # Otherwise, use normal parked detection
-        word_count = len(page_text.split())
-        if word_count < 20:
-            minimal_patterns = [
-                'domain', 'sale', 'buy', 'purchase', 'available', 'premium',
-                'coming soon', 'under construction', 'placeholder'
-            ]
-            pattern_count = sum(1 for pattern in minimal_patterns if pattern in text_to_check)
+        if count_words(page_text, 20) < 20:
+            pattern_count = len(matched_keywords(MINIMAL_PARKED_PATTERNS, keyword_counts))
             if pattern_count >= 3:
                 return True
         
         # Check original indicators
-        for indicator in self.parked_indicators:
-            if indicator in text_to_check:
-                return True
-        
-        return False
+        return bool(self.patterns['parked'].search(text_to_check))
 
     def crawl_additional_pages(self, base_url, soup):
         """Crawl key pages to gather more content"""
@@ -2042,6 +3851,7 @@ class DomainChecker:
             from urllib.parse import urljoin, urlparse
             
             important_pages = []
+            seen_pages = set()
             
             # Find links to important pages
             for link in soup.find_all('a', href=True):
@@ -2057,24 +3867,33 @@ class DomainChecker:
                     full_url = urljoin(base_url, link.get('href'))
                     # Only crawl same domain
                     if urlparse(full_url).netloc == urlparse(base_url).netloc:
-                        if full_url not in important_pages and full_url != base_url:
+                        if full_url not in seen_pages and full_url != base_url:
+                            seen_pages.add(full_url)
                             important_pages.append(full_url)
             
-            # Crawl up to 5 additional pages
+            # Crawl up to CRAWL_PAGE_LIMIT additional pages, concurrently when aiohttp is available
+            # (classification runs in worker threads/processes, never on the event loop thread)
+            urls = important_pages[:CRAWL_PAGE_LIMIT]
+            if aiohttp is not None and urls:
+                bodies = asyncio.run(self.crawl_pages_async(urls))
+            else:
+                bodies = [self.crawl_page(url) for url in urls]
+            
             additional_content = []
-            for url in important_pages[:5]:
-                try:
-                    response = self.session.get(url, timeout=5, verify=False)
-                    if response.status_code == 200:
-                        page_soup = BeautifulSoup(response.content, 'html.parser')
-                        page_text = page_soup.get_text()
-                        # Only add if it has substantial content
-                        if len(page_text.split()) > 100:
-                            additional_content.append(page_text)
-                            logger.debug(f"Crawled additional page: {url}")
-                except Exception as e:
-                    logger.debug(f"Failed to crawl {url}: {e}")
+            seen_bodies = set()
+            for url, content in zip(urls, bodies):
+                if content is None:
                     continue
+                # Single-page apps serve the same document on every route - parse it once
+                digest = hashlib.blake2b(content, digest_size=16).digest()
+                if digest in seen_bodies:
+                    continue
+                seen_bodies.add(digest)
+                page_text = extract_text(content)
+                # Only add if it has substantial content
+                if count_words(page_text, 101) > 100:
+                    additional_content.append(page_text)
+                    logger.debug(f"Crawled additional page: {url}")
             
             return ' '.join(additional_content)
             
@@ -2082,43 +3901,42 @@ class DomainChecker:
             logger.error(f"Error in crawl_additional_pages: {e}")
             return ''
 
+    def crawl_page(self, url):
+        """Body of a crawled page, or None unless it answered 200"""
+        try:
+            response = read_capped(self.session.get(url, timeout=CRAWL_TIMEOUT, verify=False, stream=True))
+            if response.status_code == 200:
+                return response.content
+        except Exception as e:
+            logger.debug(f"Failed to crawl {url}: {e}")
+        return None
+
+    async def crawl_pages_async(self, urls):
+        """crawl_page() for several URLs at once over one aiohttp session, results in URL order"""
+        semaphore = asyncio.Semaphore(CRAWL_CONCURRENCY)
+        connector = aiohttp.TCPConnector(ssl=self.ssl_context or False)
+        timeout = aiohttp.ClientTimeout(total=CRAWL_TIMEOUT)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=dict(self.session.headers)) as session:
+            async def crawl(url):
+                try:
+                    async with semaphore:
+                        page = await self.fetch_async(session, url)
+                    if page.status_code == 200:
+                        return page.content
+                except Exception as e:
+                    logger.debug(f"Failed to crawl {url}: {e}")
+                return None
+            
+            return await asyncio.gather(*(crawl(url) for url in urls))
+
         # 2. ADD HACKED WEBSITE DETECTION
-    def detect_hacked_website(self, soup, page_text, response):
+    def detect_hacked_website(self, soup, page_text, response, text_lower=None, title=None):
         """Detect if website has been hacked"""
         try:
             hacked_score = 0
             hacked_indicators = []
             
-            # Common hacking indicators
-            hacking_keywords = [
-                # Pharmacy spam
-                'viagra', 'cialis', 'levitra', 'pharmacy', 'prescription drugs',
-                'buy pills online', 'cheap meds', 'online pharmacy', 'medications',
-                
-                # Casino/gambling spam
-                'online casino', 'poker online', 'slots', 'gambling', 'bet online',
-                'play casino', 'win money', 'jackpot', 'betting site',
-                
-                # Porn/adult content (when unexpected)
-                'xxx', 'porn', 'adult content', 'sex', 'nude', 'escorts',
-                
-                # Loan/financial scams
-                'payday loan', 'quick loan', 'fast cash', 'instant approval',
-                'bad credit loan', 'no credit check', 'guaranteed approval',
-                
-                # Crypto scams
-                'bitcoin mining', 'crypto investment', 'blockchain profit',
-                'cryptocurrency trading', 'btc doubler', 'ethereum giveaway',
-                
-                # SEO spam
-                'seo services', 'backlinks for sale', 'link building',
-                'google ranking', 'first page guaranteed',
-                
-                # Other common spam
-                'replica watches', 'fake documents', 'essay writing service',
-                'weight loss pills', 'work from home', 'make money online'
-            ]
-            
             # Check for suspicious redirects
             if response and response.history:
                 if len(response.history) > 2:  # Multiple redirects
@@ -2129,47 +3947,49 @@ class DomainChecker:
                 original_domain = urlparse(response.history[0].url).netloc if response.history else ''
                 final_domain = urlparse(response.url).netloc
                 if original_domain and final_domain and original_domain != final_domain:
-                    if not any(brand in final_domain for brand in ['google', 'facebook', 'microsoft']):
+                    final_host = urlparse(response.url).hostname or ''
+                    if final_host not in TRUSTED_REDIRECT_DOMAINS and not final_host.endswith(TRUSTED_REDIRECT_SUFFIXES):
                         hacked_score += 30
                         hacked_indicators.append(f"Redirected to different domain: {final_domain}")
             
             # Check page content for spam keywords
-            text_lower = page_text.lower()
-            spam_found = []
-            for keyword in hacking_keywords:
-                if keyword in text_lower:
-                        spam_found.append(keyword)
-                        hacked_score += 10
+            text_lower = page_text.lower() if text_lower is None else text_lower
+            spam_found = matched_keywords(HACKING_KEYWORDS, self.scan_keywords(text_lower))
+            hacked_score += 10 * len(spam_found)
             
             if spam_found:
                 hacked_indicators.append(f"Spam keywords found: {', '.join(spam_found[:5])}")
             
+            # One traversal collects the hidden elements, scripts and iframes checked below -
+            # skipped for the common clean page, whose markup has none of the telltale bytes
+            hidden_divs = []
+            scripts = []
+            iframes = []
+            if response is None or HACKED_MARKUP_RE.search(response.content):
+                features = scan_page_features(soup)
+                hidden_divs = features['hidden_elements']
+                scripts = features['scripts']
+                iframes = features['iframes']
+            
             # Check for hidden/invisible content
-            hidden_divs = soup.find_all(['div', 'span'], style=re.compile(r'display:\s*none|visibility:\s*hidden'))
             if len(hidden_divs) > 5:
                 hacked_score += 15
                 hacked_indicators.append(f"Multiple hidden elements ({len(hidden_divs)})")
             
             # Check for suspicious scripts
-            scripts = soup.find_all('script')
-            suspicious_scripts = 0
-            for script in scripts:
-                script_text = script.string or ''
-                if any(term in script_text.lower() for term in ['eval(', 'base64', 'fromcharcode', 'unescape']):
-                    suspicious_scripts += 1
+            suspicious_scripts = sum(1 for script in scripts if SUSPICIOUS_SCRIPT_RE.search(script.string or ''))
             
             if suspicious_scripts > 2:
                 hacked_score += 20
                 hacked_indicators.append(f"Suspicious scripts detected ({suspicious_scripts})")
             
             # Check for iframe injections
-            iframes = soup.find_all('iframe')
             suspicious_iframes = []
             for iframe in iframes:
                 src = iframe.get('src', '')
                 # Check for suspicious iframe sources
-                if src and not any(safe in src for safe in ['youtube', 'vimeo', 'google', 'facebook']):
-                    if iframe.get('style') and ('display:none' in iframe.get('style') or 'visibility:hidden' in iframe.get('style')):
+                if src and not SAFE_IFRAME_SRC_RE.search(src):
+                    if HIDDEN_STYLE_RE.search(iframe.get('style') or ''):
                         suspicious_iframes.append(src)
             
             if suspicious_iframes:
@@ -2177,7 +3997,7 @@ class DomainChecker:
                 hacked_indicators.append(f"Hidden iframes detected: {len(suspicious_iframes)}")
             
             # Check for out-of-place content
-            title = result.get('title', '').lower()
+            title = (title or '').lower()
             if title and page_text:
                 # If title suggests one thing but content is completely different
                 if ('vacation rental' in title and any(spam in text_lower for spam in ['viagra', 'casino', 'porn'])):
@@ -2205,7 +4025,7 @@ class DomainChecker:
             }
 
     # 3. ADD LANGUAGE DETECTION
-    def detect_website_language(self, soup, page_text):
+    def detect_website_language(self, soup, page_text, text_lower=None):
         """Detect the primary language of the website"""
         try:
             languages_detected = []
@@ -2219,7 +4039,7 @@ class DomainChecker:
                 confidence += 30
             
             # 2. Check meta language tags
-            meta_langs = soup.find_all('meta', attrs={'http-equiv': re.compile('content-language', re.I)})
+            meta_langs = soup.find_all('meta', attrs={'http-equiv': CONTENT_LANGUAGE_RE})
             for meta in meta_langs:
                 content = meta.get('content', '').lower()[:2]
                 if content:
@@ -2258,57 +4078,60 @@ class DomainChecker:
                 },
                 'chinese': {
                     'words': [],
-                    'chars': None,  # Check Unicode range instead
-                    'unicode_range': (0x4E00, 0x9FFF)  # CJK Unified Ideographs
+                    'chars': None  # Scored by LANGUAGE_SCRIPT_RANGES instead
                 },
                 'japanese': {
                     'words': [],
-                    'chars': None,
-                    'unicode_range': [(0x3040, 0x309F), (0x30A0, 0x30FF)]  # Hiragana and Katakana
+                    'chars': None
                 },
                 'arabic': {
                     'words': [],
-                    'chars': None,
-                    'unicode_range': (0x0600, 0x06FF)  # Arabic
+                    'chars': None
                 },
                 'russian': {
                     'words': ['и', 'в', 'на', 'с', 'по', 'для', 'не', 'что', 'это', 'как'],
-                    'chars': None,
-                    'unicode_range': (0x0400, 0x04FF)  # Cyrillic
+                    'chars': None
                 }
             }
             
             # Count occurrences of language-specific patterns
-            text_lower = page_text.lower()
-            words = text_lower.split()
+            text_lower = page_text.lower() if text_lower is None else text_lower
+            word_counts = Counter(text_lower.split())
             language_scores = {}
+            # One C-level count of the page's characters; the per-character work below then runs once
+            # per distinct character: accent sets are scored on lowercased characters (lower() maps
+            # character by character, the final-sigma rule aside), scripts on the original ones
+            lower_counts = Counter()
+            script_counts = Counter()
+            if page_text.isascii():
+                # ASCII fast path: no accents or other scripts to find, so only the letters are counted -
+                # one C-level bytes.count per letter instead of counting every character
+                text_bytes = page_text.encode('ascii').lower()
+                lower_counts = Counter(dict(zip(ASCII_LETTERS, map(text_bytes.count, ASCII_LETTER_BYTES))))
+            else:
+                for char, count in Counter(page_text).items():
+                    for lowered in char.lower():
+                        lower_counts[lowered] += count
+                    code = ord(char)
+                    if code > 0x7F:
+                        for lang, ranges in LANGUAGE_SCRIPT_RANGES.items():
+                            if any(low <= code <= high for low, high in ranges):
+                                script_counts[lang] += count
             
             for lang, patterns in language_patterns.items():
                 score = 0
                 
                 # Check common words
                 if patterns['words']:
-                    for word in patterns['words']:
-                        score += words.count(word)
+                    score += sum(word_counts[word] for word in patterns['words'] if word in word_counts)
                 
                 # Check special characters
                 if patterns.get('chars'):
-                    for char in text_lower:
-                        if char in patterns['chars']:
-                            score += 0.5
+                    score += 0.5 * sum(lower_counts[char] for char in patterns['chars'] if char in lower_counts)
                 
                 # Check Unicode ranges
-                if patterns.get('unicode_range'):
-                    for char in page_text:
-                        if isinstance(patterns['unicode_range'], list):
-                            # Multiple ranges (e.g., Japanese)
-                            for range_tuple in patterns['unicode_range']:
-                                if range_tuple[0] <= ord(char) <= range_tuple[1]:
-                                    score += 1
-                        else:
-                            # Single range
-                            if patterns['unicode_range'][0] <= ord(char) <= patterns['unicode_range'][1]:
-                                score += 1
+                if lang in script_counts:
+                    score += script_counts[lang]
                 
                 if score > 0:
                     language_scores[lang] = score
@@ -2358,10 +4181,12 @@ class DomainChecker:
                 'detected_methods': []
             }    
 
-    def detect_third_party_listing(self, soup, page_text, title, description, final_url):
+    def detect_third_party_listing(self, soup, page_text, title, description, final_url, all_text=None):
         """Detect if this is a third-party listing page rather than a direct property owner website"""
         try:
-            all_text = (page_text + ' ' + (title or '') + ' ' + (description or '') + ' ' + (final_url or '')).lower()
+            if all_text is None:
+                all_text = (page_text + ' ' + (title or '') + ' ' + (description or '') + ' ' + (final_url or '')).lower()
+            keyword_counts = self.scan_keywords(all_text)
             
             detection_scores = {
                 'url_patterns': 0,
@@ -2376,30 +4201,19 @@ class DomainChecker:
             
             # 1. URL Pattern Analysis (High Weight)
             url_to_check = final_url or ''
-            for pattern in listing_data['url_patterns']:
-                if re.search(pattern, url_to_check, re.IGNORECASE):
-                    detection_scores['url_patterns'] += 15  # High score for URL patterns
-            
-            # 2. Content Indicators Analysis
-            for indicator in listing_data['content_indicators']:
-                count = all_text.count(indicator)
-                if count > 0:
-                    detection_scores['content_indicators'] += count * 3
-            
-            # 3. Template Structure Indicators
-            for indicator in listing_data['template_indicators']:
-                if indicator in all_text:
-                    detection_scores['template_indicators'] += 4
-            
-            # 4. Navigation/Browse Features
-            for indicator in listing_data['navigation_indicators']:
-                if indicator in all_text:
-                    detection_scores['navigation_indicators'] += 5
-            
-            # 5. Generic Contact Information
-            for indicator in listing_data['generic_contact_indicators']:
-                if indicator in all_text:
-                    detection_scores['generic_contact'] += 6
+            detection_scores['url_patterns'] += 15 * self.third_party_url_patterns.count(url_to_check)  # High score for URL patterns
+            
+            # 2. Content Indicators Analysis - hit counts from the shared keyword scan
+            detection_scores['content_indicators'] += 3 * sum(
+                map(keyword_counts.get, listing_data['content_indicators'], repeat(0)))
+            
+            # 3-5. Template, navigation and generic contact indicators only need presence
+            detection_scores['template_indicators'] += 4 * len(
+                matched_keywords(listing_data['template_indicators'], keyword_counts))
+            detection_scores['navigation_indicators'] += 5 * len(
+                matched_keywords(listing_data['navigation_indicators'], keyword_counts))
+            detection_scores['generic_contact'] += 6 * len(
+                matched_keywords(listing_data['generic_contact_indicators'], keyword_counts))
             
             # 6. Advanced Detection: Page Structure Analysis
             marketplace_structure_score = self.analyze_marketplace_structure(soup, all_text)
@@ -2461,55 +4275,47 @@ class DomainChecker:
         score = 0
         
         try:
+            widgets = count_marketplace_widgets(soup)
+            
             # Check for booking widgets/forms
-            booking_forms = soup.find_all(['form'], class_=re.compile(r'book|reserv|avail', re.I))
-            if len(booking_forms) > 0:
+            if widgets['booking_form'] > 0:
                 score += 8
             
             # Look for calendar widgets
-            calendar_elements = soup.find_all(attrs={'class': re.compile(r'calendar|datepicker|availability', re.I)})
-            if len(calendar_elements) > 0:
+            if widgets['calendar'] > 0:
                 score += 6
             
             # Check for review sections
-            review_elements = soup.find_all(attrs={'class': re.compile(r'review|rating|feedback', re.I)})
-            if len(review_elements) > 2:
+            if widgets['review'] > 2:
                 score += 5
             
             # Look for property gallery/slideshow
-            gallery_elements = soup.find_all(attrs={'class': re.compile(r'gallery|slideshow|carousel|photo', re.I)})
-            if len(gallery_elements) > 0:
+            if widgets['gallery'] > 0:
                 score += 4
             
             # Check for amenities lists
-            amenity_elements = soup.find_all(attrs={'class': re.compile(r'amenity|amenities|feature', re.I)})
-            if len(amenity_elements) > 3:
+            if widgets['amenity'] > 3:
                 score += 3
             
             # Look for property specifications (beds, baths, etc.)
-            spec_patterns = ['bed', 'bath', 'sleep', 'guest', 'sqft', 'sq ft']
-            spec_count = sum(1 for pattern in spec_patterns if pattern in page_text)
+            spec_count = len(matched_keywords(MARKETPLACE_SPEC_KEYWORDS, self.scan_keywords(page_text)))
             if spec_count >= 4:
                 score += 5
             
             # Check for pricing display
-            price_elements = soup.find_all(attrs={'class': re.compile(r'price|rate|cost|fee', re.I)})
-            if len(price_elements) > 2:
+            if widgets['price'] > 2:
                 score += 4
             
             # Look for host/owner profile sections
-            host_elements = soup.find_all(attrs={'class': re.compile(r'host|owner|manager', re.I)})
-            if len(host_elements) > 1:
+            if widgets['host'] > 1:
                 score += 6
             
             # Check for similar properties section
-            similar_elements = soup.find_all(attrs={'class': re.compile(r'similar|related|recommend', re.I)})
-            if len(similar_elements) > 0:
+            if widgets['similar'] > 0:
                 score += 7
             
             # Look for map integration
-            map_elements = soup.find_all(['iframe', 'div'], attrs={'class': re.compile(r'map|location', re.I)})
-            if len(map_elements) > 0:
+            if widgets['map'] > 0:
                 score += 3
             
         except Exception as e:
@@ -2521,33 +4327,12 @@ class DomainChecker:
         """Check against known listing platforms and patterns"""
         score = 0
         
-        # Known listing platform domains
-        listing_platforms = [
-            'airbnb', 'vrbo', 'booking', 'expedia', 'tripadvisor', 'homeaway',
-            'vacasa', 'turnkey', 'awaze', 'novasol', 'rentals.com', 'flipkey',
-            'redawning', 'vacationrenter', 'hometogo', 'rentbyowner',
-            'holidaylettings', 'homelidays', 'wimdu', 'citybase', 'uktvillas',
-            'villasofthepworld', 'luxuryretreats', 'onefinestay', 'sonder',
-            'vacationhomerentals', 'beachhouse', 'mountaincabingetaway'
-        ]
-        
-        url_lower = (url or '').lower()
-        for platform in listing_platforms:
-            if platform in url_lower:
-                score += 20  # High score for known platforms
-                break
+        # Known listing platform domains - one alternation search of the URL
+        if self.patterns['listing_platform_url'].search((url or '').lower()):
+            score += 20  # High score for known platforms
         
         # Check for listing platform branding in content
-        platform_indicators = [
-            'airbnb', 'vrbo', 'booking.com',
-            'tripadvisor', 'homeaway', 'vacasa',
-            'listed on', 'featured on', 'available on', 'book through',
-            'reserve on', 'property management by', 'managed by'
-        ]
-        
-        for indicator in platform_indicators:
-            if indicator in page_text:
-                score += 8
+        score += 8 * len(matched_keywords(LISTING_PLATFORM_BRANDING, self.scan_keywords(page_text)))
         
         return score
 
@@ -2557,7 +4342,8 @@ class DomainChecker:
             all_text = (page_text + ' ' + (title or '') + ' ' + (description or '') + ' ' + (final_url or '')).lower()
             
             # FIRST: Check if this is a third-party listing (HIGHEST PRIORITY)
-            listing_detection = self.detect_third_party_listing(soup, page_text, title, description, final_url)
+            listing_detection = self.detect_third_party_listing(soup, page_text, title, description, final_url,
+                                                                all_text=all_text)
             
             if listing_detection['is_third_party_listing'] and listing_detection['confidence'] > 70:
                 return {
@@ -2570,8 +4356,9 @@ class DomainChecker:
                 }
             
             # Check URL for major platforms first
+            final_url_lower = (final_url or '').lower()
             for platform_url in self.vacation_rental_business_models['marketplace_platforms']['url_indicators']:
-                if platform_url in (final_url or '').lower():
+                if platform_url in final_url_lower:
                     return {
                         'business_model': 'marketplace_platform',
                         'exclusion_reason': 'marketplace_platform',
@@ -2580,6 +4367,9 @@ class DomainChecker:
                         'platform_detected': platform_url
                     }
             
+            # Neither early exit fired - score from the page's keyword scan, already cached by the listing check
+            keyword_counts = self.scan_keywords(all_text)
+            
             # Score different business models
             scores = {
                 'marketplace_platform': 0,
@@ -2590,68 +4380,30 @@ class DomainChecker:
                 'third_party_listing': listing_detection['weighted_score'] if listing_detection['is_third_party_listing'] else 0
             }
             
-            # Check marketplace platform indicators
-            for keyword in self.vacation_rental_business_models['marketplace_platforms']['keywords']:
-                count = all_text.count(keyword)
-                if count > 0:
-                    if keyword in ['airbnb', 'vrbo', 'booking.com', 'expedia']:
-                        scores['marketplace_platform'] += count * 10  # Strong indicators
-                    else:
-                        scores['marketplace_platform'] += count * 3
-            
-            # Check B2B service provider indicators
-            for keyword in self.vacation_rental_business_models['b2b_service_providers']['keywords']:
-                count = all_text.count(keyword)
-                if count > 0:
-                    if keyword in ['property management software', 'vacation rental software', 'pms']:
-                        scores['b2b_service_provider'] += count * 8
-                    elif keyword in ['tools', 'software', 'platform', 'solution']:
-                        scores['b2b_service_provider'] += count * 4
-                    else:
-                        scores['b2b_service_provider'] += count * 2
-            
-            # Check marketing/lead gen indicators
-            for keyword in self.vacation_rental_business_models['marketing_lead_gen']['keywords']:
-                count = all_text.count(keyword)
-                if count > 0:
-                    scores['marketing_service'] += count * 3
-            
-            # Check aggregator indicators
-            for keyword in self.vacation_rental_business_models['aggregator_listing_sites']['keywords']:
-                count = all_text.count(keyword)
-                if count > 0:
-                    scores['aggregator_site'] += count * 3
-            
-            # Check for actual rental operator indicators
-            for keyword in self.vacation_rental_business_models['actual_rental_operators']['positive_indicators']:
-                count = all_text.count(keyword)
-                if count > 0:
-                    if keyword in ['our properties', 'our rentals', 'our vacation homes', 'direct owner', 'property owner']:
-                        scores['direct_rental_operator'] += count * 10  # Strongest indicators
-                    elif keyword in ['family owned', 'locally owned', 'personal service', 'no booking fees']:
-                        scores['direct_rental_operator'] += count * 8
-                    else:
-                        scores['direct_rental_operator'] += count * 3
+            # Marketplace, B2B, marketing, aggregator and direct operator keywords - one weight lookup per hit
+            for keyword, count in keyword_counts.items():
+                for model, weight in BUSINESS_MODEL_KEYWORD_WEIGHTS.get(keyword, ()):
+                    scores[model] += count * weight
             
             # Additional signals for direct operators
             # Look for specific property types
-            property_types = ['beach house', 'mountain cabin', 'lake house', 'ski chalet', 'downtown condo']
-            for prop_type in property_types:
-                if prop_type in all_text:
+            for prop_type in DIRECT_OPERATOR_PROPERTY_TYPES:
+                if prop_type in keyword_counts:
                     scores['direct_rental_operator'] += 3
             
             # Look for local area mentions (indicates local business)
-            location_phrases = ['located in', 'based in', 'serving', 'minutes from', 'close to', 'near']
-            for phrase in location_phrases:
-                if phrase in all_text:
+            for phrase in DIRECT_OPERATOR_LOCATION_PHRASES:
+                if phrase in keyword_counts:
                     scores['direct_rental_operator'] += 2
             
             # PENALTY: If listing detection found significant evidence, penalize direct operator score
             if listing_detection['confidence'] > 50:
                 scores['direct_rental_operator'] = max(0, scores['direct_rental_operator'] - listing_detection['confidence'] // 10)
             
-            # Determine the winner
-            if max(scores.values()) == 0:
+            # Determine the winner - scores are never negative, so a zero top score means no evidence
+            top_model = max(scores, key=scores.get)
+            top_score = scores[top_model]
+            if top_score == 0:
                 return {
                     'business_model': 'unknown',
                     'exclusion_reason': None,
@@ -2661,9 +4413,8 @@ class DomainChecker:
                     'listing_detection': listing_detection
                 }
             
-            top_model = max(scores, key=scores.get)
-            top_score = scores[top_model]
-            confidence = min(95, (top_score / sum(scores.values()) * 100) if sum(scores.values()) > 0 else 0)
+            total_score = sum(scores.values())
+            confidence = min(95, top_score / total_score * 100)
             
             # Special handling for third-party listings
             if top_model == 'third_party_listing' or listing_detection['confidence'] > 60:
@@ -2711,77 +4462,41 @@ class DomainChecker:
                 'listing_detection': {}
             }
 
-    def classify_company_size(self, soup, page_text, title, description):
+    def classify_company_size(self, soup, page_text, title, description, all_text=None, website_metrics=None):
         """Enhanced company size classification with detailed analysis (prioritizing small businesses)"""
         try:
-            all_text = (page_text + ' ' + (title or '') + ' ' + (description or '')).lower()
+            if all_text is None:
+                all_text = (page_text + ' ' + (title or '') + ' ' + (description or '')).lower()
             
             # Initialize scores - SMALL BUSINESS GETS HIGHER MULTIPLIERS
             large_score = 0
             medium_score = 0
             small_score = 0
             
+            keyword_counts = self.scan_keywords(all_text)
+            keyword_totals = self.keyword_matcher.tag_totals(keyword_counts)
+            
             # Check for LARGE company indicators (these are red flags for vacation rental operators)
-            for category, keywords in self.large_company_indicators.items():
-                for keyword in keywords:
-                    count = all_text.count(keyword)
-                    if count > 0:
-                        if category == 'listing_platform_keywords':
-                            large_score += count * 15  # Strong indicator of listing platform
-                        elif category == 'headquarters_indicators':
-                            large_score += count * 12  # Strong corporate indicator
-                        elif category == 'fortune_keywords':
-                            large_score += count * 10  # Public company indicator
-                        elif category == 'big_business_indicators':
-                            large_score += count * 8   # Corporate communications
-                        elif category == 'scale_indicators':
-                            large_score += count * 6
-                        elif category == 'corporate_structure':
-                            large_score += count * 4
-                        else:
-                            large_score += count * 3
+            for category in self.large_company_indicators:
+                large_score += keyword_totals.get(('large', category), 0) * LARGE_COMPANY_CATEGORY_WEIGHTS.get(category, 3)
             
             # Check for MEDIUM company indicators
-            for category, keywords in self.medium_company_indicators.items():
-                for keyword in keywords:
-                    count = all_text.count(keyword)
-                    if count > 0:
-                        if category == 'medium_scale_indicators':
-                            medium_score += count * 4
-                        else:
-                            medium_score += count * 3
+            for category in self.medium_company_indicators:
+                weight = 4 if category == 'medium_scale_indicators' else 3
+                medium_score += keyword_totals.get(('medium', category), 0) * weight
             
             # Check for SMALL company indicators (HIGHER SCORES - these are preferred!)
-            for category, keywords in self.small_company_indicators.items():
-                for keyword in keywords:
-                    count = all_text.count(keyword)
-                    if count > 0:
-                        if category == 'authentic_small_business':
-                            small_score += count * 8  # Highest score for authentic small business
-                        elif category == 'local_business':
-                            small_score += count * 6  # High score for local business
-                        elif category == 'personal_touch':
-                            small_score += count * 6  # High score for personal service
-                        elif category == 'single_location_indicators':
-                            small_score += count * 5  # Good score for single location
-                        else:
-                            small_score += count * 4
+            for category in self.small_company_indicators:
+                small_score += keyword_totals.get(('small', category), 0) * SMALL_COMPANY_CATEGORY_WEIGHTS.get(category, 4)
             
             # Technology stack analysis
-            for keyword in self.tech_indicators['enterprise_tech']:
-                if keyword in all_text:
-                    large_score += 8  # Enterprise tech = big business
-            
-            for keyword in self.tech_indicators['enterprise_hosting']:
-                if keyword in all_text:
-                    large_score += 5
-            
-            for keyword in self.tech_indicators['small_business_tech']:
-                if keyword in all_text:
-                    small_score += 6  # Small business tech = good sign
+            large_score += 8 * len(matched_keywords(self.tech_indicators['enterprise_tech'], keyword_counts))  # Enterprise tech = big business
+            large_score += 5 * len(matched_keywords(self.tech_indicators['enterprise_hosting'], keyword_counts))
+            small_score += 6 * len(matched_keywords(self.tech_indicators['small_business_tech'], keyword_counts))  # Small business tech = good sign
             
             # Enhanced website complexity analysis
-            website_metrics = self.analyze_detailed_website_metrics(soup)
+            if website_metrics is None:
+                website_metrics = self.analyze_detailed_website_metrics(soup)
             complexity_score = website_metrics.get('complexity_score', 0)
             
             # Complexity scoring (simpler sites = smaller businesses = better for vacation rentals)
@@ -2840,12 +4555,7 @@ class DomainChecker:
                 small_score += 3  # Single location implied = small business
             
             # Check for specific large business red flags
-            red_flags = [
-                'api integration', 'enterprise api', 'developer portal', 'white label',
-                'franchise opportunities', 'investor relations', 'press releases',
-                'corporate partnerships', 'global expansion', 'ipo', 'acquisition'
-            ]
-            red_flag_count = sum(1 for flag in red_flags if flag in all_text)
+            red_flag_count = len(matched_keywords(LARGE_BUSINESS_RED_FLAGS, keyword_counts))
             if red_flag_count > 0:
                 large_score += red_flag_count * 5
             
@@ -2914,37 +4624,39 @@ class DomainChecker:
         try:
             score = 0
             
+            elements = scan_element_counts(soup)
+            tags = elements['tags']
+            
             # Navigation complexity
-            nav_items = soup.find_all(['nav', 'ul', 'li'])
-            if len(nav_items) > 20:
+            nav_items = tags['nav'] + tags['ul'] + tags['li']
+            if nav_items > 20:
                 score += 5
-            elif len(nav_items) > 10:
+            elif nav_items > 10:
                 score += 3
             
             # Page structure
-            sections = soup.find_all(['section', 'div', 'article'])
-            if len(sections) > 50:
+            sections = tags['section'] + tags['div'] + tags['article']
+            if sections > 50:
                 score += 4
-            elif len(sections) > 25:
+            elif sections > 25:
                 score += 2
             
             # Forms and interactive elements
-            forms = soup.find_all(['form', 'input', 'select', 'textarea'])
-            if len(forms) > 15:
+            forms = tags['form'] + tags['input'] + tags['select'] + tags['textarea']
+            if forms > 15:
                 score += 3
-            elif len(forms) > 8:
+            elif forms > 8:
                 score += 2
             
             # External resources (scripts, stylesheets)
-            scripts = soup.find_all('script', src=True)
-            stylesheets = soup.find_all('link', rel='stylesheet')
-            if len(scripts) + len(stylesheets) > 20:
+            resources = elements['script_sources'] + elements['stylesheets']
+            if resources > 20:
                 score += 4
-            elif len(scripts) + len(stylesheets) > 10:
+            elif resources > 10:
                 score += 2
             
             # Advanced features
-            if soup.find(['video', 'audio', 'canvas', 'svg']):
+            if tags['video'] or tags['audio'] or tags['canvas'] or tags['svg']:
                 score += 2
             
             return score
@@ -2956,29 +4668,15 @@ class DomainChecker:
         """Analyze social media presence"""
         try:
             score = 0
-            social_platforms = [
-                'facebook', 'twitter', 'linkedin', 'instagram', 'youtube',
-                'tiktok', 'pinterest', 'snapchat', 'telegram', 'whatsapp'
-            ]
-            
-            # Check for social media links
-            links = soup.find_all('a', href=True)
-            social_links = set()
-            
-            for link in links:
-                href = link.get('href', '').lower()
-                for platform in social_platforms:
-                    if platform in href:
-                        social_links.add(platform)
+            # Check for social media links - one search over all link targets
+            hrefs = '\0'.join(link.get('href', '') for link in soup.find_all('a', href=True)).lower()
+            social_links = set(SOCIAL_PLATFORM_RE.findall(hrefs))
             
             # Score based on number of platforms
             score += len(social_links) * 2
             
             # Check for social sharing buttons
-            social_sharing_indicators = ['share', 'tweet', 'like', 'follow']
-            for indicator in social_sharing_indicators:
-                if indicator in page_text:
-                    score += 1
+            score += len(matched_keywords(SOCIAL_SHARING_INDICATORS, self.scan_keywords(page_text)))
             
             return score
             
@@ -2988,44 +4686,27 @@ class DomainChecker:
     def detect_employee_count(self, text):
         """Detect employee count indicators"""
         try:
-            # Look for specific employee count mentions
-            employee_patterns = [
-                (r'(\d+),?(\d+)?\+?\s*employees', 'count'),
-                (r'over\s+(\d+),?(\d+)?\s*employees', 'over'),
-                (r'more than\s+(\d+),?(\d+)?\s*employees', 'over'),
-                (r'(\d+),?(\d+)?\+?\s*team members', 'count'),
-                (r'(\d+),?(\d+)?\+?\s*staff', 'count')
-            ]
-            
-            for pattern, type_indicator in employee_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
-                    for match in matches:
-                        try:
-                            # Handle tuple from regex groups
-                            if isinstance(match, tuple):
-                                num_str = ''.join(match).replace(',', '')
-                            else:
-                                num_str = str(match).replace(',', '')
-                            
-                            if num_str.isdigit():
-                                count = int(num_str)
-                                if count >= 1000:
-                                    return {'size': 'large', 'count': count, 'type': type_indicator}
-                                elif count >= 50:
-                                    return {'size': 'medium', 'count': count, 'type': type_indicator}
-                                elif count >= 1:
-                                    return {'size': 'small', 'count': count, 'type': type_indicator}
-                        except (ValueError, TypeError):
-                            continue
+            # Look for specific employee count mentions - first positive count per unit, one scan
+            unit_counts = {}
+            for match in EMPLOYEE_COUNT_RE.finditer(text):
+                unit = match.lastindex
+                if unit not in unit_counts:
+                    count = int(match.group(1) + (match.group(2) or ''))
+                    if count >= 1:
+                        unit_counts[unit] = count
+            if unit_counts:
+                count = unit_counts[min(unit_counts)]
+                if count >= 1000:
+                    return {'size': 'large', 'count': count, 'type': 'count'}
+                elif count >= 50:
+                    return {'size': 'medium', 'count': count, 'type': 'count'}
+                return {'size': 'small', 'count': count, 'type': 'count'}
             
             # Look for general size indicators
-            if any(indicator in text for indicator in ['thousands of employees', 'million employees']):
-                return {'size': 'large', 'count': None, 'type': 'estimate'}
-            elif any(indicator in text for indicator in ['hundreds of employees', 'large team']):
-                return {'size': 'medium', 'count': None, 'type': 'estimate'}
-            elif any(indicator in text for indicator in ['small team', 'boutique', 'family business']):
-                return {'size': 'small', 'count': None, 'type': 'estimate'}
+            keyword_totals = self.keyword_matcher.tag_totals(self.scan_keywords(text))
+            for size in EMPLOYEE_ESTIMATE_PHRASES:
+                if ('employee_estimate', size) in keyword_totals:
+                    return {'size': size, 'count': None, 'type': 'estimate'}
             
             return {'size': None, 'count': None, 'type': None}
             
@@ -3038,63 +4719,45 @@ class DomainChecker:
             score = 0
             
             # Look for multiple locations
-            location_patterns = [
-                r'(\d+)\s*offices?',
-                r'(\d+)\s*locations?',
-                r'(\d+)\s*branches?',
-                r'(\d+)\s*stores?',
-                r'(\d+)\s*facilities',
-                r'(\d+)\s*countries',
-                r'(\d+)\s*states'
-            ]
-            
-            for pattern in location_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    try:
-                        count = int(match)
-                        if count >= 100:
-                            score += 8
-                        elif count >= 50:
-                            score += 6
-                        elif count >= 10:
-                            score += 4
-                        elif count >= 5:
-                            score += 2
-                        elif count >= 2:
-                            score += 1
-                    except ValueError:
-                        continue
+            for match in LOCATION_COUNT_RE.findall(text):
+                count = int(match)
+                if count >= 100:
+                    score += 8
+                elif count >= 50:
+                    score += 6
+                elif count >= 10:
+                    score += 4
+                elif count >= 5:
+                    score += 2
+                elif count >= 2:
+                    score += 1
             
             # Look for global presence indicators
-            global_indicators = [
-                'worldwide', 'global presence', 'international offices',
-                'offices around the world', 'global locations'
-            ]
-            
-            for indicator in global_indicators:
-                if indicator in text:
-                    score += 3
+            score += 3 * len(matched_keywords(GLOBAL_PRESENCE_INDICATORS, self.scan_keywords(text)))
             
             return score
             
         except Exception:
             return 0
 
-    def classify_industry(self, page_text, title, description):
+    def classify_industry(self, page_text, title, description, all_text=None):
         """Classify industry type"""
         try:
-            all_text = (page_text + ' ' + (title or '') + ' ' + (description or '')).lower()
+            if all_text is None:
+                all_text = (page_text + ' ' + (title or '') + ' ' + (description or '')).lower()
+            title_lower = (title or '').lower()
+            description_lower = (description or '').lower()
             industry_scores = {}
+            keyword_counts = self.scan_keywords(all_text)
             
             for industry, keywords in self.industry_keywords.items():
                 score = 0
                 for keyword in keywords:
-                    if keyword in all_text:
-                        frequency = all_text.count(keyword)
-                        if title and keyword in title.lower():
+                    frequency = keyword_counts.get(keyword, 0)
+                    if frequency:
+                        if title and keyword in title_lower:
                             score += frequency * 3
-                        elif description and keyword in description.lower():
+                        elif description and keyword in description_lower:
                             score += frequency * 2
                         else:
                             score += frequency
@@ -3115,52 +4778,42 @@ class DomainChecker:
             logger.error(f"Error classifying industry: {e}")
             return {'industry': 'unknown', 'confidence': 0}
 
-    def is_business_website(self, soup, page_text):
+    def is_business_website(self, soup, page_text, text_lower=None):
         """Check if it's a business website - FIXED VERSION"""
+        text_lower = page_text.lower() if text_lower is None else text_lower
+        # Shared keyword scan of the page - already cached by the hacked-site check
+        keyword_counts = self.scan_keywords(text_lower)
+        
         # Special handling for vacation rental sites
-        if any(vr_term in page_text.lower() for vr_term in [
-            'vacation rental', 'holiday rental', 'property rental',
-            'beach house', 'cabin rental', 'vacation home'
-        ]):
+        if any(map(keyword_counts.__contains__, VR_SITE_TERMS)):
             # Lower threshold for VR sites
-            vr_business_indicators = [
-                'contact', 'email', 'phone', 'book', 'availability',
-                'property', 'rental', 'rate', 'price', 'location'
-            ]
-            vr_content_count = sum(1 for indicator in vr_business_indicators if indicator in page_text.lower())
-            
             # If it has VR terms and some business indicators, it's a business
-            if vr_content_count >= 2:
+            if at_least(2, map(keyword_counts.__contains__, VR_BUSINESS_INDICATORS)):
                 return True
         
         # Original business detection logic
-        business_indicators = [
-            'about us', 'contact us', 'services', 'products', 'company',
-            'business', 'team', 'careers', 'support', 'customer',
-            'phone', 'email', 'address', 'location', 'hours'
-        ]
-        
-        nav_elements = soup.find_all(['nav', 'menu'])
-        has_navigation = len(nav_elements) > 0
-        
-        business_content_count = sum(1 for indicator in business_indicators if indicator in page_text.lower())
-        
-        has_contact = bool(re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', page_text) or 
-                          re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', page_text))
-        
+        # Checks run cheapest first and stop as soon as the threshold is reached
         score = 0
-        if has_navigation: score += 2
-        if business_content_count >= 3: score += 2
+        if soup.find(['nav', 'menu']) is not None: score += 2
+        if at_least(3, map(keyword_counts.__contains__, BUSINESS_INDICATORS)): score += 2
+        if score >= 3:
+            return True
+        
+        has_contact = bool(US_PHONE_RE.search(page_text) or EMAIL_RE.search(page_text))
         if has_contact: score += 2
-        if len(page_text.split()) > 50: score += 1  # Lowered from 100 to 50
+        if score >= 3:
+            return True
+        
+        if count_words(page_text, 51) > 50: score += 1  # Lowered from 100 to 50
         
         return score >= 3  # Lowered from 4 to 3
 
 
-    def extract_business_info(self, soup):
+    def extract_business_info(self, soup, page_text=None, website_metrics=None, text_lower=None):
         """Extract comprehensive business information including contact details, social media, and location"""
         info = {}
-        page_text = soup.get_text()
+        page_text = soup.get_text() if page_text is None else page_text
+        page_text_lower = page_text.lower() if text_lower is None else text_lower  # shared by the helpers below
         
         # Company name - try multiple sources
         company_name = None
@@ -3181,30 +4834,21 @@ class DomainChecker:
         info['company_name'] = company_name or ''
         
         # Extract all emails
-        emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', page_text)
+        emails = EMAIL_RE.findall(page_text)
         # Filter out common generic emails and keep unique ones
         filtered_emails = []
-        generic_prefixes = ['info', 'contact', 'admin', 'support', 'hello', 'mail', 'office']
         for email in set(emails):  # Remove duplicates
-            email_lower = email.lower()
             # Skip obviously fake or generic emails
-            if not any(skip in email_lower for skip in ['noreply', 'donotreply', 'example', 'test', 'spam']):
+            if not PLACEHOLDER_EMAIL_RE.search(email.lower()):
                 filtered_emails.append(email)
         
         info['emails'] = filtered_emails[:5]  # Limit to 5 emails
         info['primary_email'] = filtered_emails[0] if filtered_emails else ''
         
         # Extract all phone numbers with better patterns
-        phone_patterns = [
-            r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b',  # US format
-            r'\(\d{3}\)\s?\d{3}[-.\s]?\d{4}',      # (123) 456-7890
-            r'\b\d{3}\.\d{3}\.\d{4}\b',            # 123.456.7890
-            r'\+\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}',  # International
-        ]
-        
         phones = []
-        for pattern in phone_patterns:
-            phones.extend(re.findall(pattern, page_text))
+        for pattern in PHONE_REGEXES:
+            phones.extend(pattern.findall(page_text))
         
         # Clean and deduplicate phones
         cleaned_phones = []
@@ -3221,7 +4865,7 @@ class DomainChecker:
         info['address'] = address
         
         # Extract location and country information
-        location_info = self.extract_location_and_country(soup, page_text, address)
+        location_info = self.extract_location_and_country(soup, page_text, address, text_lower=page_text_lower)
         info.update(location_info)
         
         # Extract social media links
@@ -3229,30 +4873,23 @@ class DomainChecker:
         info['social_media'] = social_media
         
         # Extract business hours
-        hours = self.extract_business_hours(page_text)
+        hours = self.extract_business_hours(page_text, text_lower=page_text_lower)
         info['business_hours'] = hours
         
         # Check for online booking/reservation systems
-        booking_indicators = ['book now', 'reserve now', 'schedule appointment', 'book online', 'make reservation']
-        info['has_online_booking'] = any(indicator in page_text.lower() for indicator in booking_indicators)
+        info['has_online_booking'] = bool(matched_keywords(ONLINE_BOOKING_PHRASES, self.scan_keywords(page_text_lower)))
         
         # Extract website complexity metrics
-        info['website_metrics'] = self.analyze_detailed_website_metrics(soup)
+        if website_metrics is None:
+            website_metrics = self.analyze_detailed_website_metrics(soup, page_text)
+        info['website_metrics'] = website_metrics
         
         return info
 
     def extract_address(self, soup, page_text):
         """Extract physical address from webpage"""
-        address_patterns = [
-            # Street address patterns
-            r'\d+\s+[A-Za-z0-9\s,.-]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Court|Ct|Place|Pl)\s*,?\s*[A-Za-z\s]+,?\s*[A-Z]{2}\s+\d{5}',
-            r'\d+\s+[A-Za-z0-9\s,.-]+,\s*[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}',
-            # PO Box patterns
-            r'P\.?O\.?\s+Box\s+\d+,?\s*[A-Za-z\s]+,?\s*[A-Z]{2}\s+\d{5}',
-        ]
-        
-        for pattern in address_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
+        for pattern in ADDRESS_REGEXES:
+            matches = pattern.findall(page_text)
             if matches:
                 # Return the first reasonable looking address
                 for match in matches:
@@ -3260,17 +4897,17 @@ class DomainChecker:
                         return match.strip()
         
         # Try to find address in structured data or contact sections
-        contact_sections = soup.find_all(['div', 'section'], class_=re.compile(r'contact|address|location', re.I))
+        contact_sections = soup.find_all(['div', 'section'], class_=CONTACT_SECTION_CLASS_RE)
         for section in contact_sections:
             section_text = section.get_text()
-            for pattern in address_patterns:
-                matches = re.findall(pattern, section_text, re.IGNORECASE)
+            for pattern in ADDRESS_REGEXES:
+                matches = pattern.findall(section_text)
                 if matches:
                     return matches[0].strip()
         
         return ''
 
-    def extract_location_and_country(self, soup, page_text, address):
+    def extract_location_and_country(self, soup, page_text, address, text_lower=None):
         """Extract detailed location and country information"""
         location_info = {
             'country': '',
@@ -3283,113 +4920,30 @@ class DomainChecker:
         }
         
         try:
-            # Country detection patterns
-            country_patterns = {
-                'United States': {
-                    'patterns': [
-                        r'\b(?:USA|United States|US|America)\b',
-                        r'\b[A-Z]{2}\s+\d{5}(?:-\d{4})?\b',  # US ZIP codes
-                        r'\b(?:AL|AK|AZ|AR|CA|CO|CT|DE|FL|GA|HI|ID|IL|IN|IA|KS|KY|LA|ME|MD|MA|MI|MN|MS|MO|MT|NE|NV|NH|NJ|NM|NY|NC|ND|OH|OK|OR|PA|RI|SC|SD|TN|TX|UT|VT|VA|WA|WV|WI|WY)\s+\d{5}\b',
-                    ],
-                    'indicators': ['USD', 'dollars', 'ZIP', 'state', 'county'],
-                    'states': ['Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado', 'Connecticut', 'Delaware', 'Florida', 'Georgia', 'Hawaii', 'Idaho', 'Illinois', 'Indiana', 'Iowa', 'Kansas', 'Kentucky', 'Louisiana', 'Maine', 'Maryland', 'Massachusetts', 'Michigan', 'Minnesota', 'Mississippi', 'Missouri', 'Montana', 'Nebraska', 'Nevada', 'New Hampshire', 'New Jersey', 'New Mexico', 'New York', 'North Carolina', 'North Dakota', 'Ohio', 'Oklahoma', 'Oregon', 'Pennsylvania', 'Rhode Island', 'South Carolina', 'South Dakota', 'Tennessee', 'Texas', 'Utah', 'Vermont', 'Virginia', 'Washington', 'West Virginia', 'Wisconsin', 'Wyoming']
-                },
-                'Canada': {
-                    'patterns': [
-                        r'\bCanada\b',
-                        r'\b[A-Z]\d[A-Z]\s*\d[A-Z]\d\b',  # Canadian postal codes
-                        r'\b(?:AB|BC|MB|NB|NL|NS|NT|NU|ON|PE|QC|SK|YT)\b',
-                    ],
-                    'indicators': ['CAD', 'Canadian', 'province', 'postal code'],
-                    'provinces': ['Alberta', 'British Columbia', 'Manitoba', 'New Brunswick', 'Newfoundland and Labrador', 'Northwest Territories', 'Nova Scotia', 'Nunavut', 'Ontario', 'Prince Edward Island', 'Quebec', 'Saskatchewan', 'Yukon']
-                },
-                'United Kingdom': {
-                    'patterns': [
-                        r'\b(?:UK|United Kingdom|Britain|England|Scotland|Wales|Northern Ireland)\b',
-                        r'\b[A-Z]{1,2}\d[A-Z\d]?\s*\d[A-Z]{2}\b',  # UK postcodes
-                    ],
-                    'indicators': ['£', 'GBP', 'pounds', 'postcode', 'shire', 'county'],
-                    'regions': ['England', 'Scotland', 'Wales', 'Northern Ireland']
-                },
-                'Australia': {
-                    'patterns': [
-                        r'\bAustralia\b',
-                        r'\b\d{4}\s*(?:NSW|VIC|QLD|WA|SA|TAS|ACT|NT)\b',
-                    ],
-                    'indicators': ['AUD', 'Australian', 'postcode'],
-                    'states': ['New South Wales', 'Victoria', 'Queensland', 'Western Australia', 'South Australia', 'Tasmania', 'Australian Capital Territory', 'Northern Territory']
-                },
-                'Germany': {
-                    'patterns': [
-                        r'\bDeutschland\b|\bGermany\b',
-                        r'\b\d{5}\s*(?:Germany|Deutschland)\b',
-                    ],
-                    'indicators': ['EUR', '€', 'euros', 'German'],
-                    'regions': ['Bavaria', 'Baden-Württemberg', 'North Rhine-Westphalia', 'Berlin', 'Hamburg']
-                },
-                'France': {
-                    'patterns': [
-                        r'\bFrance\b|\bFrançais\b',
-                        r'\b\d{5}\s*France\b',
-                    ],
-                    'indicators': ['EUR', '€', 'euros', 'French'],
-                    'regions': ['Paris', 'Lyon', 'Marseille', 'Toulouse', 'Nice']
-                },
-                'Spain': {
-                    'patterns': [
-                        r'\bSpain\b|\bEspaña\b',
-                        r'\b\d{5}\s*Spain\b',
-                    ],
-                    'indicators': ['EUR', '€', 'euros', 'Spanish'],
-                    'regions': ['Madrid', 'Barcelona', 'Valencia', 'Seville', 'Bilbao']
-                },
-                'Italy': {
-                    'patterns': [
-                        r'\bItaly\b|\bItalia\b',
-                        r'\b\d{5}\s*Italy\b',
-                    ],
-                    'indicators': ['EUR', '€', 'euros', 'Italian'],
-                    'regions': ['Rome', 'Milan', 'Naples', 'Turin', 'Florence']
-                },
-                'Netherlands': {
-                    'patterns': [
-                        r'\bNetherlands\b|\bHolland\b',
-                        r'\b\d{4}\s*[A-Z]{2}\s*Netherlands\b',
-                    ],
-                    'indicators': ['EUR', '€', 'euros', 'Dutch'],
-                    'regions': ['Amsterdam', 'Rotterdam', 'The Hague', 'Utrecht']
-                },
-                'Mexico': {
-                    'patterns': [
-                        r'\bMexico\b|\bMéxico\b',
-                        r'\b\d{5}\s*Mexico\b',
-                    ],
-                    'indicators': ['MXN', 'pesos', 'Mexican'],
-                    'regions': ['Mexico City', 'Guadalajara', 'Monterrey', 'Cancun', 'Puerto Vallarta']
-                }
-            }
-            
-            text_lower = page_text.lower()
+            text_lower = page_text.lower() if text_lower is None else text_lower
+            # Indicator and region names come from the shared keyword scan of the page
+            keyword_counts = self.scan_keywords(text_lower)
             country_scores = {}
             
             # Score countries based on patterns and indicators
-            for country, data in country_patterns.items():
+            for country, data in COUNTRY_PATTERNS.items():
                 score = 0
+                indicators, regions = COUNTRY_TERMS[country]
                 
                 # Check patterns
-                for pattern in data['patterns']:
-                    matches = len(re.findall(pattern, page_text, re.IGNORECASE))
+                for pattern in COUNTRY_REGEXES[country]:
+                    matches = len(pattern.findall(page_text))
                     if matches > 0:
                         score += matches * 10
                 
                 # Check indicators
-                for indicator in data['indicators']:
-                    if indicator.lower() in text_lower:
+                for indicator, indicator_lower in indicators:
+                    if indicator_lower in keyword_counts:
                         score += 5
                 
                 # Check states/provinces/regions
-                for region in data.get('states', data.get('provinces', data.get('regions', []))):
-                    if region.lower() in text_lower:
+                for region, region_lower in regions:
+                    if region_lower in keyword_counts:
                         score += 8
                         location_info['state_province'] = region
                 
@@ -3398,33 +4952,16 @@ class DomainChecker:
             
             # Additional country detection from address
             if address:
-                address_lower = address.lower()
-                for country, data in country_patterns.items():
-                    for pattern in data['patterns']:
-                        if re.search(pattern, address, re.IGNORECASE):
+                for country, patterns in COUNTRY_REGEXES.items():
+                    for pattern in patterns:
+                        if pattern.search(address):
                             country_scores[country] = country_scores.get(country, 0) + 15
             
-            # Domain-based country detection
-            domain_tlds = {
-                '.uk': 'United Kingdom',
-                '.co.uk': 'United Kingdom',
-                '.ca': 'Canada',
-                '.au': 'Australia',
-                '.com.au': 'Australia',
-                '.de': 'Germany',
-                '.fr': 'France',
-                '.es': 'Spain',
-                '.it': 'Italy',
-                '.nl': 'Netherlands',
-                '.mx': 'Mexico',
-                '.com.mx': 'Mexico'
-            }
-            
-            # Check current page URL for TLD
+            # Domain-based country detection - check current page URL for TLD
             current_url = soup.find('link', {'rel': 'canonical'})
             if current_url:
                 url = current_url.get('href', '')
-                for tld, country in domain_tlds.items():
+                for tld, country in COUNTRY_TLDS.items():
                     if tld in url:
                         country_scores[country] = country_scores.get(country, 0) + 12
             
@@ -3439,16 +4976,16 @@ class DomainChecker:
                 location_info['country_confidence'] = round(confidence)
             
             # Extract cities and local areas
-            location_info['city'] = self.extract_city_names(page_text, location_info['country'])
+            location_info['city'] = self.extract_city_names(page_text, location_info['country'], text_lower=text_lower)
             location_info['local_area'] = self.extract_local_areas(page_text)
             location_info['serves_locations'] = self.extract_service_areas(page_text)
             
             # Compile location indicators found
             location_indicators = []
-            for country, data in country_patterns.items():
+            for country, (indicators, regions) in COUNTRY_TERMS.items():
                 if country in country_scores:
-                    for indicator in data['indicators']:
-                        if indicator.lower() in text_lower:
+                    for indicator, indicator_lower in indicators:
+                        if indicator_lower in keyword_counts:
                             location_indicators.append(indicator)
             
             location_info['location_indicators'] = list(set(location_indicators))
@@ -3458,100 +4995,50 @@ class DomainChecker:
         
         return location_info
 
-    def extract_city_names(self, page_text, country):
+    def extract_city_names(self, page_text, country, text_lower=None):
         """Extract city names based on country context"""
         cities = []
+        seen_cities = set()
         
-        # Common city patterns by country
-        city_databases = {
-            'United States': [
-                'New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix', 'Philadelphia',
-                'San Antonio', 'San Diego', 'Dallas', 'San Jose', 'Austin', 'Jacksonville',
-                'Fort Worth', 'Columbus', 'Charlotte', 'San Francisco', 'Indianapolis',
-                'Seattle', 'Denver', 'Washington', 'Boston', 'El Paso', 'Nashville',
-                'Detroit', 'Oklahoma City', 'Portland', 'Las Vegas', 'Memphis', 'Louisville',
-                'Baltimore', 'Milwaukee', 'Albuquerque', 'Tucson', 'Fresno', 'Sacramento',
-                'Mesa', 'Kansas City', 'Atlanta', 'Long Beach', 'Colorado Springs', 'Raleigh',
-                'Miami', 'Virginia Beach', 'Omaha', 'Oakland', 'Minneapolis', 'Tulsa',
-                'Arlington', 'Tampa', 'New Orleans', 'Wichita', 'Cleveland', 'Bakersfield'
-            ],
-            'Canada': [
-                'Toronto', 'Montreal', 'Vancouver', 'Calgary', 'Edmonton', 'Ottawa',
-                'Winnipeg', 'Quebec City', 'Hamilton', 'Kitchener', 'London', 'Victoria',
-                'Halifax', 'Oshawa', 'Windsor', 'Saskatoon', 'St. Catharines', 'Regina',
-                'Kelowna', 'Barrie', 'Sherbrooke', 'Guelph', 'Kanata', 'Abbotsford'
-            ],
-            'United Kingdom': [
-                'London', 'Birmingham', 'Manchester', 'Glasgow', 'Liverpool', 'Edinburgh',
-                'Leeds', 'Sheffield', 'Bristol', 'Cardiff', 'Leicester', 'Belfast',
-                'Nottingham', 'Newcastle', 'Brighton', 'Hull', 'Plymouth', 'Stoke',
-                'Wolverhampton', 'Derby', 'Swansea', 'Southampton', 'Salford', 'Aberdeen'
-            ],
-            'Australia': [
-                'Sydney', 'Melbourne', 'Brisbane', 'Perth', 'Adelaide', 'Gold Coast',
-                'Newcastle', 'Canberra', 'Sunshine Coast', 'Wollongong', 'Geelong',
-                'Hobart', 'Townsville', 'Cairns', 'Darwin', 'Toowoomba', 'Ballarat'
-            ]
-        }
-        
-        if country in city_databases:
-            text_lower = page_text.lower()
-            for city in city_databases[country]:
-                if city.lower() in text_lower:
+        if country in CITY_TERMS:
+            text_lower = page_text.lower() if text_lower is None else text_lower
+            for city, city_lower in CITY_TERMS[country]:
+                if city_lower in text_lower:
                     cities.append(city)
+                    seen_cities.add(city)
         
         # Generic city pattern detection
-        city_patterns = [
-            r'\bin\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b',
-            r'\blocated\s+in\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b',
-            r'\bserving\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b',
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*[A-Z]{2}\b'
-        ]
-        
-        for pattern in city_patterns:
-            matches = re.findall(pattern, page_text)
+        for pattern in CITY_REGEXES:
+            matches = pattern.findall(page_text)
             for match in matches:
                 if isinstance(match, tuple):
                     match = match[0]
-                if len(match) > 2 and match not in cities:
+                if len(match) > 2 and match not in seen_cities:
+                    seen_cities.add(match)
                     cities.append(match)
         
         return ', '.join(cities[:3])  # Return top 3 cities
 
     def extract_local_areas(self, page_text):
         """Extract local area indicators"""
-        local_patterns = [
-            r'\bdowntown\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b',
-            r'\bnear\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b',
-            r'\bclose\s+to\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b',
-            r'\bminutes\s+from\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b',
-            r'\bin\s+the\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+area\b',
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+neighborhood\b'
-        ]
-        
         local_areas = []
-        for pattern in local_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
+        seen_areas = set()
+        for pattern in LOCAL_AREA_REGEXES:
+            matches = pattern.findall(page_text)
             for match in matches:
                 if isinstance(match, tuple):
                     match = match[0]
-                if len(match) > 2 and match not in local_areas:
+                if len(match) > 2 and match not in seen_areas:
+                    seen_areas.add(match)
                     local_areas.append(match)
         
         return ', '.join(local_areas[:3])
 
     def extract_service_areas(self, page_text):
         """Extract areas served by the business"""
-        service_patterns = [
-            r'\bserving\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?(?:,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)*)\b',
-            r'\bwe\s+serve\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?(?:,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)*)\b',
-            r'\bavailable\s+in\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?(?:,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)*)\b',
-            r'\bdelivering\s+to\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?(?:,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)*)\b'
-        ]
-        
         service_areas = []
-        for pattern in service_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
+        for pattern in SERVICE_AREA_REGEXES:
+            matches = pattern.findall(page_text)
             for match in matches:
                 areas = [area.strip() for area in match.split(',')]
                 service_areas.extend(areas)
@@ -3560,25 +5047,12 @@ class DomainChecker:
 
     def extract_social_media_links(self, soup):
         """Extract social media links from webpage"""
-        social_platforms = {
-            'facebook': ['facebook.com', 'fb.com'],
-            'twitter': ['twitter.com', 'x.com'],
-            'instagram': ['instagram.com'],
-            'linkedin': ['linkedin.com'],
-            'youtube': ['youtube.com', 'youtu.be'],
-            'tiktok': ['tiktok.com'],
-            'pinterest': ['pinterest.com'],
-            'snapchat': ['snapchat.com'],
-            'whatsapp': ['whatsapp.com', 'wa.me'],
-            'telegram': ['telegram.me', 't.me']
-        }
-        
         social_links = {}
         links = soup.find_all('a', href=True)
         
         for link in links:
             href = link.get('href', '').lower()
-            for platform, domains in social_platforms.items():
+            for platform, domains in SOCIAL_MEDIA_DOMAINS.items():
                 if any(domain in href for domain in domains):
                     # Clean up the URL
                     if href.startswith('//'):
@@ -3591,20 +5065,14 @@ class DomainChecker:
         
         return social_links
 
-    def extract_business_hours(self, page_text):
+    def extract_business_hours(self, page_text, text_lower=None):
         """Extract business hours from webpage text"""
         # Common business hours patterns
-        hours_patterns = [
-            r'(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*[:\s-]*\s*\d{1,2}[:\s]*\d{0,2}\s*(?:am|pm|a\.m\.|p\.m\.)?[\s-]*\d{1,2}[:\s]*\d{0,2}\s*(?:am|pm|a\.m\.|p\.m\.)?',
-            r'hours?\s*:?\s*\d{1,2}[:\s]*\d{0,2}\s*(?:am|pm|a\.m\.|p\.m\.)?[\s-]*\d{1,2}[:\s]*\d{0,2}\s*(?:am|pm|a\.m\.|p\.m\.)?',
-            r'open\s*:?\s*\d{1,2}[:\s]*\d{0,2}\s*(?:am|pm|a\.m\.|p\.m\.)?[\s-]*\d{1,2}[:\s]*\d{0,2}\s*(?:am|pm|a\.m\.|p\.m\.)?'
-        ]
-        
         hours_text = []
-        text_lower = page_text.lower()
-        
-        for pattern in hours_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE | re.MULTILINE)
+        text_lower = page_text.lower() if text_lower is None else text_lower
+
+        for pattern in BUSINESS_HOURS_REGEXES:
+            matches = pattern.findall(text_lower)
             hours_text.extend(matches)
         
         # Look for "24/7" or "24 hours"
@@ -3613,38 +5081,38 @@ class DomainChecker:
         
         return '; '.join(set(hours_text[:3]))  # Return up to 3 unique hour entries
 
-    def analyze_detailed_website_metrics(self, soup):
+    def analyze_detailed_website_metrics(self, soup, page_text=None):
         """Analyze detailed website metrics to determine company size"""
         metrics = {}
         
-        # Count various elements
-        metrics['total_links'] = len(soup.find_all('a'))
-        metrics['internal_links'] = len([link for link in soup.find_all('a', href=True) 
-                                       if link.get('href', '').startswith('/') or not link.get('href', '').startswith('http')])
+        # Count various elements - one walk of the tree
+        elements = scan_element_counts(soup)
+        tags = elements['tags']
+        metrics['total_links'] = tags['a']
+        metrics['internal_links'] = elements['internal_links']
         metrics['external_links'] = metrics['total_links'] - metrics['internal_links']
         
-        metrics['images'] = len(soup.find_all('img'))
-        metrics['forms'] = len(soup.find_all('form'))
-        metrics['scripts'] = len(soup.find_all('script'))
-        metrics['stylesheets'] = len(soup.find_all('link', rel='stylesheet'))
+        metrics['images'] = tags['img']
+        metrics['forms'] = tags['form']
+        metrics['scripts'] = tags['script']
+        metrics['stylesheets'] = elements['stylesheets']
         
         # Navigation complexity
-        nav_elements = soup.find_all(['nav', 'ul', 'ol'])
-        metrics['navigation_items'] = sum(len(nav.find_all('li')) for nav in nav_elements)
+        metrics['navigation_items'] = elements['navigation_items']
         
         # Page structure complexity
-        metrics['divs'] = len(soup.find_all('div'))
-        metrics['sections'] = len(soup.find_all('section'))
-        metrics['articles'] = len(soup.find_all('article'))
+        metrics['divs'] = tags['div']
+        metrics['sections'] = tags['section']
+        metrics['articles'] = tags['article']
         
         # Content metrics
-        text_content = soup.get_text()
+        text_content = soup.get_text() if page_text is None else page_text
         metrics['word_count'] = len(text_content.split())
         metrics['character_count'] = len(text_content)
         
         # Advanced features
-        metrics['videos'] = len(soup.find_all(['video', 'iframe']))
-        metrics['interactive_elements'] = len(soup.find_all(['button', 'input', 'select', 'textarea']))
+        metrics['videos'] = tags['video'] + tags['iframe']
+        metrics['interactive_elements'] = tags['button'] + tags['input'] + tags['select'] + tags['textarea']
         
         # Calculate complexity score
         complexity_score = 0
@@ -3685,7 +5153,7 @@ class DomainChecker:
         
         # Main results file
         main_file = os.path.join(output_dir, f'realtime_results_{timestamp}.csv')
-        self.csv_files['main'] = open(main_file, 'w', newline='', encoding='utf-8')
+        self.csv_files['main'] = open(main_file, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE)
         
         # ENHANCED: Added new fields for hacked and language detection
         fieldnames = ['domain', 'working', 'final_url', 'protocol', 'status_code', 
@@ -3713,7 +5181,7 @@ class DomainChecker:
         
         # High-priority targets file
         high_priority_file = os.path.join(output_dir, f'high_priority_targets_{timestamp}.csv')
-        self.csv_files['high_priority'] = open(high_priority_file, 'w', newline='', encoding='utf-8')
+        self.csv_files['high_priority'] = open(high_priority_file, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE)
         self.csv_writers['high_priority'] = csv.DictWriter(self.csv_files['high_priority'], fieldnames=fieldnames)
         self.csv_writers['high_priority'].writeheader()
         self.csv_files['high_priority'].flush()
@@ -3722,63 +5190,65 @@ class DomainChecker:
         print(f"🎯 High-priority targets file created: {high_priority_file}")
 
     def write_result_realtime(self, result):
-        """Write result to CSV immediately - FIXED INDENTATION"""
+        """Queue result for CSV output, flushing once a batch worth of rows is buffered"""
         try:
             current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             
-            # Update stats
-            self.stats['total_processed'] += 1
+            # Update batch stats (merged once per batch)
+            counters = self.batch_counters
+            stats = self.batch_stats
+            counters[StatSlot.TOTAL_PROCESSED] += 1
             if result.get('working', False):
-                self.stats['working'] += 1
+                counters[StatSlot.WORKING] += 1
             if result.get('is_business', False):
-                self.stats['business'] += 1
+                counters[StatSlot.BUSINESS] += 1
             if result.get('is_parked', False):
-                self.stats['parked'] += 1
+                counters[StatSlot.PARKED] += 1
             if result.get('error') and not result.get('failed_due_to_connectivity', False):
-                self.stats['failed'] += 1
+                counters[StatSlot.FAILED] += 1
             
             industry = result.get('industry_type')
             if industry:
-                self.stats['industries'][industry] = self.stats['industries'].get(industry, 0) + 1
+                stats['industries', industry] += 1
             
             company_size = result.get('company_size')
             if company_size:
-                self.stats['company_sizes'][company_size] = self.stats['company_sizes'].get(company_size, 0) + 1
+                stats['company_sizes', company_size] += 1
             
             # Track new VR-specific stats
             if result.get('industry_type') == 'vacation_rental':
                 # Track business models
                 vr_model = result.get('vr_business_model')
                 if vr_model:
-                    self.stats['vr_business_models'][vr_model] = self.stats['vr_business_models'].get(vr_model, 0) + 1
+                    stats['vr_business_models', vr_model] += 1
                 
                 # Track priorities
                 priority = result.get('vr_priority')
                 if priority == 'high':
-                    self.stats['high_priority_targets'] += 1
+                    counters[StatSlot.HIGH_PRIORITY_TARGETS] += 1
                 elif priority == 'medium':
-                    self.stats['medium_priority_targets'] += 1
+                    counters[StatSlot.MEDIUM_PRIORITY_TARGETS] += 1
                 
                 # Track decision maker accessibility
                 if result.get('vr_decision_maker_accessible') == 'high':
-                    self.stats['decision_maker_accessible'] += 1
+                    counters[StatSlot.DECISION_MAKER_ACCESSIBLE] += 1
                 
                 # Track website upgrade needs
                 if result.get('vr_needs_website_upgrade'):
-                    self.stats['website_needs_upgrade'] += 1
+                    counters[StatSlot.WEBSITE_NEEDS_UPGRADE] += 1
                 
                 # Track property types
                 prop_type = result.get('vr_property_type')
                 if prop_type:
-                    self.stats['vr_property_types'][prop_type] = self.stats['vr_property_types'].get(prop_type, 0) + 1
+                    stats['vr_property_types', prop_type] += 1
                 
                 # Original target customer tracking
                 if result.get('is_target_customer') == True:
-                    self.stats['target_customers'] += 1
+                    counters[StatSlot.TARGET_CUSTOMERS] += 1
                 elif result.get('is_target_customer') == False:
                     exclusion_reason = result.get('vr_exclusion_reason', 'unknown')
                     if exclusion_reason:
-                        self.stats['excluded_businesses'][exclusion_reason] = self.stats['excluded_businesses'].get(exclusion_reason, 0) + 1
+                        stats['excluded_businesses', exclusion_reason] += 1
             
             # Write to CSV - ensure no None values and include new fields
             business_info = result.get('business_info', {})
@@ -3843,13 +5313,14 @@ class DomainChecker:
                 'processed_at': current_time
             }
             
-            self.csv_writers['main'].writerow(row)
-            self.csv_files['main'].flush()
+            self.csv_buffers['main'].append(row)
             
-            # Write high-priority targets to separate file
+            # Queue high-priority targets for separate file
             if result.get('vr_priority') == 'high' and result.get('industry_type') == 'vacation_rental':
-                self.csv_writers['high_priority'].writerow(row)
-                self.csv_files['high_priority'].flush()
+                self.csv_buffers['high_priority'].append(row)
+            
+            if len(self.csv_buffers['main']) >= self.batch_size:
+                self.flush_csv()
             
             # Add to processed domains
             self.processed_domains.add(result.get('domain', ''))
@@ -3857,9 +5328,33 @@ class DomainChecker:
         except Exception as e:
             logger.error(f"Error writing result: {e}")
 
+    def flush_csv(self):
+        """Write buffered rows to the CSV files in one pass per file"""
+        try:
+            with self.csv_lock:
+                for category, rows in self.csv_buffers.items():
+                    if not rows or category not in self.csv_writers:
+                        continue
+                    self.csv_writers[category].writerows(rows)
+                    self.csv_files[category].flush()
+                    rows.clear()
+        except Exception as e:
+            logger.error(f"Error flushing CSV rows: {e}")
+
+
+    def merge_batch_stats(self):
+        """Fold the per-batch tallies into self.stats"""
+        with self.stats_lock:
+            for slot in StatSlot:
+                self.stats[slot.name.lower()] += self.batch_counters[slot]
+                self.batch_counters[slot] = 0
+            for (name, value), count in self.batch_stats.items():
+                self.stats[name][value] += count
+            self.batch_stats.clear()
 
     def display_live_stats(self):
         """Display live statistics - ENHANCED VERSION"""
+        self.merge_batch_stats()
         if self.stats['start_time']:
             elapsed = time.time() - self.stats['start_time']
             rate = self.stats['total_processed'] / elapsed if elapsed > 0 else 0
@@ -3933,12 +5428,15 @@ class DomainChecker:
                     for prop_type, count in sorted(self.stats['vr_property_types'].items(), key=lambda x: x[1], reverse=True):
                         print(f"      {prop_type}: {count}")
             
-            print(f"\n📝 CSV files are being updated in real-time!")
+            print(f"\n📝 CSV files are updated after every batch!")
             print(f"🎯 High-priority targets saved to separate file!")
             print(f"💾 Progress is automatically saved and can be resumed")
 
     def process_batch(self, batch_domains):
         """Process a batch of domains"""
+        if self.use_async:
+            return asyncio.run(self.process_batch_async(batch_domains))
+        
         batch_results = []
         
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
@@ -3947,96 +5445,149 @@ class DomainChecker:
             for future in as_completed(future_to_domain):
                 domain = future_to_domain[future]
                 try:
-                    result = future.result()
-                    self.write_result_realtime(result)
-                    batch_results.append(result)
-                    
-                    # Display progress
-                    if self.stats['total_processed'] % 5 == 0:
-                        self.display_live_stats()
-                    
-                    # Enhanced logging with new VR data
-                    status = "✓" if result['working'] else "✗"
-                    business = "Business" if result.get('is_business', False) else "Parked" if result.get('is_parked', False) else "Other"
-                    industry = result.get('industry_type', 'N/A')
-                    company_size = result.get('company_size', 'Unknown')
-                    
-                    # Format company size for display with preference indicators
-                    size_emoji = {
-                        'large_enterprise': '🏢',
-                        'medium_business': '🏬', 
-                        'small_business': '🏪⭐',  # Star indicates preferred target
-                        'unknown': '❓'
-                    }.get(company_size, '❓')
-                    
-                    # ENHANCED: Better VR logging
-                    if result.get('industry_type') == 'vacation_rental':
-                        priority = result.get('vr_priority', '')
-                        priority_emoji = {'high': '🎯', 'medium': '⭐', 'low': '⚠️'}.get(priority, '')
-                        
-                        model = result.get('vr_business_model', '')
-                        props = result.get('vr_property_count', '')
-                        decision_maker = result.get('vr_decision_maker_accessible', '')
-                        needs_upgrade = '🔧' if result.get('vr_needs_website_upgrade') else ''
-                        
-                        logger.info(f"{status} {domain} - VR {priority_emoji} {model} | Props: {props} | DM: {decision_maker} {needs_upgrade}")
-                        
-                        # Special logging for high-priority targets
-                        if priority == 'high':
-                            business_info = result.get('business_info', {})
-                            logger.info(f"   🎯 HIGH PRIORITY: {business_info.get('company_name', '')[:30]}")
-                            logger.info(f"   📞 Contact: {business_info.get('primary_email', '')} | {business_info.get('primary_phone', '')}")
-                            logger.info(f"   📍 Location: {business_info.get('city', '')} {business_info.get('country', '')}")
-                            logger.info(f"   🎯 Score: {result.get('vr_target_score', 0)} | Factors: {', '.join(result.get('vr_target_factors', [])[:3])}")
-                    else:
-                        # Original logging for non-VR
-                        target_indicator = ""
-                        contact_info = ""
-                        business_info = result.get('business_info', {})
-                        if business_info.get('primary_email') or business_info.get('primary_phone'):
-                            contact_info = " 📞"
-                        
-                        location_info = ""
-                        country = business_info.get('country', '')
-                        city = business_info.get('city', '')
-                        if country:
-                            country_flags = {
-                                'United States': '🇺🇸',
-                                'Canada': '🇨🇦',
-                                'United Kingdom': '🇬🇧',
-                                'Australia': '🇦🇺',
-                                'Germany': '🇩🇪',
-                                'France': '🇫🇷',
-                                'Spain': '🇪🇸',
-                                'Italy': '🇮🇹',
-                                'Netherlands': '🇳🇱',
-                                'Mexico': '🇲🇽'
-                            }
-                            flag = country_flags.get(country, '🌍')
-                            if city:
-                                location_info = f" {flag}({city[:15]})"
-                            else:
-                                location_info = f" {flag}"
-                        
-                        website_metrics = business_info.get('website_metrics', {})
-                        complexity_score = website_metrics.get('complexity_score', 0)
-                        if complexity_score > 25:
-                            website_indicator = " 🌐+"
-                        elif complexity_score < 10:
-                            website_indicator = " 🌐-"
-                        else:
-                            website_indicator = " 🌐"
-                        
-                        if result.get('failed_due_to_connectivity', False):
-                            logger.warning(f"🔗 {domain} - Connectivity issue")
-                        else:
-                            logger.info(f"{status} {domain} - {business} ({industry}) {size_emoji}{target_indicator}{contact_info}{location_info}{website_indicator}")
-                    
+                    self.handle_batch_result(domain, future.result(), batch_results)
+                except Exception as e:
+                    logger.error(f"Error checking {domain}: {e}")
+        
+        return batch_results
+
+    async def process_batch_async(self, batch_domains):
+        """Process a batch of domains with aiohttp - one event loop holds all in-flight requests"""
+        batch_results = []
+        loop = asyncio.get_running_loop()
+        # Parsing/analysis is CPU bound (and deep crawl still uses requests), keep it off the event loop
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=self.max_workers))
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        resolver = StaggeredResolver(self.dns_cache) if aiodns is not None else None
+        timeout = aiohttp.ClientTimeout(connect=self.timeout, sock_read=self.timeout)
+        
+        def new_session():
+            connector = aiohttp.TCPConnector(limit=1000, limit_per_host=4, ttl_dns_cache=300,
+                                             use_dns_cache=True, ssl=self.ssl_context or False,
+                                             resolver=resolver, keepalive_timeout=60,
+                                             enable_cleanup_closed=True)
+            return aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=dict(self.session.headers))
+        
+        # Hedged requests go through their own connection pool
+        async with new_session() as session, new_session() as hedge_session:
+            self.hedge_session = hedge_session
+            
+            async def check(domain):
+                try:
+                    return domain, await self.check_domain_async(session, semaphore, domain), None
+                except Exception as e:
+                    return domain, None, e
+            
+            for future in asyncio.as_completed([check(domain) for domain in batch_domains]):
+                domain, result, error = await future
+                try:
+                    if error:
+                        raise error
+                    self.handle_batch_result(domain, result, batch_results)
                 except Exception as e:
                     logger.error(f"Error checking {domain}: {e}")
         
+        self.hedge_session = None
+        if resolver is not None:
+            await resolver.close()
+        
         return batch_results
 
+    def handle_batch_result(self, domain, result, batch_results):
+        """Write a finished result and log it"""
+        self.write_result_realtime(result)
+        batch_results.append(result)
+        
+        # Hosts merged into this domain by preprocess_domains get a copy of its result
+        for alias in self.domain_aliases.get(domain, []):
+            alias_result = copy.deepcopy(result)
+            alias_result['domain'] = alias
+            self.write_result_realtime(alias_result)
+            batch_results.append(alias_result)
+        
+        # Display progress
+        if (self.stats['total_processed'] + self.batch_counters[StatSlot.TOTAL_PROCESSED]) % 5 == 0:
+            self.display_live_stats()
+        
+        # Enhanced logging with new VR data
+        status = "✓" if result['working'] else "✗"
+        business = "Business" if result.get('is_business', False) else "Parked" if result.get('is_parked', False) else "Other"
+        industry = result.get('industry_type', 'N/A')
+        company_size = result.get('company_size', 'Unknown')
+        
+        # Format company size for display with preference indicators
+        size_emoji = {
+            'large_enterprise': '🏢',
+            'medium_business': '🏬', 
+            'small_business': '🏪⭐',  # Star indicates preferred target
+            'unknown': '❓'
+        }.get(company_size, '❓')
+        
+        # ENHANCED: Better VR logging
+        if result.get('industry_type') == 'vacation_rental':
+            priority = result.get('vr_priority', '')
+            priority_emoji = {'high': '🎯', 'medium': '⭐', 'low': '⚠️'}.get(priority, '')
+            
+            model = result.get('vr_business_model', '')
+            props = result.get('vr_property_count', '')
+            decision_maker = result.get('vr_decision_maker_accessible', '')
+            needs_upgrade = '🔧' if result.get('vr_needs_website_upgrade') else ''
+            
+            logger.info(f"{status} {domain} - VR {priority_emoji} {model} | Props: {props} | DM: {decision_maker} {needs_upgrade}")
+            
+            # Special logging for high-priority targets
+            if priority == 'high':
+                business_info = result.get('business_info', {})
+                logger.info(f"   🎯 HIGH PRIORITY: {business_info.get('company_name', '')[:30]}")
+                logger.info(f"   📞 Contact: {business_info.get('primary_email', '')} | {business_info.get('primary_phone', '')}")
+                logger.info(f"   📍 Location: {business_info.get('city', '')} {business_info.get('country', '')}")
+                logger.info(f"   🎯 Score: {result.get('vr_target_score', 0)} | Factors: {', '.join(result.get('vr_target_factors', [])[:3])}")
+        else:
+            # Original logging for non-VR
+            target_indicator = ""
+            contact_info = ""
+            business_info = result.get('business_info', {})
+            if business_info.get('primary_email') or business_info.get('primary_phone'):
+                contact_info = " 📞"
+            
+            location_info = ""
+            country = business_info.get('country', '')
+            city = business_info.get('city', '')
+            if country:
+                country_flags = {
+                    'United States': '🇺🇸',
+                    'Canada': '🇨🇦',
+                    'United Kingdom': '🇬🇧',
+                    'Australia': '🇦🇺',
+                    'Germany': '🇩🇪',
+                    'France': '🇫🇷',
+                    'Spain': '🇪🇸',
+                    'Italy': '🇮🇹',
+                    'Netherlands': '🇳🇱',
+                    'Mexico': '🇲🇽'
+                }
+                flag = country_flags.get(country, '🌍')
+                if city:
+                    location_info = f" {flag}({city[:15]})"
+                else:
+                    location_info = f" {flag}"
+            
+            website_metrics = business_info.get('website_metrics', {})
+            complexity_score = website_metrics.get('complexity_score', 0)
+            if complexity_score > 25:
+                website_indicator = " 🌐+"
+            elif complexity_score < 10:
+                website_indicator = " 🌐-"
+            else:
+                website_indicator = " 🌐"
+            
+            if result.get('failed_due_to_connectivity', False):
+                logger.warning(f"🔗 {domain} - Connectivity issue")
+            else:
+                logger.info(f"{status} {domain} - {business} ({industry}) {size_emoji}{target_indicator}{contact_info}{location_info}{website_indicator}")
+
     def check_domains_from_list(self, domains, output_dir='.', resume=True):
         """Check domains with batching and resume functionality"""
         
@@ -4052,13 +5603,15 @@ class DomainChecker:
         # Setup progress tracking
         self.setup_progress_tracking(output_dir)
         
+        self.processed_domains = ProcessedDomainFilter(self.progress_file, reset=not resume)
+        
         # Load existing progress if resuming
         if resume:
             self.load_progress()
         
         # Filter out already processed domains
         if self.processed_domains:
-            remaining_domains = [d for d in domains if d not in self.processed_domains]
+            remaining_domains = self.processed_domains.unprocessed(domains)
             print(f"📋 Resuming: {len(self.processed_domains)} already processed, {len(remaining_domains)} remaining")
         else:
             remaining_domains = domains
@@ -4079,7 +5632,10 @@ class DomainChecker:
         if not self.stats['start_time']:
             self.stats['start_time'] = time.time()
         
-        print(f"🚀 Processing {total_domains} domains in {self.total_batches} batches of {self.batch_size}")
+        # Merged hosts get their own CSV rows, so count them alongside the domains that are fetched
+        merged_count = sum(len(self.domain_aliases.get(domain, ())) for domain in remaining_domains)
+        merged_info = f" (+{merged_count} merged hosts)" if merged_count else ""
+        print(f"🚀 Processing {total_domains} domains{merged_info} in {self.total_batches} batches of {self.batch_size}")
         print(f"🎯 Enhanced vacation rental classification enabled!")
         
         all_results = []
@@ -4093,7 +5649,9 @@ class DomainChecker:
             end_idx = min(start_idx + self.batch_size, total_domains)
             batch_domains = remaining_domains[start_idx:end_idx]
             
-            print(f"\n📦 Processing batch {self.current_batch}/{self.total_batches} ({len(batch_domains)} domains)")
+            batch_merged = sum(len(self.domain_aliases.get(domain, ())) for domain in batch_domains)
+            batch_merged_info = f" +{batch_merged} merged hosts" if batch_merged else ""
+            print(f"\n📦 Processing batch {self.current_batch}/{self.total_batches} ({len(batch_domains)} domains{batch_merged_info})")
             print(f"🔄 Domains: {', '.join(batch_domains[:3])}{'...' if len(batch_domains) > 3 else ''}")
             
             # Check connectivity before each batch
@@ -4107,14 +5665,18 @@ class DomainChecker:
             batch_results = self.process_batch(batch_domains)
             all_results.extend(batch_results)
             
+            # Flush buffered CSV rows and batch stats before recording progress
+            self.flush_csv()
+            self.merge_batch_stats()
+            
             # Save progress after each batch
             self.save_progress()
             
-            # Display batch completion
+            # Display batch completion - counted over result rows, merged-host copies included
             batch_working = sum(1 for r in batch_results if r.get('working', False))
             batch_business = sum(1 for r in batch_results if r.get('is_business', False))
             batch_high_priority = sum(1 for r in batch_results if r.get('vr_priority') == 'high')
-            print(f"✅ Batch {self.current_batch} complete: {batch_working}/{len(batch_domains)} working, {batch_business} business")
+            print(f"✅ Batch {self.current_batch} complete: {batch_working}/{len(batch_results)} working, {batch_business} business")
             if batch_high_priority > 0:
                 print(f"🎯 Found {batch_high_priority} high-priority VR targets in this batch!")
             
@@ -4126,8 +5688,13 @@ class DomainChecker:
         self.display_live_stats()
         
         # Close CSV files
+        self.flush_csv()
         for file in self.csv_files.values():
             file.close()
+        self.processed_domains.flush()
+        if self.classify_pool is not None:
+            self.classify_pool.shutdown()
+            self.classify_pool = None
         
         print(f"\n✅ Processing complete! Results saved to {output_dir}")
         print(f"📊 Processed {len(all_results)} domains across {self.current_batch} batches")
@@ -4144,6 +5711,19 @@ class DomainChecker:
         
         return all_results
 
+# Per-process checker used by classify_in_worker(), built once by init_classify_worker()
+CLASSIFY_CHECKER = None
+
+def init_classify_worker(timeout, enable_deep_crawl):
+    """Process pool initializer - builds the keyword tables and matchers once per worker"""
+    global CLASSIFY_CHECKER
+    CLASSIFY_CHECKER = DomainChecker(timeout=timeout, enable_deep_crawl=enable_deep_crawl, use_async=False)
+
+def classify_in_worker(response, result, protocol):
+    """Run process_response in a pool worker and ship the updated result back"""
+    usable = CLASSIFY_CHECKER.process_response(response, result, protocol)
+    return usable, result
+
 def load_domains_from_file(filename):
     """Load domains from text file"""
     try: